@@ -0,0 +1,44 @@
+"""course search
+
+Revision ID: 5f1c2a9d7e43
+Revises: e29544b891d8
+Create Date: 2026-10-18 10:12:41.503118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5f1c2a9d7e43'
+down_revision: Union[str, None] = 'e29544b891d8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.add_column('courses', sa.Column(
+        'search_document',
+        postgresql.TSVECTOR(),
+        sa.Computed(
+            "to_tsvector('russian', "
+            "coalesce(name, '') || ' ' || coalesce(description, '') || ' ' || coalesce(topics, ''))",
+            persisted=True,
+        ),
+        nullable=True,
+    ))
+    op.create_index('ix_courses_search_document', 'courses', ['search_document'], unique=False, postgresql_using='gin')
+    op.create_index(
+        'ix_courses_name_trgm', 'courses', ['name'], unique=False,
+        postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_courses_name_trgm', table_name='courses', postgresql_using='gin')
+    op.drop_index('ix_courses_search_document', table_name='courses', postgresql_using='gin')
+    op.drop_column('courses', 'search_document')
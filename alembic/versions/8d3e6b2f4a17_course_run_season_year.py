@@ -0,0 +1,40 @@
+"""course run season and year
+
+Revision ID: 8d3e6b2f4a17
+Revises: 5f1c2a9d7e43
+Create Date: 2026-10-18 14:05:27.318412
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d3e6b2f4a17'
+down_revision: Union[str, None] = '5f1c2a9d7e43'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('course_runs_', sa.Column('season', sa.String(), nullable=True))
+    op.add_column('course_runs_', sa.Column('year', sa.Integer(), nullable=True))
+    # names of archived runs have suffix with id after season and year
+    op.execute(
+        "UPDATE course_runs_ "
+        "SET season = split_part(name, ' ', 1), year = CAST(split_part(name, ' ', 2) AS INTEGER)"
+    )
+    op.alter_column('course_runs_', 'season', nullable=False)
+    op.alter_column('course_runs_', 'year', nullable=False)
+    op.create_index(
+        'ix_course_runs__year_season', 'course_runs_', ['year', 'season'], unique=False,
+        postgresql_where=sa.text('NOT is_archive'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_course_runs__year_season', table_name='course_runs_', postgresql_where=sa.text('NOT is_archive'))
+    op.drop_column('course_runs_', 'year')
+    op.drop_column('course_runs_', 'season')
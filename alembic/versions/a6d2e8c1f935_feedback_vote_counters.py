@@ -0,0 +1,51 @@
+"""feedback vote counters
+
+Revision ID: a6d2e8c1f935
+Revises: c4f7a1e9d253
+Create Date: 2026-10-18 17:02:44.183520
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6d2e8c1f935'
+down_revision: Union[str, None] = 'c4f7a1e9d253'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('feedbacks', sa.Column('like_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('feedbacks', sa.Column('dislike_count', sa.Integer(), server_default='0', nullable=False))
+    op.execute(
+        """
+        UPDATE feedbacks
+        SET like_count = counts.like_count, dislike_count = counts.dislike_count
+        FROM (
+            SELECT
+                feedback_id,
+                count(*) FILTER (WHERE vote_type = 'like') AS like_count,
+                count(*) FILTER (WHERE vote_type = 'dislike') AS dislike_count
+            FROM feedback_votes
+            GROUP BY feedback_id
+        ) AS counts
+        WHERE feedbacks.id = counts.feedback_id
+        """
+    )
+    op.create_index(
+        'ix_feedbacks__course_id_reputation', 'feedbacks',
+        ['course_id', sa.text('(like_count - dislike_count) DESC'), sa.text('date DESC'), sa.text('id DESC')],
+        unique=False, postgresql_where=sa.text('NOT is_archive'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        'ix_feedbacks__course_id_reputation', table_name='feedbacks', postgresql_where=sa.text('NOT is_archive'),
+    )
+    op.drop_column('feedbacks', 'dislike_count')
+    op.drop_column('feedbacks', 'like_count')
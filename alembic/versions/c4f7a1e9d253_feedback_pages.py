@@ -0,0 +1,36 @@
+"""feedback pages
+
+Revision ID: c4f7a1e9d253
+Revises: 8d3e6b2f4a17
+Create Date: 2026-10-18 15:21:09.604735
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4f7a1e9d253'
+down_revision: Union[str, None] = '8d3e6b2f4a17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_feedbacks__course_id_date', 'feedbacks',
+        ['course_id', sa.text('date DESC'), sa.text('id DESC')], unique=False,
+        postgresql_where=sa.text('NOT is_archive'),
+    )
+    op.create_index(
+        'ix_feedbacks__course_id_rating', 'feedbacks',
+        ['course_id', sa.text('rating DESC'), sa.text('date DESC'), sa.text('id DESC')], unique=False,
+        postgresql_where=sa.text('NOT is_archive'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_feedbacks__course_id_rating', table_name='feedbacks', postgresql_where=sa.text('NOT is_archive'))
+    op.drop_index('ix_feedbacks__course_id_date', table_name='feedbacks', postgresql_where=sa.text('NOT is_archive'))
@@ -0,0 +1,62 @@
+"""course ratings
+
+Revision ID: e3b9f4a7c612
+Revises: a6d2e8c1f935
+Create Date: 2026-10-18 19:14:37.502981
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3b9f4a7c612'
+down_revision: Union[str, None] = 'a6d2e8c1f935'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('course_ratings',
+    sa.Column('course_id', sa.Uuid(), nullable=False),
+    sa.Column('feedback_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('rating_sum', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('rating_1_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('rating_2_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('rating_3_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('rating_4_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('rating_5_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('weighted_rating_sum', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('weight_sum', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('updated_at', sa.DateTime(), server_default=sa.text("TIMEZONE('utc', now())"), nullable=False),
+    sa.PrimaryKeyConstraint('course_id', name=op.f('pk_course_ratings'))
+    )
+    op.execute(
+        """
+        INSERT INTO course_ratings (
+            course_id, feedback_count, rating_sum,
+            rating_1_count, rating_2_count, rating_3_count, rating_4_count, rating_5_count,
+            weighted_rating_sum, weight_sum
+        )
+        SELECT
+            course_id,
+            count(*),
+            sum(rating),
+            count(*) FILTER (WHERE rating = 1),
+            count(*) FILTER (WHERE rating = 2),
+            count(*) FILTER (WHERE rating = 3),
+            count(*) FILTER (WHERE rating = 4),
+            count(*) FILTER (WHERE rating = 5),
+            sum(rating * (1 + greatest(like_count - dislike_count, 0))),
+            sum(1 + greatest(like_count - dislike_count, 0))
+        FROM feedbacks
+        WHERE NOT is_archive
+        GROUP BY course_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('course_ratings')
@@ -0,0 +1,70 @@
+"""unique feedback of author
+
+Revision ID: f8c2d5b1a394
+Revises: e3b9f4a7c612
+Create Date: 2026-10-18 20:03:12.846215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f8c2d5b1a394'
+down_revision: Union[str, None] = 'e3b9f4a7c612'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # duplicates created by concurrent requests are archived, the first feedback of author is kept
+    op.execute(
+        """
+        UPDATE feedbacks SET is_archive = true
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, row_number() OVER (PARTITION BY author_id, course_id ORDER BY created_at, id) AS number
+                FROM feedbacks
+                WHERE NOT is_archive
+            ) AS numbered_feedbacks
+            WHERE number > 1
+        )
+        """
+    )
+    # summaries of ratings are rebuilt without archived duplicates
+    op.execute("DELETE FROM course_ratings")
+    op.execute(
+        """
+        INSERT INTO course_ratings (
+            course_id, feedback_count, rating_sum,
+            rating_1_count, rating_2_count, rating_3_count, rating_4_count, rating_5_count,
+            weighted_rating_sum, weight_sum
+        )
+        SELECT
+            course_id,
+            count(*),
+            sum(rating),
+            count(*) FILTER (WHERE rating = 1),
+            count(*) FILTER (WHERE rating = 2),
+            count(*) FILTER (WHERE rating = 3),
+            count(*) FILTER (WHERE rating = 4),
+            count(*) FILTER (WHERE rating = 5),
+            sum(rating * (1 + greatest(like_count - dislike_count, 0))),
+            sum(1 + greatest(like_count - dislike_count, 0))
+        FROM feedbacks
+        WHERE NOT is_archive
+        GROUP BY course_id
+        """
+    )
+    op.create_index(
+        'ix_feedbacks__author_id_course_id', 'feedbacks', ['author_id', 'course_id'], unique=True,
+        postgresql_where=sa.text('NOT is_archive'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        'ix_feedbacks__author_id_course_id', table_name='feedbacks', postgresql_where=sa.text('NOT is_archive'),
+    )
@@ -0,0 +1,66 @@
+"""Compare codecs of Redis cache payloads on the catalog of courses.
+
+Run from the root of repository: python -m benchmarks.cache_serializer
+"""
+from __future__ import annotations
+
+import functools
+import timeit
+import uuid
+
+from src.infrastructure.redis.serializer import CacheSerializer, JSONCodec, ORJSONCodec
+
+COURSES = 300
+REPEATS = 200
+
+
+def make_course() -> dict:
+    """Make dict of course as it is stored in cache."""
+    return {
+        "id": str(uuid.uuid4()),
+        "name": "Алгоритмы и структуры данных",
+        "image_url": "https://example.com/image.png",
+        "limits": 30,
+        "is_draft": False,
+        "prerequisites": "Python, основы математики " * 5,
+        "description": "Курс о классических алгоритмах и структурах данных " * 20,
+        "topics": "Сортировки, деревья, графы, динамическое программирование " * 5,
+        "assessment": "Экзамен",
+        "resources": [{"title": "Книга", "link": "https://example.com/book"}] * 3,
+        "extra": None,
+        "author": "Иванов И.И.",
+        "implementer": "ИТМО",
+        "format": "онлайн",
+        "terms": "1 курс, 2 курс",
+        "roles": ["ML Engineer", "Data Engineer"],
+        "periods": ["Осень"],
+        "last_runs": ["Осень 2024", "Весна 2024"],
+    }
+
+
+def encode_all(serializer: CacheSerializer, courses: list[dict]) -> list[bytes]:
+    """Encode every course."""
+    return [serializer.dumps(course) for course in courses]
+
+
+def decode_all(serializer: CacheSerializer, payloads: list[bytes]) -> list[dict]:
+    """Decode every course."""
+    return [serializer.loads(payload) for payload in payloads]
+
+
+def main() -> None:
+    """Print time of encoding and decoding of catalog, size of payloads for every codec."""
+    courses = [make_course() for _ in range(COURSES)]
+    codecs = {"json": JSONCodec(), "orjson": ORJSONCodec()}
+    print(f"{'codec':<8}{'encode, ms':>12}{'decode, ms':>12}{'size, KiB':>12}")
+    for name, codec in codecs.items():
+        serializer = CacheSerializer(codec)
+        payloads = encode_all(serializer, courses)
+        encode = timeit.timeit(functools.partial(encode_all, serializer, courses), number=REPEATS)
+        decode = timeit.timeit(functools.partial(decode_all, serializer, payloads), number=REPEATS)
+        size = sum(len(payload) for payload in payloads) / 1024
+        print(f"{name:<8}{encode / REPEATS * 1000:>12.3f}{decode / REPEATS * 1000:>12.3f}{size:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Compare loading of all courses by joined eager loading and by select IN loading.
+
+Courses are created inside of transaction which is rolled back at the end.
+Run from the root of repository with database from .env: python -m benchmarks.course_loading
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+import uuid
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import joinedload
+
+from src.infrastructure.sqlalchemy.courses.models import Course, PeriodForCourse, RoleForCourse, RunForCourse
+from src.infrastructure.sqlalchemy.courses.repository import SQLAlchemyCourseRepository
+from src.infrastructure.sqlalchemy.session import async_session_factory
+
+SIZES = (1_000, 10_000)
+ROLES = ["ML Engineer", "Data Engineer", "Data Analyst"]
+PERIODS = ["Осень", "Весна"]
+RUNS = ["Осень 2023", "Весна 2024", "Осень 2024", "Весна 2025"]
+
+
+def make_course(number: int) -> Course:
+    """Make course with all roles, periods and runs."""
+    course_id = uuid.uuid4()
+    return Course(
+        id=course_id,
+        name=f"Benchmark course {number} {course_id}",
+        is_draft=False,
+        description="Описание курса " * 50,
+        roles=[RoleForCourse(course_id=course_id, role_name=role) for role in ROLES],
+        periods=[PeriodForCourse(course_id=course_id, period_name=period) for period in PERIODS],
+        runs=[RunForCourse(course_id=course_id, run_name=run) for run in RUNS],
+    )
+
+
+async def measure(size: int) -> None:
+    """Print rows and time of both loading strategies on catalog of given size."""
+    async with async_session_factory() as session:
+        session.add_all([make_course(number) for number in range(size)])
+        await session.flush()
+        session.expunge_all()
+
+        joined_rows_query = (
+            select(func.count())
+            .select_from(Course)
+            .outerjoin(RoleForCourse).outerjoin(PeriodForCourse).outerjoin(RunForCourse)
+            .where(Course.is_archive.is_(False))
+        )
+        joined_rows = await session.scalar(joined_rows_query)
+        selectin_rows = sum([
+            await session.scalar(select(func.count()).select_from(model))
+            for model in (Course, RoleForCourse, PeriodForCourse, RunForCourse)
+        ])
+
+        started_at = time.perf_counter()
+        joined_query = (
+            select(Course)
+            .options(joinedload(Course.roles))
+            .options(joinedload(Course.periods))
+            .options(joinedload(Course.runs))
+            .filter_by(is_archive=False)
+            .order_by(Course.name, Course.id)
+        )
+        result = await session.execute(joined_query)
+        courses = [course.to_domain() for course in result.unique().scalars().all()]
+        joined_time = time.perf_counter() - started_at
+        session.expunge_all()
+
+        started_at = time.perf_counter()
+        courses = await SQLAlchemyCourseRepository(session).get_all()
+        selectin_time = time.perf_counter() - started_at
+
+        print(
+            f"{len(courses):>8} courses: joinedload {joined_rows:>8} rows {joined_time:>7.2f} s, "
+            f"selectinload {selectin_rows:>8} rows {selectin_time:>7.2f} s",
+        )
+        await session.rollback()
+
+
+async def main() -> None:
+    """Run benchmark for every size of catalog."""
+    for size in SIZES:
+        await measure(size)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
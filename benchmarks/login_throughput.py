@@ -0,0 +1,82 @@
+"""Compare throughput of password checks and lag of event loop with hashing in loop and in pool of threads.
+
+Logins are simulated by checks of password, database and Redis are not used.
+Run from the root of repository with settings from .env: python -m benchmarks.login_throughput
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING
+
+from src.config import app_config
+from src.domain.auth.exceptions import PasswordHashingBusyError
+from src.infrastructure.security.password_hash_pool import PasswordHashPool
+from src.infrastructure.security.password_service import PasswordService
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+CONCURRENCIES = (1, 4, 16, 64)
+LOGINS = 64
+TICK = 0.001
+
+
+async def measure_lag(is_done: asyncio.Event) -> float:
+    """Get the largest delay of event loop, it is the time other requests wait."""
+    max_lag = 0.0
+    while not is_done.is_set():
+        started_at = time.perf_counter()
+        await asyncio.sleep(TICK)
+        max_lag = max(max_lag, time.perf_counter() - started_at - TICK)
+    return max_lag
+
+
+async def measure(name: str, concurrency: int, check: Callable[[str], Awaitable[bool]], hashed_password: str) -> None:
+    """Print logins per second, rejected logins and lag of event loop for given number of concurrent logins."""
+    semaphore = asyncio.Semaphore(concurrency)
+    rejected = 0
+
+    async def login() -> None:
+        nonlocal rejected
+        async with semaphore:
+            try:
+                await check(hashed_password)
+            except PasswordHashingBusyError:
+                rejected += 1
+
+    is_done = asyncio.Event()
+    lag_task = asyncio.create_task(measure_lag(is_done))
+    started_at = time.perf_counter()
+    await asyncio.gather(*[login() for _ in range(LOGINS)])
+    elapsed = time.perf_counter() - started_at
+    is_done.set()
+    max_lag = await lag_task
+    print(
+        f"{name:>6} {concurrency:>4} concurrent: {(LOGINS - rejected) / elapsed:>8.1f} logins/s, "
+        f"{rejected:>4} rejected, max lag of loop {max_lag * 1000:>8.1f} ms",
+    )
+
+
+async def main() -> None:
+    """Run benchmark for every number of concurrent logins."""
+    hashed_password = PasswordService.hash_password("password", app_config.PASSWORD_HASH_ITERATIONS)
+    pool = PasswordHashPool(app_config.PASSWORD_HASH_WORKERS, app_config.PASSWORD_HASH_MAX_PENDING)
+
+    async def check_in_loop(hashed_password: str) -> bool:
+        return PasswordService.check_password("password", hashed_password)
+
+    async def check_in_pool(hashed_password: str) -> bool:
+        return await pool.run(PasswordService.check_password, "password", hashed_password)
+
+    print(
+        f"{app_config.PASSWORD_HASH_ITERATIONS} iterations, {app_config.PASSWORD_HASH_WORKERS} workers, "
+        f"{app_config.PASSWORD_HASH_MAX_PENDING} pending hashes at most",
+    )
+    for concurrency in CONCURRENCIES:
+        await measure("loop", concurrency, check_in_loop, hashed_password)
+        await measure("pool", concurrency, check_in_pool, hashed_password)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
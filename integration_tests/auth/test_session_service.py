@@ -7,6 +7,7 @@ from src.domain.auth.exceptions import UserBySessionNotFoundError
 from src.domain.auth.value_objects import PartOfName, UserRole, Email
 from src.domain.base_value_objects import UUID
 from src.infrastructure.redis.auth.session_service import RedisSessionService
+from src.infrastructure.redis.auth.two_tier_session_service import TwoTierSessionService, local_sessions_cache
 
 
 @pytest.fixture(scope='function')
@@ -85,3 +86,27 @@ async def test_update_user(redis_session_service):
     assert user_in_cache.role == updated_user.role
     assert user_in_cache.email == updated_user.email
     assert user_in_cache.hashed_password == updated_user.hashed_password
+
+
+async def test_two_tier_session_is_evicted_by_logout(test_cache_session):
+    session_service = TwoTierSessionService(test_cache_session)
+    auth_token = "two-tier-auth-token"
+    user = UserEntity(
+        id=UUID(str(uuid.uuid4())),
+        firstname=PartOfName("Nick"),
+        lastname=PartOfName("Cargo"),
+        role=UserRole("admin"),
+        email=Email("nick@cargo.com"),
+        hashed_password="32rserfs4t4ts4t4"
+    )
+    await session_service.set(auth_token, user)
+    user_in_cache = await session_service.get(auth_token)
+    user_in_cache.firstname = PartOfName("Carl")
+    assert (await session_service.get(auth_token)).firstname == user.firstname
+    assert local_sessions_cache.get(auth_token) is None  # token itself is not kept
+    assert local_sessions_cache.get(TwoTierSessionService.get_token_hash(auth_token)) is not None
+
+    await session_service.delete(auth_token)
+    assert local_sessions_cache.get(TwoTierSessionService.get_token_hash(auth_token)) is None
+    with pytest.raises(UserBySessionNotFoundError):
+        await session_service.get(auth_token)
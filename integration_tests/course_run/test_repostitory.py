@@ -48,3 +48,15 @@ async def test_delete_course_run(test_async_session: AsyncSession):
     await test_async_session.commit()
     with pytest.raises(CourseRunNotFoundError):
         await repo.get_by_id(course_run_1_id)
+
+
+async def test_get_actual_course_run_ids(test_async_session: AsyncSession):
+    course_1_id, course_2_id = UUID(str(uuid.uuid4())), UUID(str(uuid.uuid4()))
+    await create_course_run(test_async_session, course_1_id, "Весна 2024")
+    course_run_id, _ = await create_course_run(test_async_session, course_1_id, "Осень 2024")
+    deleted_course_run_id, repo = await create_course_run(test_async_session, course_2_id, "Осень 2024")
+    await repo.delete(deleted_course_run_id)
+    await test_async_session.commit()
+
+    actual_ids = await repo.get_actual_ids([("Осень", 2024), ("Весна", 2025)])
+    assert actual_ids == {course_1_id.value: course_run_id.value}
@@ -46,7 +46,11 @@ async def test_operations_with_all_courses(redis_course_cache_service):
         id=UUID(str(uuid.uuid4())),
         name=CourseName("Java")
     )
+    assert await redis_course_cache_service.get_version() is None
     await redis_course_cache_service.set_many([course_1, course_2])
+    version = await redis_course_cache_service.get_version()
+    assert version is not None
+    assert not version.is_stale
 
     getting_courses = await redis_course_cache_service.get_many()
     assert len(getting_courses) == 2
@@ -57,3 +61,59 @@ async def test_operations_with_all_courses(redis_course_cache_service):
 
     deleted_courses = await redis_course_cache_service.get_many()
     assert deleted_courses is None
+    assert await redis_course_cache_service.get_version() is None
+
+
+async def test_get_courses_by_ids(redis_course_cache_service):
+    course_1 = CourseEntity(
+        id=UUID(str(uuid.uuid4())),
+        name=CourseName("Алгоритмизация")
+    )
+    course_2 = CourseEntity(
+        id=UUID(str(uuid.uuid4())),
+        name=CourseName("Java")
+    )
+    await redis_course_cache_service.set_many([course_1, course_2])
+
+    getting_courses = await redis_course_cache_service.get_many_by_ids([course_2.id, course_1.id])
+    assert [course.name for course in getting_courses] == [CourseName("Java"), CourseName("Алгоритмизация")]
+
+    await redis_course_cache_service.delete_one(course_1.id)
+    getting_courses = await redis_course_cache_service.get_many_by_ids([course_1.id, course_2.id])
+    assert getting_courses[0] is None
+    assert getting_courses[1].name == CourseName("Java")
+    assert await redis_course_cache_service.get_many() is None
+
+    await redis_course_cache_service.delete_many_by_ids([course_1.id, course_2.id])
+    assert await redis_course_cache_service.get_many_by_ids([course_1.id, course_2.id]) == [None, None]
+
+
+async def test_patch_all_courses(redis_course_cache_service):
+    course_1 = CourseEntity(
+        id=UUID(str(uuid.uuid4())),
+        name=CourseName("Алгоритмизация")
+    )
+    course_2 = CourseEntity(
+        id=UUID(str(uuid.uuid4())),
+        name=CourseName("Java")
+    )
+    assert await redis_course_cache_service.patch_many(course_1, is_listed=True) is None
+    await redis_course_cache_service.set_many([course_1])
+    version = await redis_course_cache_service.get_version()
+
+    old_version, new_version = await redis_course_cache_service.patch_many(course_2, is_listed=True)
+    assert old_version == version.value
+    assert (await redis_course_cache_service.get_version()).value == new_version
+    getting_courses = await redis_course_cache_service.get_many()
+    assert [course.name for course in getting_courses] == [CourseName("Java"), CourseName("Алгоритмизация")]
+
+    renamed_course_2 = CourseEntity(id=course_2.id, name=CourseName("Язык Java"))
+    await redis_course_cache_service.patch_many(renamed_course_2, is_listed=True)
+    getting_courses = await redis_course_cache_service.get_many()
+    assert [course.id for course in getting_courses] == [course_1.id, course_2.id]
+
+    await redis_course_cache_service.patch_many(course_1, is_listed=False)
+    getting_courses = await redis_course_cache_service.get_many()
+    assert [course.id for course in getting_courses] == [course_2.id]
+
+    await redis_course_cache_service.delete_many()
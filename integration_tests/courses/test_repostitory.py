@@ -7,6 +7,7 @@ from src.domain.base_value_objects import UUID
 from src.domain.courses.constants import PERIODS, ROLES
 from src.domain.courses.entities import CourseEntity
 from src.domain.courses.exceptions import CourseNotFoundError
+from src.domain.courses.filters import CourseFilter
 from src.domain.courses.value_objects import CourseName, Period, Role, CourseRun
 from src.infrastructure.sqlalchemy.courses.repository import SQLAlchemyCourseRepository
 
@@ -73,6 +74,51 @@ async def test_update_course(test_async_session: AsyncSession):
     assert course.last_runs[0] == update_course.last_runs[0]
 
 
+async def test_update_values_of_course(test_async_session: AsyncSession):
+    course_id, repo = await create_course(test_async_session)
+    course = CourseEntity(
+        course_id,
+        name=CourseName("Алгоритмизация"),
+        roles=[Role(ROLES[0]), Role(ROLES[1])],
+        last_runs=[CourseRun("Весна 2023")],
+    )
+    await repo.update(course)
+    await test_async_session.commit()
+    course.roles = [Role(ROLES[1]), Role(ROLES[2])]
+    course.last_runs = [CourseRun("Весна 2023"), CourseRun("Весна 2023")]
+    await repo.update(course)
+    await test_async_session.commit()
+
+    updated_course = await repo.get_by_id(course_id)
+    assert set(updated_course.roles) == {Role(ROLES[1]), Role(ROLES[2])}
+    assert updated_course.last_runs == [CourseRun("Весна 2023")]
+    assert updated_course.periods == []
+
+
+async def test_save_many_courses(test_async_session: AsyncSession):
+    course_id, repo = await create_course(test_async_session)
+    new_course = CourseEntity(
+        UUID(str(uuid.uuid4())),
+        name=CourseName("Java"),
+        roles=[Role(ROLES[0])],
+    )
+    replaced_course = CourseEntity(
+        course_id,
+        name=CourseName("Методы алгоритмизации"),
+        periods=[Period(PERIODS[0])],
+        last_runs=[CourseRun("Весна 2023")],
+    )
+    await repo.save_many([new_course, replaced_course])
+    await test_async_session.commit()
+
+    courses = await repo.get_all()
+    assert [course.name for course in courses] == [CourseName("Java"), CourseName("Методы алгоритмизации")]
+    assert courses[0].roles == [Role(ROLES[0])]
+    assert courses[1].id == course_id
+    assert courses[1].periods == [Period(PERIODS[0])]
+    assert courses[1].last_runs == [CourseRun("Весна 2023")]
+
+
 async def test_delete_course(test_async_session: AsyncSession):
     course_id, repo = await create_course(test_async_session)
     await repo.delete(course_id)
@@ -92,3 +138,40 @@ async def test_update_course_after_delete(test_async_session: AsyncSession):
         )
         await repo.update(update_course)
         await test_async_session.commit()
+
+
+async def test_get_page_of_courses(test_async_session: AsyncSession):
+    repo = SQLAlchemyCourseRepository(test_async_session)
+    courses = [
+        CourseEntity(id=UUID(str(uuid.uuid4())), name=CourseName(name), is_draft=False, roles=[Role(ROLES[0])])
+        for name in ("C", "A", "B")
+    ]
+    for course in courses:
+        await repo.create(course)
+        await repo.update_draft_status(course)
+    await test_async_session.commit()
+
+    first_page = await repo.get_page(CourseFilter(roles=[ROLES[0]]), "", None, 2)
+    assert [course.name.value for course in first_page] == ["A", "B"]
+    last_course = first_page[-1]
+    second_page = await repo.get_page(CourseFilter(), "", [last_course.name.value, last_course.id.value], 2)
+    assert [course.name.value for course in second_page] == ["C"]
+    assert await repo.get_page(CourseFilter(roles=[ROLES[1]]), "", None, 2) == []
+
+
+async def test_search_courses(test_async_session: AsyncSession):
+    repo = SQLAlchemyCourseRepository(test_async_session)
+    courses = [
+        CourseEntity(id=UUID(str(uuid.uuid4())), name=CourseName("Алгоритмы и структуры данных"), is_draft=False),
+        CourseEntity(id=UUID(str(uuid.uuid4())), name=CourseName("Java"), is_draft=False, topics="Алгоритмы"),
+        CourseEntity(id=UUID(str(uuid.uuid4())), name=CourseName("Python"), is_draft=False),
+    ]
+    for course in courses:
+        await repo.create(course)
+        await repo.update_draft_status(course)
+    await test_async_session.commit()
+
+    found_courses = await repo.search("алгоритмы", 10)
+    assert {course.name.value for course in found_courses} == {"Алгоритмы и структуры данных", "Java"}
+    found_courses = await repo.search("Pyton", 10)
+    assert [course.name.value for course in found_courses] == ["Python"]
@@ -1,11 +1,13 @@
 import datetime
+import json
 import uuid
 
 import pytest
 
 from src.domain.base_value_objects import UUID
-from src.domain.feedback.entities import FeedbackEntity
+from src.domain.feedback.entities import CourseRatingEntity, FeedbackEntity
 from src.domain.feedback.value_objects import FeedbackText, Vote, Rating
+from src.infrastructure.redis.feedback.constants import TIME_TO_LIVE_COURSE_RATINGS
 from src.infrastructure.redis.feedback.feedback_cache_service import RedisFeedbackCacheService
 
 
@@ -31,11 +33,107 @@ async def test_operations_with_one_course(redis_feedback_cache_service):
 
     getting_feedbacks = await redis_feedback_cache_service.get_many_by_course_id(course_id)
     assert len(getting_feedbacks) == 1
-    assert len(getting_feedbacks[0].votes) == 1
+    assert getting_feedbacks[0].like_count == 1
+    assert getting_feedbacks[0].reputation == 1
     assert getting_feedbacks[0].text.value == "Cool"
     assert getting_feedbacks[0].rating.value == 5
+    entry = await redis_feedback_cache_service.get_entry_by_course_id(course_id)
+    assert not entry.is_stale
 
     await redis_feedback_cache_service.delete_many(course_id)
 
     deleted_course = await redis_feedback_cache_service.get_many_by_course_id(course_id)
     assert deleted_course is None
+
+
+async def test_pages_are_deleted_with_feedbacks(redis_feedback_cache_service):
+    course_id = UUID(str(uuid.uuid4()))
+    feedbacks = [FeedbackEntity(
+        id=UUID(str(uuid.uuid4())),
+        course_id=course_id,
+        author_id=UUID(str(uuid.uuid4())),
+        text=FeedbackText("Cool"),
+        rating=Rating(4),
+        date=datetime.date.today()
+    )]
+    assert await redis_feedback_cache_service.get_page(course_id, "rating", None, 11) is None
+    await redis_feedback_cache_service.set_page(course_id, "rating", None, 11, feedbacks)
+    page = await redis_feedback_cache_service.get_page(course_id, "rating", None, 11)
+    assert [feedback.id for feedback in page] == [feedbacks[0].id]
+    assert await redis_feedback_cache_service.get_page(course_id, "newest", None, 11) is None
+
+    await redis_feedback_cache_service.delete_many(course_id)
+    assert await redis_feedback_cache_service.get_page(course_id, "rating", None, 11) is None
+
+
+async def test_patch_votes_of_one_feedback(redis_feedback_cache_service):
+    course_id = UUID(str(uuid.uuid4()))
+    feedbacks = [
+        FeedbackEntity(
+            id=UUID(str(uuid.uuid4())),
+            course_id=course_id,
+            author_id=UUID(str(uuid.uuid4())),
+            text=FeedbackText("Cool"),
+            rating=Rating(5),
+        )
+        for _ in range(2)
+    ]
+    await redis_feedback_cache_service.set_many(course_id, feedbacks)
+    await redis_feedback_cache_service.set_page(course_id, "reputation", None, 11, feedbacks)
+    feedbacks[1].vote(UUID(str(uuid.uuid4())), "like")
+    await redis_feedback_cache_service.patch_one(feedbacks[1])
+
+    getting_feedbacks = await redis_feedback_cache_service.get_many_by_course_id(course_id)
+    assert [feedback.reputation for feedback in getting_feedbacks] == [0, 1]
+    assert await redis_feedback_cache_service.get_page(course_id, "reputation", None, 11) is None
+
+
+async def test_operations_with_user_votes(redis_feedback_cache_service):
+    course_id, user_id, feedback_id = UUID(str(uuid.uuid4())), UUID(str(uuid.uuid4())), str(uuid.uuid4())
+    assert await redis_feedback_cache_service.get_user_votes(course_id, user_id) is None
+
+    await redis_feedback_cache_service.set_user_votes(course_id, user_id, {})
+    assert await redis_feedback_cache_service.get_user_votes(course_id, user_id) == {}
+    await redis_feedback_cache_service.set_user_votes(course_id, user_id, {feedback_id: "like"})
+    assert await redis_feedback_cache_service.get_user_votes(course_id, user_id) == {feedback_id: "like"}
+
+    await redis_feedback_cache_service.delete_user_votes(course_id, user_id)
+    assert await redis_feedback_cache_service.get_user_votes(course_id, user_id) is None
+
+
+async def test_course_ratings_expire_one_by_one(redis_feedback_cache_service, test_cache_session):
+    course_id, another_course_id = UUID(str(uuid.uuid4())), UUID(str(uuid.uuid4()))
+    await redis_feedback_cache_service.set_course_ratings([CourseRatingEntity(course_id, count=1, rating_sum=5)])
+    await test_cache_session.expire(redis_feedback_cache_service.course_rating_key(course_id), 5)
+
+    # summary of another course does not prolong stale summary
+    await redis_feedback_cache_service.set_course_ratings([CourseRatingEntity(another_course_id)])
+    assert await test_cache_session.ttl(redis_feedback_cache_service.course_rating_key(course_id)) <= 5
+    ratings = await redis_feedback_cache_service.get_course_ratings([course_id, another_course_id])
+    assert ratings[course_id.value].rating_sum == 5
+    assert 0 < await test_cache_session.ttl(
+        redis_feedback_cache_service.course_rating_key(another_course_id),
+    ) <= TIME_TO_LIVE_COURSE_RATINGS
+
+    await redis_feedback_cache_service.delete_course_rating(course_id)
+    assert list(await redis_feedback_cache_service.get_course_ratings([course_id, another_course_id])) == [
+        another_course_id.value,
+    ]
+
+
+async def test_feedbacks_of_baseline_format_are_missing(redis_feedback_cache_service, test_cache_session):
+    course_id = UUID(str(uuid.uuid4()))
+    baseline_feedbacks = [{
+        "id": str(uuid.uuid4()),
+        "course_id": course_id.value,
+        "author_id": str(uuid.uuid4()),
+        "text": "Baseline feedback",
+        "rating": 5,
+        "votes": [{"user_id": str(uuid.uuid4()), "vote_type": "like"}],
+        "date": "2024-07-01",
+    }]
+    await test_cache_session.setex(
+        redis_feedback_cache_service.feedback_key(course_id), 60 * 60, json.dumps(baseline_feedbacks),
+    )
+    assert await redis_feedback_cache_service.get_entry_by_course_id(course_id) is None
+    assert await redis_feedback_cache_service.get_many_by_course_id(course_id) is None
@@ -2,12 +2,15 @@ import datetime
 import uuid
 
 import pytest
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.base_value_objects import UUID
 from src.domain.feedback.entities import FeedbackEntity
 from src.domain.feedback.exceptions import FeedbackNotFoundError
-from src.domain.feedback.value_objects import FeedbackText, Rating
+from src.domain.feedback.value_objects import FeedbackText, Rating, Vote
+from src.infrastructure.sqlalchemy.errors import get_violated_constraint
+from src.infrastructure.sqlalchemy.feedback.models import AUTHOR_FEEDBACK_INDEX
 from src.infrastructure.sqlalchemy.feedback.repository import SQLAlchemyFeedbackRepository
 
 
@@ -56,23 +59,161 @@ async def test_get_many_feedbacks(test_async_session: AsyncSession):
     assert feedbacks[1].id == feedback_1_id
 
 
+async def test_get_most_discussed_course_ids(test_async_session: AsyncSession):
+    _, course_id, _, repo = await create_feedback(test_async_session)
+    await repo.create(FeedbackEntity(
+        id=UUID(str(uuid.uuid4())),
+        course_id=course_id,
+        author_id=UUID(str(uuid.uuid4())),
+        text=FeedbackText("Cool 2"),
+        rating=Rating(4),
+    ))
+    await test_async_session.commit()
+    course_ids = await repo.get_most_discussed_course_ids(1)
+    assert course_ids == [course_id]
+
+
 async def test_add_votes(test_async_session: AsyncSession):
     feedback_id, _, _, repo = await create_feedback(test_async_session)
-    feedback = await repo.get_one_by_id(feedback_id)
-    feedback.vote(UUID(str(uuid.uuid4())), "like")
-    feedback.vote(UUID(str(uuid.uuid4())), "dislike")
-    await repo.update_votes(feedback)
+    await repo.set_vote(feedback_id, Vote(UUID(str(uuid.uuid4())), "like"))
+    await repo.set_vote(feedback_id, Vote(UUID(str(uuid.uuid4())), "dislike"))
     await test_async_session.commit()
 
     updated_feedback = await repo.get_one_by_id(feedback_id)
     assert updated_feedback.id == feedback_id
     assert len(updated_feedback.votes) == 2
+    assert updated_feedback.like_count == 1
+    assert updated_feedback.dislike_count == 1
     assert updated_feedback.reputation == 0
 
 
+async def test_get_user_votes(test_async_session: AsyncSession):
+    feedback_id, course_id, _, repo = await create_feedback(test_async_session)
+    user_id = UUID(str(uuid.uuid4()))
+    await repo.set_vote(feedback_id, Vote(user_id, "dislike"))
+    await test_async_session.commit()
+
+    user_votes = await repo.get_user_votes(course_id, user_id)
+    assert user_votes == {feedback_id.value: "dislike"}
+    feedbacks = await repo.get_all_by_course_id(course_id)
+    assert len(feedbacks[0].votes) == 0
+    assert feedbacks[0].dislike_count == 1
+
+
+async def test_change_and_delete_vote(test_async_session: AsyncSession):
+    feedback_id, _, _, repo = await create_feedback(test_async_session)
+    user_id = UUID(str(uuid.uuid4()))
+    await repo.set_vote(feedback_id, Vote(user_id, "like"))
+    await repo.set_vote(feedback_id, Vote(user_id, "like"))
+    await test_async_session.commit()
+    feedback = await repo.get_one_by_id_with_user_vote(feedback_id, user_id)
+    assert (feedback.like_count, feedback.dislike_count) == (1, 0)
+    assert feedback.votes == {Vote(user_id, "like")}
+
+    await repo.set_vote(feedback_id, Vote(user_id, "dislike"))
+    await test_async_session.commit()
+    feedback = await repo.get_one_by_id_with_user_vote(feedback_id, user_id)
+    assert (feedback.like_count, feedback.dislike_count) == (0, 1)
+
+    await repo.delete_vote(feedback_id, user_id)
+    await repo.delete_vote(feedback_id, user_id)
+    await test_async_session.commit()
+    feedback = await repo.get_one_by_id_with_user_vote(feedback_id, user_id)
+    assert (feedback.like_count, feedback.dislike_count) == (0, 0)
+    assert len(feedback.votes) == 0
+
+
+async def test_course_rating_follows_feedbacks_and_votes(test_async_session: AsyncSession):
+    feedback_id, course_id, _, repo = await create_feedback(test_async_session)
+    other_feedback_id = UUID(str(uuid.uuid4()))
+    await repo.create(FeedbackEntity(
+        id=other_feedback_id,
+        course_id=course_id,
+        author_id=UUID(str(uuid.uuid4())),
+        text=FeedbackText("Boring"),
+        rating=Rating(2),
+    ))
+    await test_async_session.commit()
+    [rating] = await repo.get_course_ratings([course_id])
+    assert (rating.count, rating.rating_sum, rating.histogram) == (2, 7, [0, 1, 0, 0, 1])
+    assert rating.weighted_average == 3.5
+
+    user_id = UUID(str(uuid.uuid4()))
+    await repo.set_vote(feedback_id, Vote(user_id, "like"))
+    await repo.set_vote(feedback_id, Vote(UUID(str(uuid.uuid4())), "like"))
+    await test_async_session.commit()
+    [rating] = await repo.get_course_ratings([course_id])
+    assert (rating.weighted_rating_sum, rating.weight_sum) == (17, 4)
+
+    await repo.delete_vote(feedback_id, user_id)
+    await repo.delete(other_feedback_id)
+    await test_async_session.commit()
+    [rating, empty_rating] = await repo.get_course_ratings([course_id, UUID(str(uuid.uuid4()))])
+    assert (rating.count, rating.rating_sum, rating.histogram) == (1, 5, [0, 0, 0, 0, 1])
+    assert (rating.weighted_rating_sum, rating.weight_sum) == (10, 2)
+    assert empty_rating.count == 0
+
+
+async def test_only_one_feedback_of_author_for_course(test_async_session: AsyncSession):
+    feedback_id, course_id, author_id, repo = await create_feedback(test_async_session)
+    await repo.create(FeedbackEntity(
+        id=UUID(str(uuid.uuid4())),
+        course_id=course_id,
+        author_id=author_id,
+        text=FeedbackText("Cool again"),
+        rating=Rating(4),
+    ))
+    with pytest.raises(IntegrityError) as ex:
+        await test_async_session.commit()
+    assert get_violated_constraint(ex.value) == AUTHOR_FEEDBACK_INDEX
+    await test_async_session.rollback()
+
+    await repo.delete(feedback_id)
+    await repo.create(FeedbackEntity(
+        id=UUID(str(uuid.uuid4())),
+        course_id=course_id,
+        author_id=author_id,
+        text=FeedbackText("Cool again"),
+        rating=Rating(4),
+    ))
+    await test_async_session.commit()
+
+
 async def test_delete_feedback(test_async_session: AsyncSession):
     feedback_id, _, _, repo = await create_feedback(test_async_session)
     await repo.delete(feedback_id)
     await test_async_session.commit()
     with pytest.raises(FeedbackNotFoundError):
         await repo.get_one_by_id(feedback_id)
+
+
+async def test_get_pages_of_feedbacks(test_async_session: AsyncSession):
+    repo = SQLAlchemyFeedbackRepository(test_async_session)
+    course_id = UUID(str(uuid.uuid4()))
+    ratings = [3, 5, 4]
+    feedback_ids = [UUID(str(uuid.uuid4())) for _ in ratings]
+    for days, (feedback_id, rating) in enumerate(zip(feedback_ids, ratings)):
+        await repo.create(FeedbackEntity(
+            id=feedback_id,
+            course_id=course_id,
+            author_id=UUID(str(uuid.uuid4())),
+            text=FeedbackText("Cool"),
+            rating=Rating(rating),
+            date=datetime.date.today() - datetime.timedelta(days=days)
+        ))
+    await test_async_session.commit()
+
+    page = await repo.get_page_by_course_id(course_id, "newest", None, 2)
+    assert [feedback.id for feedback in page] == feedback_ids[:2]
+    after = [page[-1].date.isoformat(), page[-1].id.value]
+    page = await repo.get_page_by_course_id(course_id, "newest", after, 2)
+    assert [feedback.id for feedback in page] == feedback_ids[2:]
+
+    page = await repo.get_page_by_course_id(course_id, "rating", None, 1)
+    assert [feedback.id for feedback in page] == [feedback_ids[1]]
+    after = [str(page[-1].rating.value), page[-1].date.isoformat(), page[-1].id.value]
+    page = await repo.get_page_by_course_id(course_id, "rating", after, 5)
+    assert [feedback.id for feedback in page] == [feedback_ids[2], feedback_ids[0]]
+
+    page = await repo.get_page_by_course_id(course_id, "reputation", None, 5)
+    assert [feedback.id for feedback in page] == feedback_ids
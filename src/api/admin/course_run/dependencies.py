@@ -1,6 +1,9 @@
 from fastapi import Depends
+from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.infrastructure.redis.course_run.course_run_cache_service import RedisCourseRunCacheService
+from src.infrastructure.redis.session import get_redis_session
 from src.infrastructure.sqlalchemy.course_run.unit_of_work import SQLAlchemyCourseRunUnitOfWork
 from src.infrastructure.sqlalchemy.session import get_async_session
 from src.services.course_run.command_service import CourseRunCommandService
@@ -8,11 +11,13 @@ from src.services.course_run.command_service import CourseRunCommandService
 
 def get_admin_course_run_command_service(
     db_session: AsyncSession = Depends(get_async_session),
+    cache_session: Redis = Depends(get_redis_session),
 ) -> CourseRunCommandService:
     """Get feedback service on sessions.
 
     :param db_session:
+    :param cache_session:
     :return:
     """
     unit_of_work = SQLAlchemyCourseRunUnitOfWork(db_session)
-    return CourseRunCommandService(unit_of_work)
+    return CourseRunCommandService(unit_of_work, RedisCourseRunCacheService(cache_session))
@@ -1,15 +1,17 @@
 from fastapi import Depends, status
+from redis import asyncio as aioredis
 from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.auth.dependencies import get_user
 from src.domain.auth.entities import UserEntity
 from src.exceptions import ApplicationError
-from src.infrastructure.redis.courses.course_cache_service import RedisCourseCacheService
-from src.infrastructure.redis.session import get_redis_session
+from src.infrastructure.redis.courses.two_tier_cache_service import TwoTierCourseCacheService
+from src.infrastructure.redis.session import get_redis_session, pool
 from src.infrastructure.sqlalchemy.courses.repository import SQLAlchemyCourseRepository
-from src.infrastructure.sqlalchemy.session import get_async_session
+from src.infrastructure.sqlalchemy.session import async_session_factory, get_async_session
 from src.services.courses.query_service_for_admin import AdminCourseQueryService
+from src.services.single_flight import background_refresh
 
 
 async def get_admin(
@@ -28,6 +30,19 @@ async def get_admin(
     return user
 
 
+async def refresh_admin_courses() -> None:
+    """Refresh cached courses for admin on own sessions, out of request."""
+    async with async_session_factory() as db_session, aioredis.Redis(connection_pool=pool) as cache_session:
+        course_repo = SQLAlchemyCourseRepository(db_session)
+        course_cache_service = TwoTierCourseCacheService(cache_session, "admin")
+        await AdminCourseQueryService(course_repo, course_cache_service).refresh_courses()
+
+
+def schedule_admin_courses_refresh() -> None:
+    """Refresh stale cached courses for admin in background."""
+    background_refresh.schedule("admin-courses", refresh_admin_courses)
+
+
 def get_admin_courses_query_service(
     db_session: AsyncSession = Depends(get_async_session),
     cache_session: Redis = Depends(get_redis_session),
@@ -39,5 +54,5 @@ def get_admin_courses_query_service(
     :return:
     """
     course_repo = SQLAlchemyCourseRepository(db_session)
-    course_cache_service = RedisCourseCacheService(cache_session, "admin")
-    return AdminCourseQueryService(course_repo, course_cache_service)
+    course_cache_service = TwoTierCourseCacheService(cache_session, "admin")
+    return AdminCourseQueryService(course_repo, course_cache_service, schedule_admin_courses_refresh)
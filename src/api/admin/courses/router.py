@@ -2,16 +2,25 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from fastapi import APIRouter, Body, Depends, Path, status
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Body, Depends, Path, Request, status
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import ValidationError
 
 from src.api.admin.courses.dependencies import get_admin, get_admin_courses_query_service
-from src.api.admin.courses.schemas import CreateCourseRequest, CreateCourseResponse, UpdateCourseRequest
+from src.api.admin.courses.schemas import (
+    CreateCourseRequest,
+    CreateCourseResponse,
+    ImportCourseRequest,
+    ImportCoursesResponse,
+    PatchCourseRequest,
+    UpdateCourseRequest,
+)
 from src.api.base_schemas import ErrorResponse, SuccessResponse
 from src.api.courses.dependencies import get_courses_command_service, get_talent_courses_query_service
 from src.api.courses.schemas import CourseFullDTO, CourseShortDTO
 from src.domain.courses.exceptions import (
     CourseAlreadyExistsError,
+    CourseImportError,
     CourseNotFoundError,
     CoursePublishError,
     EmptyPropertyError,
@@ -20,6 +29,8 @@ from src.domain.courses.exceptions import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
     from src.domain.auth.entities import UserEntity
     from src.services.courses.command_service import CourseCommandService
     from src.services.courses.query_service_for_admin import AdminCourseQueryService
@@ -27,6 +38,40 @@ if TYPE_CHECKING:
 
 router = APIRouter(prefix="/admin/courses", tags=["admin"])
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+async def read_imported_courses(request: Request) -> list[dict]:
+    """Read courses from NDJSON body, one course in line.
+
+    Lines are parsed as they arrive, so the body is not kept in memory beside parsed courses.
+
+    :param request:
+    :return: fields of courses
+    """
+    courses, rest, number = [], b"", 0
+    async for chunk in request.stream():
+        *complete_lines, rest = (rest + chunk).split(b"\n")
+        for line in complete_lines:
+            number += 1
+            courses.append(parse_imported_course(number, line))
+    if rest.strip():  # last line without line break
+        courses.append(parse_imported_course(number + 1, rest))
+    return courses
+
+
+def parse_imported_course(number: int, line: bytes) -> dict:
+    """Parse and validate line of imported courses.
+
+    :param number: number of line from 1
+    :param line:
+    :return: fields of course
+    """
+    try:
+        return ImportCourseRequest.model_validate_json(line).model_dump()
+    except ValidationError as ex:
+        raise CourseImportError(line=number, error_message=ex.errors()[0]["msg"]) from ex
+
 
 @router.post(
     "",
@@ -67,11 +112,11 @@ async def create_course(
     :return:
     """
     try:
-        course_id = await command_service.create_course(data.name)
-        await admin_query_service.course_cache_service.delete_many()
-        await talent_query_service.course_cache_service.delete_many()
+        course = await command_service.create_course(data.name)
+        await admin_query_service.update_course_in_cache(course)
+        await talent_query_service.update_course_in_cache(course)
         return JSONResponse(
-            content=CreateCourseResponse(course_id=course_id).model_dump(),
+            content=CreateCourseResponse(course_id=course.id.value).model_dump(),
             status_code=status.HTTP_201_CREATED,
         )
     except CourseAlreadyExistsError as ex:
@@ -86,6 +131,97 @@ async def create_course(
         )
 
 
+@router.post(
+    "/import",
+    status_code=status.HTTP_200_OK,
+    description="Create or replace courses from NDJSON body in one transaction, one course in line. "
+                "Course with id of existing course replaces it, course without id is created",
+    summary="Import courses",
+    responses={
+        status.HTTP_200_OK: {
+            "model": ImportCoursesResponse,
+            "description": "Courses imported",
+        },
+        status.HTTP_400_BAD_REQUEST: {
+            "model": ErrorResponse,
+            "description": "Error",
+        },
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {
+            "model": ErrorResponse,
+            "description": "Line is not valid",
+        },
+    },
+    response_model=ImportCoursesResponse,
+    openapi_extra={"requestBody": {"content": {NDJSON_MEDIA_TYPE: {"schema": {"type": "string"}}}, "required": True}},
+)
+async def import_courses(
+    request: Request,
+    _: UserEntity = Depends(get_admin),
+    command_service: CourseCommandService = Depends(get_courses_command_service),
+    admin_query_service: AdminCourseQueryService = Depends(get_admin_courses_query_service),
+    talent_query_service: TalentCourseQueryService = Depends(get_talent_courses_query_service),
+) -> JSONResponse:
+    """Import courses.
+
+    :param request:
+    :param talent_query_service:
+    :param admin_query_service:
+    :param _:
+    :param command_service:
+    :return:
+    """
+    try:
+        courses = await command_service.import_courses(await read_imported_courses(request))
+        await admin_query_service.invalidate_courses(courses)
+        await talent_query_service.invalidate_courses(courses)
+        return JSONResponse(
+            content=ImportCoursesResponse(course_ids=[course.id.value for course in courses]).model_dump(),
+            status_code=status.HTTP_200_OK,
+        )
+    except CourseAlreadyExistsError as ex:
+        return JSONResponse(
+            content=ErrorResponse(message=ex.message).model_dump(),
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+    except CourseImportError as ex:
+        return JSONResponse(
+            content=ErrorResponse(message=ex.message).model_dump(),
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        )
+
+
+@router.get(
+    "/export",
+    status_code=status.HTTP_200_OK,
+    description="Get all courses as NDJSON, one course in line, in format of import",
+    summary="Export courses",
+    responses={
+        status.HTTP_200_OK: {
+            "content": {NDJSON_MEDIA_TYPE: {"schema": {"type": "string"}}},
+            "description": "All courses",
+        },
+    },
+    response_class=StreamingResponse,
+)
+async def export_courses(
+    _: UserEntity = Depends(get_admin),
+    query_service: AdminCourseQueryService = Depends(get_admin_courses_query_service),
+) -> StreamingResponse:
+    """Export courses.
+
+    :param _:
+    :param query_service:
+    :return:
+    """
+    courses = await query_service.get_courses()
+
+    async def get_lines() -> AsyncIterator[str]:
+        for course in courses:
+            yield CourseFullDTO.from_domain(course).model_dump_json(exclude={"rating"}) + "\n"
+
+    return StreamingResponse(get_lines(), media_type=NDJSON_MEDIA_TYPE)
+
+
 @router.put(
     "/{course_id}",
     status_code=status.HTTP_200_OK,
@@ -130,7 +266,7 @@ async def update_course(
     :return:
     """
     try:
-        await command_service.update_course(
+        course = await command_service.update_course(
             course_id=course_id, name_=data.name,
             image_url=data.image_url, limits_=data.limits,
             prerequisites_=data.prerequisites,
@@ -141,10 +277,76 @@ async def update_course(
             terms_=data.terms, roles=data.roles,
             periods=data.periods, runs=data.last_runs,
         )
-        await admin_query_service.invalidate_course(course_id)
-        await talent_query_service.invalidate_course(course_id)
-        await admin_query_service.course_cache_service.delete_many()
-        await talent_query_service.course_cache_service.delete_many()
+        await admin_query_service.update_course_in_cache(course)
+        await talent_query_service.update_course_in_cache(course)
+        return JSONResponse(
+            content=SuccessResponse(message="Course has updated").model_dump(),
+            status_code=status.HTTP_200_OK,
+        )
+    except CourseAlreadyExistsError as ex:
+        return JSONResponse(
+            content=ErrorResponse(message=ex.message).model_dump(),
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+    except (EmptyPropertyError, IncorrectCourseRunNameError, ValueDoesntExistError) as ex:
+        return JSONResponse(
+            content=ErrorResponse(message=ex.message).model_dump(),
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        )
+    except CourseNotFoundError as ex:
+        return JSONResponse(
+            content=ErrorResponse(message=ex.message).model_dump(),
+            status_code=status.HTTP_404_NOT_FOUND,
+        )
+
+
+@router.patch(
+    "/{course_id}",
+    status_code=status.HTTP_200_OK,
+    description="Update only sent fields of course",
+    summary="Patch course",
+    responses={
+        status.HTTP_200_OK: {
+            "model": SuccessResponse,
+            "description": "Course updated",
+        },
+        status.HTTP_404_NOT_FOUND: {
+            "model": ErrorResponse,
+            "description": "No course",
+        },
+        status.HTTP_400_BAD_REQUEST: {
+            "model": ErrorResponse,
+            "description": "Error",
+        },
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {
+            "model": ErrorResponse,
+            "description": "Validation error",
+        },
+    },
+    response_model=SuccessResponse,
+)
+async def patch_course(
+    course_id: str = Path(),
+    data: PatchCourseRequest = Body(),
+    _: UserEntity = Depends(get_admin),
+    command_service: CourseCommandService = Depends(get_courses_command_service),
+    admin_query_service: AdminCourseQueryService = Depends(get_admin_courses_query_service),
+    talent_query_service: TalentCourseQueryService = Depends(get_talent_courses_query_service),
+) -> JSONResponse:
+    """Patch course.
+
+    :param talent_query_service:
+    :param admin_query_service:
+    :param _:
+    :param course_id:
+    :param data: only sent fields are changed
+    :param command_service:
+    :return:
+    """
+    try:
+        course = await command_service.patch_course(course_id, data.model_dump(exclude_unset=True))
+        await admin_query_service.update_course_in_cache(course)
+        await talent_query_service.update_course_in_cache(course)
         return JSONResponse(
             content=SuccessResponse(message="Course has updated").model_dump(),
             status_code=status.HTTP_200_OK,
@@ -321,9 +523,9 @@ async def publish_course(
     :return:
     """
     try:
-        await command_service.publish_course(course_id)
-        await admin_query_service.invalidate_course(course_id)
-        await talent_query_service.invalidate_course(course_id)
+        course = await command_service.publish_course(course_id)
+        await admin_query_service.update_course_in_cache(course)
+        await talent_query_service.update_course_in_cache(course)
         return JSONResponse(
             content=SuccessResponse(message="Course has published").model_dump(),
             status_code=status.HTTP_200_OK,
@@ -378,9 +580,9 @@ async def hide_course(
     :return:
     """
     try:
-        await command_service.hide_course(course_id)
-        await admin_query_service.invalidate_course(course_id)
-        await talent_query_service.invalidate_course(course_id)
+        course = await command_service.hide_course(course_id)
+        await admin_query_service.update_course_in_cache(course)
+        await talent_query_service.update_course_in_cache(course)
         return JSONResponse(
             content=SuccessResponse(message="Course has unpublished").model_dump(),
             status_code=status.HTTP_200_OK,
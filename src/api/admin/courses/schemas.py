@@ -41,3 +41,41 @@ class UpdateCourseRequest(BaseModel):
     roles: list[str] = Field(["AI Product Manager"])
     periods: list[str] = Field(["сентябрь", "октябрь"])
     last_runs: list[str] = Field(["Весна 2023"])
+
+
+class PatchCourseRequest(UpdateCourseRequest):
+
+    """Schema of changed fields of course, fields which are not sent are kept."""
+
+
+class ImportCourseRequest(BaseModel):
+
+    """Schema of course in line of import, course with the same id is replaced."""
+
+    id: str | None = Field(None)
+    name: str
+    image_url: str | None = Field(None)
+    limits: int | None = Field(None)
+    is_draft: bool = Field(default=True)
+
+    prerequisites: str | None = Field(None)
+    description: str | None = Field(None)
+    topics: str | None = Field(None)
+    assessment: str | None = Field(None)
+    resources: list[ResourceDTO] = Field([])
+    extra: str | None = Field(None)
+
+    author: str | None = Field(None)
+    implementer: str | None = Field(None)
+    format: str | None = Field(None)
+    terms: str | None = Field(None)
+    roles: list[str] = Field([])
+    periods: list[str] = Field([])
+    last_runs: list[str] = Field([])
+
+
+class ImportCoursesResponse(BaseModel):
+
+    """Schema of imported courses."""
+
+    course_ids: list[str] = Field(["fsf4r6srr6s8f4fs"])
@@ -4,21 +4,26 @@ from typing import TYPE_CHECKING
 
 from fastapi import Depends
 
+from src.infrastructure.redis.course_run.course_run_cache_service import RedisCourseRunCacheService
+from src.infrastructure.redis.session import get_redis_session
 from src.infrastructure.sqlalchemy.playlists.unit_of_work import SQLAlchemyPlaylistUnitOfWork
 from src.infrastructure.sqlalchemy.session import get_async_session
 from src.services.playlists.command_service import PlaylistCommandService
 
 if TYPE_CHECKING:
+    from redis.asyncio import Redis
     from sqlalchemy.ext.asyncio import AsyncSession
 
 
 def get_playlist_service(
         db_session: AsyncSession = Depends(get_async_session),
+        cache_session: Redis = Depends(get_redis_session),
 ) -> PlaylistCommandService:
     """Get playlist service on sessions.
 
     :param db_session:
+    :param cache_session:
     :return:
     """
     unit_of_work = SQLAlchemyPlaylistUnitOfWork(db_session)
-    return PlaylistCommandService(unit_of_work)
+    return PlaylistCommandService(unit_of_work, RedisCourseRunCacheService(cache_session))
@@ -7,7 +7,7 @@ from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from src.domain.auth.exceptions import UserBySessionNotFoundError
 from src.exceptions import ApplicationError
-from src.infrastructure.redis.auth.session_service import RedisSessionService
+from src.infrastructure.redis.auth.two_tier_session_service import TwoTierSessionService
 from src.infrastructure.redis.session import get_redis_session
 from src.infrastructure.sqlalchemy.session import get_async_session
 from src.infrastructure.sqlalchemy.users.unit_of_work import SQLAlchemyAuthUnitOfWork
@@ -31,7 +31,7 @@ def get_auth_service(
     :return:
     """
     unit_of_work = SQLAlchemyAuthUnitOfWork(db_session)
-    session_service = RedisSessionService(cache_session)
+    session_service = TwoTierSessionService(cache_session)
     return AuthCommandService(unit_of_work, session_service)
 
 
@@ -13,6 +13,7 @@ from src.domain.auth.entities import UserEntity
 from src.domain.auth.exceptions import (
     EmailNotValidError,
     EmptyPartOfNameError,
+    PasswordHashingBusyError,
     PasswordTooShortError,
     UserNotFoundError,
     UserWithEmailExistsError,
@@ -22,6 +23,8 @@ from src.services.auth.command_service import AuthCommandService
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
+BUSY_RETRY_AFTER = "1"
+
 
 @router.post(
     "/register",
@@ -41,6 +44,10 @@ router = APIRouter(prefix="/auth", tags=["auth"])
             "model": ErrorResponse,
             "description": "Error in registration",
         },
+        status.HTTP_503_SERVICE_UNAVAILABLE: {
+            "model": ErrorResponse,
+            "description": "Too many logins at the same time",
+        },
     },
     response_model=AuthTokenResponse,
 )
@@ -68,6 +75,12 @@ async def register_talent(
             content=ErrorResponse(message=ex.message).model_dump(),
             status_code=status.HTTP_400_BAD_REQUEST,
         )
+    except PasswordHashingBusyError as ex:
+        return JSONResponse(
+            content=ErrorResponse(message=ex.message).model_dump(),
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            headers={"Retry-After": BUSY_RETRY_AFTER},
+        )
     return JSONResponse(
         content=AuthTokenResponse(auth_token=auth_token).model_dump(),
         status_code=status.HTTP_201_CREATED,
@@ -92,6 +105,10 @@ async def register_talent(
             "model": ErrorResponse,
             "description": "Error in login",
         },
+        status.HTTP_503_SERVICE_UNAVAILABLE: {
+            "model": ErrorResponse,
+            "description": "Too many logins at the same time",
+        },
     },
     response_model=AuthTokenResponse,
 )
@@ -119,6 +136,12 @@ async def login_user(
             content=ErrorResponse(message=ex.message).model_dump(),
             status_code=status.HTTP_400_BAD_REQUEST,
         )
+    except PasswordHashingBusyError as ex:
+        return JSONResponse(
+            content=ErrorResponse(message=ex.message).model_dump(),
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            headers={"Retry-After": BUSY_RETRY_AFTER},
+        )
     return JSONResponse(
         content=AuthTokenResponse(auth_token=auth_token).model_dump(),
         status_code=status.HTTP_200_OK,
@@ -1,7 +1,13 @@
 from __future__ import annotations
 
+import base64
+import binascii
+import json
 import math
-from typing import Generic, TypeVar
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 T = TypeVar("T")
 
@@ -33,6 +39,24 @@ class PageNumberLessOneError(PaginationError):
         return "This page is less than 1"
 
 
+class InvalidCursorError(PaginationError):
+
+    """Error if cursor can not be decoded."""
+
+    @property
+    def message(self) -> str:
+        return "Cursor is not valid"
+
+
+class CursorSortError(PaginationError):
+
+    """Error if cursor is passed with sort which has no keyset."""
+
+    @property
+    def message(self) -> str:
+        return "Cursor can not be used with this sort"
+
+
 class Paginator(Generic[T]):
 
     """Class for base pagination."""
@@ -43,9 +67,9 @@ class Paginator(Generic[T]):
         self.data = data
 
     def get_data_by_page(self, page: int) -> list[T]:
-        if page > self.n_pages:
+        if page > self.max_page:
             raise PageNumberMoreMaxPageError
-        if page < 0:
+        if page < 1:
             raise PageNumberLessOneError
         start_index = (page - 1) * self.page_size
         last_index = page * self.page_size
@@ -54,3 +78,45 @@ class Paginator(Generic[T]):
     @property
     def pages(self) -> list[int]:
         return list(range(1, self.n_pages + 1))
+
+    @property
+    def max_page(self) -> int:
+        return max(self.n_pages, 1)
+
+
+class CursorPaginator(Generic[T]):
+
+    """Class for keyset pagination with opaque cursors."""
+
+    def __init__(self, page_size: int, key: Callable[[T], list[str]], key_size: int) -> None:
+        self.page_size = page_size
+        self.key = key
+        self.key_size = key_size
+
+    @property
+    def limit(self) -> int:
+        """Count of rows to fetch: one extra row tells whether the next page exists."""
+        return self.page_size + 1
+
+    def decode(self, cursor: str | None) -> list[str] | None:
+        if not cursor:
+            return None
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except (binascii.Error, ValueError) as ex:
+            raise InvalidCursorError from ex
+        if not isinstance(values, list) or len(values) != self.key_size:
+            raise InvalidCursorError
+        if not all(isinstance(value, str) for value in values):
+            raise InvalidCursorError
+        return values
+
+    @staticmethod
+    def encode(values: list[str]) -> str:
+        return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+    def get_page(self, data: list[T]) -> tuple[list[T], str | None]:
+        page = data[:self.page_size]
+        if len(data) <= self.page_size:
+            return page, None
+        return page, self.encode(self.key(page[-1]))
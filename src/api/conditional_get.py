@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import datetime
+import hashlib
+import json
+import logging
+import re
+from typing import TYPE_CHECKING
+
+from fastapi import Request, Response, status
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+
+from src.infrastructure.redis.resource_version_service import RedisResourceVersionService
+from src.infrastructure.redis.session import pool
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from fastapi import FastAPI
+
+logger = logging.getLogger(__name__)
+
+API_PREFIX = "/api/v1"
+PUBLIC_CACHE_CONTROL = "public, no-cache"
+PRIVATE_CACHE_CONTROL = "private, no-cache"
+
+# path of GET request -> versioned resources of response, response depends on user
+READ_RESOURCES: list[tuple[re.Pattern, list[str], bool]] = [
+    (re.compile(r"^/courses(?:/search|/facets)?$"), ["catalog"], False),
+    (re.compile(r"^/courses/(?P<course_id>[^/]+)$"), ["course-{course_id}", "courses"], False),
+    (re.compile(r"^/courses/(?P<course_id>[^/]+)/feedbacks$"), ["feedbacks-{course_id}"], True),
+    (re.compile(r"^/courses/(?P<course_id>[^/]+)/timetable$"), ["timetable-{course_id}", "timetables"], False),
+]
+# path of successful changing request -> resources changed by it
+CHANGED_RESOURCES: list[tuple[re.Pattern, list[str]]] = [
+    (re.compile(r"^/admin/courses$"), ["catalog"]),
+    (re.compile(r"^/admin/courses/import$"), ["catalog", "courses"]),
+    (re.compile(r"^/admin/courses/(?P<course_id>[^/]+)(?:/published)?$"), ["catalog", "course-{course_id}"]),
+    (re.compile(r"^/admin/courses/(?P<course_id>[^/]+)/runs(?:/.*)?$"), ["timetable-{course_id}"]),
+    # ratings of courses are shown in catalog and on course
+    (
+        re.compile(r"^/courses/(?P<course_id>[^/]+)/feedbacks(?:/.*)?$"),
+        ["feedbacks-{course_id}", "course-{course_id}", "catalog"],
+    ),
+    (re.compile(r"^/integrations/google_calendar_links$"), ["timetables"]),
+]
+
+
+def get_read_resources(path: str) -> tuple[list[str], bool] | None:
+    """Get versioned resources of GET request and whether response depends on user.
+
+    :param path: path without prefix of API
+    :return: None if response is not versioned
+    """
+    for pattern, resources, is_private in READ_RESOURCES:
+        match = pattern.match(path)
+        if match:
+            return [resource.format(**match.groupdict()) for resource in resources], is_private
+    return None
+
+
+def get_changed_resources(path: str) -> list[str]:
+    """Get resources changed by request.
+
+    :param path: path without prefix of API
+    :return:
+    """
+    for pattern, resources in CHANGED_RESOURCES:
+        match = pattern.match(path)
+        if match:
+            return [resource.format(**match.groupdict()) for resource in resources]
+    return []
+
+
+def make_etag(request: Request, versions: list[str], *, is_private: bool) -> str:
+    """Make weak ETag of response from versions of its resources.
+
+    Date is a part of tag because actual course runs depend on it.
+
+    :param request:
+    :param versions:
+    :param is_private:
+    :return:
+    """
+    parts = [request.url.path, request.url.query, versions, datetime.datetime.now().date().isoformat()]
+    if is_private:
+        parts.append(request.headers.get("authorization", ""))
+    digest = hashlib.sha256(json.dumps(parts).encode()).hexdigest()[:32]
+    return f'W/"{digest}"'
+
+
+def is_not_modified(if_none_match: str | None, etag: str) -> bool:
+    """Check If-None-Match header against ETag with weak comparison.
+
+    :param if_none_match:
+    :param etag:
+    :return:
+    """
+    if not if_none_match:
+        return False
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or etag.removeprefix("W/") in tags
+
+
+def add_conditional_get(application: FastAPI) -> None:
+    """Add ETag and Cache-Control to public read endpoints, answer 304 without calling them.
+
+    :param application:
+    :return:
+    """
+
+    @application.middleware("http")
+    async def handle_conditional_get(
+            request: Request, call_next: Callable[[Request], Awaitable[Response]],
+    ) -> Response:
+        """Handle conditional GET or bump versions after change.
+
+        :param request:
+        :param call_next:
+        :return:
+        """
+        path = request.url.path.removeprefix(API_PREFIX)
+        if request.method != "GET":
+            response = await call_next(request)
+            changed_resources = get_changed_resources(path)
+            if changed_resources and response.status_code < status.HTTP_400_BAD_REQUEST:
+                try:
+                    async with aioredis.Redis(connection_pool=pool) as session:
+                        await RedisResourceVersionService(session).bump_many(changed_resources)
+                except RedisError:
+                    logger.exception("Versions of %s have not been bumped", changed_resources)
+            return response
+        read_resources = get_read_resources(path)
+        if read_resources is None:
+            return await call_next(request)
+        resources, is_private = read_resources
+        try:
+            async with aioredis.Redis(connection_pool=pool) as session:
+                versions = await RedisResourceVersionService(session).get_many(resources)
+        except RedisError:  # response is still correct without ETag
+            return await call_next(request)
+        etag = make_etag(request, versions, is_private=is_private)
+        headers = {"ETag": etag, "Cache-Control": PRIVATE_CACHE_CONTROL if is_private else PUBLIC_CACHE_CONTROL}
+        if is_private:
+            headers["Vary"] = "Authorization"
+        if is_not_modified(request.headers.get("if-none-match"), etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        response = await call_next(request)
+        if response.status_code == status.HTTP_200_OK:
+            response.headers.update(headers)
+        return response
@@ -1,14 +1,33 @@
 from fastapi import Depends
+from redis import asyncio as aioredis
 from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.infrastructure.redis.courses.course_cache_service import RedisCourseCacheService
-from src.infrastructure.redis.session import get_redis_session
+from src.infrastructure.redis.courses.two_tier_cache_service import TwoTierCourseCacheService
+from src.infrastructure.redis.session import get_redis_session, pool
 from src.infrastructure.sqlalchemy.courses.repository import SQLAlchemyCourseRepository
 from src.infrastructure.sqlalchemy.courses.unit_of_work import SQLAlchemyCoursesUnitOfWork
-from src.infrastructure.sqlalchemy.session import get_async_session
+from src.infrastructure.sqlalchemy.session import async_session_factory, get_async_session
+from src.services.courses.catalog_index import CatalogIndex
 from src.services.courses.command_service import CourseCommandService
 from src.services.courses.query_service_for_talent import TalentCourseQueryService
+from src.services.single_flight import background_refresh
+
+talent_catalog_index = CatalogIndex()
+
+
+async def refresh_talent_courses() -> None:
+    """Refresh cached courses for talent on own sessions, out of request."""
+    async with async_session_factory() as db_session, aioredis.Redis(connection_pool=pool) as cache_session:
+        course_repo = SQLAlchemyCourseRepository(db_session)
+        course_cache_service = TwoTierCourseCacheService(cache_session, "talent")
+        query_service = TalentCourseQueryService(course_repo, course_cache_service, talent_catalog_index)
+        await query_service.refresh_courses()
+
+
+def schedule_talent_courses_refresh() -> None:
+    """Refresh stale cached courses for talent in background."""
+    background_refresh.schedule("talent-courses", refresh_talent_courses)
 
 
 def get_talent_courses_query_service(
@@ -22,8 +41,10 @@ def get_talent_courses_query_service(
     :return:
     """
     course_repo = SQLAlchemyCourseRepository(db_session)
-    course_cache_service = RedisCourseCacheService(cache_session, "talent")
-    return TalentCourseQueryService(course_repo, course_cache_service)
+    course_cache_service = TwoTierCourseCacheService(cache_session, "talent")
+    return TalentCourseQueryService(
+        course_repo, course_cache_service, talent_catalog_index, schedule_talent_courses_refresh,
+    )
 
 
 def get_courses_command_service(
@@ -6,32 +6,82 @@ from fastapi import APIRouter, Depends, Query, status
 from fastapi.responses import JSONResponse
 
 from src.api.auth.dependencies import get_user
-from src.api.base_pagination import PaginationError, Paginator
+from src.api.base_pagination import CursorPaginator, CursorSortError, PaginationError, Paginator
 from src.api.base_schemas import ErrorResponse
 from src.api.courses.dependencies import get_talent_courses_query_service
 from src.api.courses.schemas import (
+    CourseFacetsResponse,
     CourseFavoriteStatusResponse,
     CourseFullDTO,
     CourseShortDTO,
     CoursesPaginationResponse,
 )
 from src.api.favorite_courses.dependencies import get_favorite_courses_command_service
+from src.api.feedback.dependencies import get_feedback_query_service
+from src.domain.courses.constants import COURSE_SORTS
 from src.domain.courses.entities import CourseEntity
-from src.domain.courses.exceptions import CourseNotFoundError
-from src.services.courses.query_service_for_talent import CourseFilter
+from src.domain.courses.exceptions import CourseNotFoundError, ValueDoesntExistError
+from src.domain.courses.filters import CourseFilter
 
 if TYPE_CHECKING:
     from src.domain.auth.entities import UserEntity
+    from src.domain.feedback.entities import CourseRatingEntity
     from src.services.courses.query_service_for_talent import TalentCourseQueryService
     from src.services.favorite_courses.command_service import FavoriteCoursesCommandService
+    from src.services.feedback.query_service import FeedbackQueryService
 
 router = APIRouter(prefix="/courses", tags=["courses"])
 
+COURSES_PAGE_SIZE = 9
+SEARCH_MAX_LIMIT = 50
+
+
+def get_course_cursor_key(course: CourseEntity) -> list[str]:
+    """Get keyset of course for cursor pagination.
+
+    :param course:
+    :return:
+    """
+    return [course.name.value, course.id.value]
+
+
+def check_course_sort(sort: str, cursor: str | None) -> None:
+    """Check sort of courses, cursor pages are sorted only by name.
+
+    :param sort:
+    :param cursor:
+    :return:
+    """
+    if sort not in COURSE_SORTS:
+        raise ValueDoesntExistError(property_name="sort")
+    if cursor is not None and sort != "name":
+        raise CursorSortError
+
+
+def sort_courses_by_rating(courses: list[CourseEntity], ratings: dict[str, CourseRatingEntity]) -> list[CourseEntity]:
+    """Sort courses by weighted average rating, then by number of feedbacks, courses without feedbacks are the last.
+
+    Sort is stable, so courses with the same rating keep their order.
+
+    :param courses:
+    :param ratings: summaries of ratings by ids of courses
+    :return:
+    """
+
+    def get_key(course: CourseEntity) -> tuple[bool, float, int]:
+        rating = ratings[course.id.value]
+        if rating.weighted_average is None:
+            return True, 0, 0
+        return False, -rating.weighted_average, -rating.count
+
+    return sorted(courses, key=get_key)
+
 
 @router.get(
     "",
     status_code=status.HTTP_200_OK,
-    description="Get all available courses",
+    description="Get all available courses. Pass cursor (empty for the first page) to use keyset pagination. "
+                "Courses are sorted by name or by rating, pages sorted by rating have numbers, not cursors",
     summary="Get courses",
     responses={
         status.HTTP_200_OK: {
@@ -42,6 +92,10 @@ router = APIRouter(prefix="/courses", tags=["courses"])
             "model": ErrorResponse,
             "description": "Error with page",
         },
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {
+            "model": ErrorResponse,
+            "description": "Unknown sort",
+        },
     },
     response_model=list[CourseShortDTO],
 )
@@ -52,34 +106,63 @@ async def get_courses(
         formats: list[str] = Query(None),
         query: str = Query(None),
         page: int = Query(1),
+        cursor: str = Query(None),
+        sort: str = Query("name"),
         *,
         only_actual: bool = Query(default=False),
         query_service: TalentCourseQueryService = Depends(get_talent_courses_query_service),
+        feedback_query_service: FeedbackQueryService = Depends(get_feedback_query_service),
 ) -> JSONResponse:
     """Get courses.
 
     :param only_actual:
     :param page:
+    :param cursor:
+    :param sort: name or rating
     :param terms:
     :param roles:
     :param implementers:
     :param formats:
     :param query:
     :param query_service:
+    :param feedback_query_service:
     :return:
     """
     filters = CourseFilter(
         terms=terms, roles=roles, implementers=implementers,
         formats=formats, only_actual=only_actual, query=query,
     )
-    courses = await query_service.get_courses(filters)
-    paginator = Paginator[CourseEntity](data=courses, page_size=9)
+    cursor_paginator = CursorPaginator[CourseEntity](
+        page_size=COURSES_PAGE_SIZE, key=get_course_cursor_key, key_size=2,
+    )
     try:
+        check_course_sort(sort, cursor)
+        ratings = None
+        if cursor is not None:
+            after = cursor_paginator.decode(cursor)
+            courses = await query_service.get_courses_page(filters, after, cursor_paginator.limit)
+            courses, next_cursor = cursor_paginator.get_page(courses)
+            max_page = None
+        else:
+            courses = await query_service.get_courses(filters)
+            if sort == "rating":
+                # summaries of the whole catalog are loaded at once, feedbacks are not read
+                ratings = await feedback_query_service.get_course_ratings([course.id.value for course in courses])
+                courses = sort_courses_by_rating(courses, ratings)
+            paginator = Paginator[CourseEntity](data=courses, page_size=COURSES_PAGE_SIZE)
+            courses = paginator.get_data_by_page(page)
+            next_cursor = None
+            if sort == "name" and page < paginator.max_page:
+                next_cursor = cursor_paginator.encode(get_course_cursor_key(courses[-1]))
+            max_page = paginator.max_page
+        if ratings is None:
+            ratings = await feedback_query_service.get_course_ratings([course.id.value for course in courses])
         return JSONResponse(
             status_code=status.HTTP_200_OK,
             content=CoursesPaginationResponse(
-                courses=[CourseShortDTO.from_domain(course) for course in paginator.get_data_by_page(page)],
-                max_page=paginator.pages[-1],
+                courses=[CourseShortDTO.from_domain(course, ratings[course.id.value]) for course in courses],
+                max_page=max_page,
+                next_cursor=next_cursor,
             ).model_dump(),
         )
     except PaginationError as ex:
@@ -87,6 +170,92 @@ async def get_courses(
             content=ErrorResponse(message=ex.message).model_dump(),
             status_code=status.HTTP_400_BAD_REQUEST,
         )
+    except ValueDoesntExistError as ex:
+        return JSONResponse(
+            content=ErrorResponse(message=ex.message).model_dump(),
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        )
+
+
+@router.get(
+    "/search",
+    status_code=status.HTTP_200_OK,
+    description="Search published courses by name, description and topics with typo tolerance",
+    summary="Search courses",
+    responses={
+        status.HTTP_200_OK: {
+            "model": list[CourseShortDTO],
+            "description": "Found courses, the most relevant first",
+        },
+    },
+    response_model=list[CourseShortDTO],
+)
+async def search_courses(
+        query: str = Query(),
+        limit: int = Query(COURSES_PAGE_SIZE, ge=1, le=SEARCH_MAX_LIMIT),
+        query_service: TalentCourseQueryService = Depends(get_talent_courses_query_service),
+        feedback_query_service: FeedbackQueryService = Depends(get_feedback_query_service),
+) -> JSONResponse:
+    """Search courses.
+
+    :param query:
+    :param limit:
+    :param query_service:
+    :param feedback_query_service:
+    :return:
+    """
+    courses = await query_service.search_courses(query, limit)
+    ratings = await feedback_query_service.get_course_ratings([course.id.value for course in courses])
+    return JSONResponse(
+        content=[CourseShortDTO.from_domain(course, ratings[course.id.value]).model_dump() for course in courses],
+        status_code=status.HTTP_200_OK,
+    )
+
+
+@router.get(
+    "/facets",
+    status_code=status.HTTP_200_OK,
+    description="Get numbers of published courses for every role, implementer, format and term under filters. "
+                "Values of the facet are counted without its own filter, as they are alternatives",
+    summary="Get facets of courses",
+    responses={
+        status.HTTP_200_OK: {
+            "model": CourseFacetsResponse,
+            "description": "Numbers of courses, values without courses are omitted",
+        },
+    },
+    response_model=CourseFacetsResponse,
+)
+async def get_course_facets(
+        terms: list[str] = Query(None),
+        roles: list[str] = Query(None),
+        implementers: list[str] = Query(None),
+        formats: list[str] = Query(None),
+        query: str = Query(None),
+        *,
+        only_actual: bool = Query(default=False),
+        query_service: TalentCourseQueryService = Depends(get_talent_courses_query_service),
+) -> JSONResponse:
+    """Get facets of courses.
+
+    :param only_actual:
+    :param terms:
+    :param roles:
+    :param implementers:
+    :param formats:
+    :param query:
+    :param query_service:
+    :return:
+    """
+    filters = CourseFilter(
+        terms=terms, roles=roles, implementers=implementers,
+        formats=formats, only_actual=only_actual, query=query,
+    )
+    counts = await query_service.count_facets(filters)
+    return JSONResponse(
+        content=CourseFacetsResponse(**counts).model_dump(),
+        status_code=status.HTTP_200_OK,
+    )
 
 
 @router.get(
@@ -109,17 +278,20 @@ async def get_courses(
 async def get_course(
         course_id: str,
         query_service: TalentCourseQueryService = Depends(get_talent_courses_query_service),
+        feedback_query_service: FeedbackQueryService = Depends(get_feedback_query_service),
 ) -> JSONResponse:
     """Get courses.
 
     :param course_id:
     :param query_service:
+    :param feedback_query_service:
     :return:
     """
     try:
         course = await query_service.get_course(course_id)
+        ratings = await feedback_query_service.get_course_ratings([course.id.value])
         return JSONResponse(
-            content=CourseFullDTO.from_domain(course).model_dump(),
+            content=CourseFullDTO.from_domain(course, ratings[course.id.value]).model_dump(),
             status_code=status.HTTP_200_OK,
         )
     except CourseNotFoundError as ex:
@@ -4,8 +4,11 @@ from typing import TYPE_CHECKING
 
 from pydantic import BaseModel, Field
 
+from src.api.feedback.schemas import CourseRatingDTO
+
 if TYPE_CHECKING:
     from src.domain.courses.entities import CourseEntity
+    from src.domain.feedback.entities import CourseRatingEntity
 
 
 class ResourceDTO(BaseModel):
@@ -40,9 +43,10 @@ class CourseFullDTO(BaseModel):
     roles: list[str] = Field(["AI Product Manager"])
     periods: list[str] = Field(["Сентябрь", "Октябрь"])
     last_runs: list[str] = Field(["Весна 2023"])
+    rating: CourseRatingDTO | None = Field(default=None)
 
     @staticmethod
-    def from_domain(course: CourseEntity) -> CourseFullDTO:
+    def from_domain(course: CourseEntity, rating: CourseRatingEntity | None = None) -> CourseFullDTO:
         return CourseFullDTO(
             id=course.id.value,
             name=course.name.value,
@@ -64,6 +68,7 @@ class CourseFullDTO(BaseModel):
             roles=[role.value for role in course.roles],
             periods=[period.value for period in course.periods],
             last_runs=[run.value for run in course.last_runs],
+            rating=None if rating is None else CourseRatingDTO.from_domain(rating),
         )
 
 
@@ -79,9 +84,10 @@ class CourseShortDTO(BaseModel):
     format: str | None = Field("online-курс")
     roles: list[str] = Field(["AI Product Manager"])
     last_runs: list[str] = Field(["Весна 2023"])
+    rating: CourseRatingDTO | None = Field(default=None)
 
     @staticmethod
-    def from_domain(course: CourseEntity) -> CourseShortDTO:
+    def from_domain(course: CourseEntity, rating: CourseRatingEntity | None = None) -> CourseShortDTO:
         return CourseShortDTO(
             id=course.id.value,
             name=course.name.value,
@@ -91,6 +97,7 @@ class CourseShortDTO(BaseModel):
             format=course.format.value if course.format else None,
             roles=[role.value for role in course.roles],
             last_runs=[run.value for run in course.last_runs],
+            rating=None if rating is None else CourseRatingDTO.from_domain(rating),
         )
 
 
@@ -99,7 +106,18 @@ class CoursesPaginationResponse(BaseModel):
     """Schema of courses pagination."""
 
     courses: list[CourseShortDTO]
-    max_page: int
+    max_page: int | None
+    next_cursor: str | None = Field(default=None)
+
+
+class CourseFacetsResponse(BaseModel):
+
+    """Schema of numbers of courses for every value of facets."""
+
+    roles: dict[str, int] = Field({"AI Product Manager": 4})
+    implementers: dict[str, int] = Field({"ИПКН": 7})
+    formats: dict[str, int] = Field({"online-курс": 3})
+    terms: dict[str, int] = Field({"1": 5, "3": 2})
 
 
 class CourseFavoriteStatusResponse(BaseModel):
@@ -10,11 +10,11 @@ from src.api.base_schemas import ErrorResponse, SuccessResponse
 from src.api.courses.dependencies import get_talent_courses_query_service
 from src.api.favorite_courses.dependencies import get_favorite_courses_command_service
 from src.api.favorite_courses.schemas import AddFavoriteCourseRequest, FavoriteCourseDTO
+from src.domain.courses.filters import CourseFilter
 from src.domain.favorite_courses.exceptions import (
     CourseAlreadyExistsInFavoritesError,
     CourseDoesntExistInFavoritesError,
 )
-from src.services.courses.query_service_for_talent import CourseFilter
 
 if TYPE_CHECKING:
     from src.domain.auth.entities import UserEntity
@@ -1,14 +1,35 @@
 from fastapi import Depends
+from redis import asyncio as aioredis
 from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.infrastructure.redis.feedback.feedback_cache_service import RedisFeedbackCacheService
-from src.infrastructure.redis.session import get_redis_session
+from src.infrastructure.redis.feedback.two_tier_cache_service import TwoTierFeedbackCacheService
+from src.infrastructure.redis.session import get_redis_session, pool
 from src.infrastructure.sqlalchemy.feedback.repository import SQLAlchemyFeedbackRepository
 from src.infrastructure.sqlalchemy.feedback.unit_of_work import SQLAlchemyFeedbackUnitOfWork
-from src.infrastructure.sqlalchemy.session import get_async_session
+from src.infrastructure.sqlalchemy.session import async_session_factory, get_async_session
 from src.services.feedback.command_service import FeedbackCommandService
 from src.services.feedback.query_service import FeedbackQueryService
+from src.services.single_flight import background_refresh
+
+
+async def refresh_feedbacks(course_id: str) -> None:
+    """Refresh cached feedbacks of course on own sessions, out of request.
+
+    :param course_id:
+    """
+    async with async_session_factory() as db_session, aioredis.Redis(connection_pool=pool) as cache_session:
+        feedback_repo = SQLAlchemyFeedbackRepository(db_session)
+        feedback_cache_service = TwoTierFeedbackCacheService(cache_session)
+        await FeedbackQueryService(feedback_repo, feedback_cache_service).refresh_feedbacks(course_id)
+
+
+def schedule_feedbacks_refresh(course_id: str) -> None:
+    """Refresh stale cached feedbacks of course in background.
+
+    :param course_id:
+    """
+    background_refresh.schedule("feedbacks-" + course_id, lambda: refresh_feedbacks(course_id))
 
 
 def get_feedback_query_service(
@@ -22,8 +43,8 @@ def get_feedback_query_service(
     :return:
     """
     feedback_repo = SQLAlchemyFeedbackRepository(db_session)
-    feedback_cache_service = RedisFeedbackCacheService(cache_session)
-    return FeedbackQueryService(feedback_repo, feedback_cache_service)
+    feedback_cache_service = TwoTierFeedbackCacheService(cache_session)
+    return FeedbackQueryService(feedback_repo, feedback_cache_service, schedule_feedbacks_refresh)
 
 
 def get_feedback_command_service(
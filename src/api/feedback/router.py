@@ -1,15 +1,27 @@
 from __future__ import annotations
 
+import datetime
+import functools
+import uuid
 from typing import TYPE_CHECKING
 
-from fastapi import APIRouter, Body, Depends, status
+from fastapi import APIRouter, Body, Depends, Query, status
 from fastapi.responses import JSONResponse
 
 from src.api.auth.dependencies import get_user, get_user_or_anonym
+from src.api.base_pagination import CursorPaginator, InvalidCursorError, PaginationError
 from src.api.base_schemas import ErrorResponse, SuccessResponse
 from src.api.feedback.dependencies import get_feedback_command_service, get_feedback_query_service
-from src.api.feedback.schemas import CreateFeedbackRequest, CreateFeedbackResponse, FeedbackDTO, VoteDTO
+from src.api.feedback.schemas import (
+    CreateFeedbackRequest,
+    CreateFeedbackResponse,
+    FeedbackDTO,
+    FeedbacksPaginationResponse,
+    VoteDTO,
+)
 from src.domain.courses.exceptions import EmptyPropertyError, ValueDoesntExistError
+from src.domain.feedback.contants import FEEDBACK_SORTS
+from src.domain.feedback.entities import FeedbackEntity
 from src.domain.feedback.exceptions import (
     FeedbackBelongsToAnotherUserError,
     FeedbackLikeError,
@@ -26,34 +38,132 @@ if TYPE_CHECKING:
 router = APIRouter(prefix="/courses", tags=["courses"])
 
 
+FEEDBACKS_PAGE_SIZE = 10
+
+
+def get_feedback_cursor_key(feedback: FeedbackEntity, sort: str) -> list[str]:
+    """Get keyset of feedback in order of sort for cursor pagination.
+
+    :param feedback:
+    :param sort:
+    :return:
+    """
+    key = [feedback.date.isoformat(), feedback.id.value]
+    if sort == "rating":
+        return [str(feedback.rating.value), *key]
+    if sort == "reputation":
+        return [str(feedback.reputation), *key]
+    return key
+
+
+def get_feedback_cursor_paginator(sort: str) -> CursorPaginator[FeedbackEntity]:
+    """Get cursor paginator of feedbacks in order of sort.
+
+    :param sort:
+    :return:
+    """
+    if sort not in FEEDBACK_SORTS:
+        raise ValueDoesntExistError(property_name="sort")
+    return CursorPaginator[FeedbackEntity](
+        page_size=FEEDBACKS_PAGE_SIZE,
+        key=functools.partial(get_feedback_cursor_key, sort=sort),
+        key_size=2 if sort == "newest" else 3,
+    )
+
+
+def check_feedback_cursor_key(after: list[str] | None) -> None:
+    """Check values of decoded keyset of feedback.
+
+    :param after:
+    :return:
+    """
+    if after is None:
+        return
+    *scores, date, feedback_id = after
+    try:
+        [int(score) for score in scores]
+        datetime.date.fromisoformat(date)
+        uuid.UUID(feedback_id)
+    except ValueError as ex:
+        raise InvalidCursorError from ex
+
+
 @router.get(
     "/{course_id}/feedbacks",
     status_code=status.HTTP_200_OK,
-    description="Get feedback information about course",
+    description="Get feedback information about course. Pass cursor (empty for the first page) "
+                "to get pages of feedbacks sorted by newest, reputation or rating",
     summary="Get feedbacks for course",
     responses={
         status.HTTP_200_OK: {
-            "model": list[FeedbackDTO],
-            "description": "Feedbacks for one course",
+            "model": list[FeedbackDTO] | FeedbacksPaginationResponse,
+            "description": "Feedbacks for one course, page of them if cursor is passed",
+        },
+        status.HTTP_400_BAD_REQUEST: {
+            "model": ErrorResponse,
+            "description": "Error with page",
+        },
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {
+            "model": ErrorResponse,
+            "description": "Unknown sort",
         },
     },
-    response_model=list[FeedbackDTO],
+    response_model=list[FeedbackDTO] | FeedbacksPaginationResponse,
 )
 async def get_feedbacks(
     course_id: str,
+    cursor: str = Query(None),
+    sort: str = Query("newest"),
     user: UserEntity | None = Depends(get_user_or_anonym),
     query_service:  FeedbackQueryService = Depends(get_feedback_query_service),
-) -> list[FeedbackDTO]:
+) -> JSONResponse:
     """Get feedbacks.
 
-    :param user:
     :param course_id:
+    :param cursor:
+    :param sort: newest, reputation or rating
+    :param user:
     :param query_service:
     :return:
     """
-    feedbacks = await query_service.get_feedbacks_by_course_id(course_id)
-
-    return [FeedbackDTO.from_domain(feedback, None if user is None else user.id.value) for feedback in feedbacks]
+    user_id = None if user is None else user.id.value
+    # lists are the same for every user, votes of user are looked up separately
+    user_votes = {} if user_id is None else await query_service.get_user_votes(course_id, user_id)
+    if cursor is None:
+        feedbacks = await query_service.get_feedbacks_by_course_id(course_id)
+        return JSONResponse(
+            content=[
+                FeedbackDTO.from_domain(feedback, user_id, user_votes.get(feedback.id.value)).model_dump()
+                for feedback in feedbacks
+            ],
+            status_code=status.HTTP_200_OK,
+        )
+    try:
+        cursor_paginator = get_feedback_cursor_paginator(sort)
+        after = cursor_paginator.decode(cursor)
+        check_feedback_cursor_key(after)
+        feedbacks = await query_service.get_feedbacks_page(course_id, sort, after, cursor_paginator.limit)
+        feedbacks, next_cursor = cursor_paginator.get_page(feedbacks)
+        return JSONResponse(
+            content=FeedbacksPaginationResponse(
+                feedbacks=[
+                    FeedbackDTO.from_domain(feedback, user_id, user_votes.get(feedback.id.value))
+                    for feedback in feedbacks
+                ],
+                next_cursor=next_cursor,
+            ).model_dump(),
+            status_code=status.HTTP_200_OK,
+        )
+    except PaginationError as ex:
+        return JSONResponse(
+            content=ErrorResponse(message=ex.message).model_dump(),
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+    except ValueDoesntExistError as ex:
+        return JSONResponse(
+            content=ErrorResponse(message=ex.message).model_dump(),
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        )
 
 
 @router.post(
@@ -210,8 +320,8 @@ async def unvote_feedback(
     :return:
     """
     try:
-        await command_service.unvote(feedback_id, user.id.value)
-        await query_service.invalidate_course(course_id)
+        feedback = await command_service.unvote(feedback_id, user.id.value)
+        await query_service.update_votes_in_cache(feedback, user.id.value)
         return JSONResponse(
             content=SuccessResponse(message="Оценка с отзыва убрана").model_dump(),
             status_code=status.HTTP_200_OK,
@@ -277,8 +387,8 @@ async def vote_feedback(
     :return:
     """
     try:
-        await command_service.vote(feedback_id, user.id.value, data.vote_type)
-        await query_service.invalidate_course(course_id)
+        feedback = await command_service.vote(feedback_id, user.id.value, data.vote_type)
+        await query_service.update_votes_in_cache(feedback, user.id.value)
         return JSONResponse(
             content=SuccessResponse(message="Оценка отзыва выполнена").model_dump(),
             status_code=status.HTTP_200_OK,
@@ -4,11 +4,10 @@ from typing import TYPE_CHECKING
 
 from pydantic import BaseModel, Field
 
-from src.domain.base_value_objects import UUID
-from src.domain.feedback.value_objects import Vote
+from src.domain.feedback.contants import MIN_RATING_VALUE
 
 if TYPE_CHECKING:
-    from src.domain.feedback.entities import FeedbackEntity
+    from src.domain.feedback.entities import CourseRatingEntity, FeedbackEntity
 
 class FeedbackDTO(BaseModel):
 
@@ -24,19 +23,46 @@ class FeedbackDTO(BaseModel):
     reputation: int = Field(3)
 
     @staticmethod
-    def from_domain(feedback: FeedbackEntity, user_id: str | None) -> FeedbackDTO:
+    def from_domain(feedback: FeedbackEntity, user_id: str | None, vote_type: str | None = None) -> FeedbackDTO:
         return FeedbackDTO(
             id=feedback.id.value,
             text=feedback.text.value,
             rating=feedback.rating.value,
             is_author=False if user_id is None else feedback.author_id == user_id,
-            liked_by_user=False if user_id is None else Vote(UUID(user_id), "like") in feedback.votes,
-            disliked_by_user=False if user_id is None else Vote(UUID(user_id), "dislike") in feedback.votes,
+            liked_by_user=vote_type == "like",
+            disliked_by_user=vote_type == "dislike",
             date=feedback.date.strftime("%Y-%m-%d"),
             reputation=feedback.reputation,
         )
 
 
+class FeedbacksPaginationResponse(BaseModel):
+
+    """Schema of feedbacks pagination."""
+
+    feedbacks: list[FeedbackDTO]
+    next_cursor: str | None = Field(default=None)
+
+
+class CourseRatingDTO(BaseModel):
+
+    """Schema of summary of ratings for course."""
+
+    count: int = Field(4)
+    average: float | None = Field(4.25)
+    weighted_average: float | None = Field(4.6)
+    histogram: dict[str, int] = Field({"1": 0, "2": 0, "3": 1, "4": 1, "5": 2})
+
+    @staticmethod
+    def from_domain(rating: CourseRatingEntity) -> CourseRatingDTO:
+        return CourseRatingDTO(
+            count=rating.count,
+            average=None if rating.average is None else round(rating.average, 2),
+            weighted_average=None if rating.weighted_average is None else round(rating.weighted_average, 2),
+            histogram={str(value): count for value, count in enumerate(rating.histogram, start=MIN_RATING_VALUE)},
+        )
+
+
 class CreateFeedbackRequest(BaseModel):
 
     """Schema of request for creating feedback."""
@@ -1,4 +1,5 @@
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Request, status
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 
 router = APIRouter(tags=["monitoring"])
@@ -29,3 +30,33 @@ def health_check() -> Health:
     :return: Health
     """
     return Health(status="ok")
+
+
+@router.get(
+    "/readiness_check",
+    status_code=status.HTTP_200_OK,
+    description="Check that service has warmed up and is ready to get traffic",
+    summary="Readiness check",
+    responses={
+        status.HTTP_200_OK: {
+            "model": Health,
+            "description": "Service is ready",
+        },
+        status.HTTP_503_SERVICE_UNAVAILABLE: {
+            "model": Health,
+            "description": "Service is warming up",
+        },
+    },
+)
+def readiness_check(request: Request) -> JSONResponse:
+    """Check readiness of service.
+
+    :param request:
+    :return: JSONResponse
+    """
+    if not getattr(request.app.state, "is_ready", False):
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content=Health(status="warming up").model_dump(),
+        )
+    return JSONResponse(status_code=status.HTTP_200_OK, content=Health(status="ok").model_dump())
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from typing import TYPE_CHECKING
+
+from redis import asyncio as aioredis
+from sqlalchemy import text
+
+from src.api.courses.dependencies import talent_catalog_index
+from src.config import app_config
+from src.domain.courses.filters import CourseFilter
+from src.infrastructure.redis.courses.two_tier_cache_service import TwoTierCourseCacheService
+from src.infrastructure.redis.feedback.two_tier_cache_service import TwoTierFeedbackCacheService
+from src.infrastructure.redis.local_cache import local_cache_invalidation
+from src.infrastructure.redis.session import pool
+from src.infrastructure.sqlalchemy.courses.repository import SQLAlchemyCourseRepository
+from src.infrastructure.sqlalchemy.feedback.repository import SQLAlchemyFeedbackRepository
+from src.infrastructure.sqlalchemy.session import async_engine, async_session_factory
+from src.services.courses.query_service_for_admin import AdminCourseQueryService
+from src.services.courses.query_service_for_talent import TalentCourseQueryService
+from src.services.feedback.query_service import FeedbackQueryService
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from fastapi import FastAPI
+
+logger = logging.getLogger(__name__)
+
+
+async def warm_up_pools(connections: int) -> None:
+    """Open connections of database and Redis pools before the first requests.
+
+    :param connections: number of connections opened in each pool
+    :return:
+    """
+
+    async def open_db_connection() -> None:
+        async with async_engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
+    async def open_cache_connection() -> None:
+        async with aioredis.Redis(connection_pool=pool) as session:
+            await session.ping()
+
+    await asyncio.gather(
+        *[open_db_connection() for _ in range(connections)],
+        *[open_cache_connection() for _ in range(connections)],
+    )
+
+
+async def warm_up_caches(feedback_courses: int) -> None:
+    """Fill catalogs of talent and admin, feedbacks of the most discussed courses.
+
+    :param feedback_courses: number of courses with cached feedbacks
+    :return:
+    """
+    async with async_session_factory() as db_session, aioredis.Redis(connection_pool=pool) as cache_session:
+        course_repo = SQLAlchemyCourseRepository(db_session)
+        talent_query_service = TalentCourseQueryService(
+            course_repo, TwoTierCourseCacheService(cache_session, "talent"), talent_catalog_index,
+        )
+        await talent_query_service.get_courses(CourseFilter())
+        admin_query_service = AdminCourseQueryService(course_repo, TwoTierCourseCacheService(cache_session, "admin"))
+        await admin_query_service.get_courses()
+        feedback_query_service = FeedbackQueryService(
+            SQLAlchemyFeedbackRepository(db_session), TwoTierFeedbackCacheService(cache_session),
+        )
+        await feedback_query_service.warm_up(feedback_courses)
+
+
+async def warm_up(application: FastAPI) -> None:
+    """Warm up pools and caches, then mark application as ready.
+
+    :param application:
+    :return:
+    """
+    try:
+        await warm_up_pools(app_config.WARM_UP_CONNECTIONS)
+        await warm_up_caches(app_config.WARM_UP_FEEDBACK_COURSES)
+    except Exception:
+        # cold worker still can serve requests, caches will be filled by them
+        logger.exception("Warm-up of application has failed")
+    application.state.is_ready = True
+
+
+@contextlib.asynccontextmanager
+async def lifespan(application: FastAPI) -> AsyncIterator[None]:
+    """Listen to invalidation of local caches and run warm-up in background.
+
+    Worker is alive during warm-up, but it is not ready until warm-up is done.
+
+    :param application:
+    :return:
+    """
+    application.state.is_ready = not app_config.WARM_UP_ENABLED
+    invalidation_task = asyncio.create_task(local_cache_invalidation.listen())
+    warm_up_task = asyncio.create_task(warm_up(application)) if app_config.WARM_UP_ENABLED else None
+    yield
+    invalidation_task.cancel()
+    if warm_up_task is not None:
+        warm_up_task.cancel()
@@ -10,6 +10,7 @@ from src.api.admin.playlists.router import router as admin_playlists_router
 from src.api.admin.timetable.router import router as admin_timetable_router
 from src.api.auth.router import router as auth_router
 from src.api.base_schemas import ErrorResponse
+from src.api.conditional_get import add_conditional_get
 from src.api.courses.router import router as course_router
 from src.api.favorite_courses.router import router as favorite_courses_router
 from src.api.feedback.router import router as feedback_router
@@ -17,6 +18,7 @@ from src.api.health_check import router as health_check_router
 from src.api.playlists.router import router as playlists_router
 from src.api.talent_profile.router import router as talent_profile_router
 from src.api.timetable.router import router as course_timetable_router
+from src.api.warm_up import lifespan
 from src.config import app_config
 from src.domain.base_exceptions import IncorrectUUIDError
 from src.exceptions import ApplicationError
@@ -98,11 +100,13 @@ def create_application() -> FastAPI:
         version="0.0.1",
         docs_url=None,
         redoc_url=None,
+        lifespan=lifespan,
     )
     if app_config.is_debug:
         add_custom_docs_endpoints(application)
     add_routers(application)
     add_exception_handler(application)
+    add_conditional_get(application)
     if app_config.is_debug:
         add_cors(application)
     return application
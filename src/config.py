@@ -29,6 +29,14 @@ class Config(BaseSettings):
 
     MODE: ApplicationMode = Field(default=ApplicationMode.PRODUCTION)
 
+    WARM_UP_ENABLED: bool = Field(default=True)
+    WARM_UP_CONNECTIONS: int = Field(default=5)
+    WARM_UP_FEEDBACK_COURSES: int = Field(default=20)
+
+    PASSWORD_HASH_ITERATIONS: int = Field(default=100_000)
+    PASSWORD_HASH_WORKERS: int = Field(default=2)
+    PASSWORD_HASH_MAX_PENDING: int = Field(default=32)
+
     @property
     def is_debug(self) -> bool:
         """Gets true if application in dev mode else false."""
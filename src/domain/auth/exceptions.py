@@ -56,6 +56,15 @@ class PasswordTooShortError(DomainError):
         return f"Password length must be greater than or equal to {PASSWORD_MIN_LENGTH} characters"
 
 
+class PasswordHashingBusyError(DomainError):
+
+    """Too many passwords are being hashed at the same time."""
+
+    @property
+    def message(self) -> str:
+        return "Too many logins at the same time, try again later"
+
+
 class WrongPasswordError(DomainError):
 
     """It is a wrong password."""
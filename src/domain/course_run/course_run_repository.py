@@ -27,3 +27,8 @@ class ICourseRunRepository(ABC):
     @abstractmethod
     async def get_all_by_course_id(self, course_id: UUID) -> list[CourseRunEntity]:
         raise NotImplementedError
+
+    @abstractmethod
+    async def get_actual_ids(self, seasons: list[tuple[str, int]]) -> dict[str, str]:
+        """Get ids of the latest created runs of all courses among runs of given seasons and years by course ids."""
+        raise NotImplementedError
@@ -19,10 +19,23 @@ class CourseRunEntity:
     name: CourseRun
 
     def is_actual_by_date(self, current_date: datetime.date) -> bool:
-        month, year = current_date.month, current_date.year
-        run_season, run_year = self.name.season, self.name.year
-        if run_season == "Осень":
-            # С предзаписи и до конца осеннего семестра
-            return year == run_year and month in (8, 9, 10, 11, 12) or year == run_year + 1 and month == 1
-        # С предзаписи и до конца весеннего семестра
-        return year == run_year and month in (1, 2, 3, 4, 5, 6, 7)
+        return (self.name.season, self.name.year) in get_actual_seasons(current_date)
+
+
+def get_actual_seasons(current_date: datetime.date) -> list[tuple[str, int]]:
+    """Get seasons and years of course runs which are actual at the date.
+
+    :param current_date:
+    :return: pairs of season and year
+    """
+    month, year = current_date.month, current_date.year
+    seasons = []
+    # С предзаписи и до конца осеннего семестра
+    if month in (8, 9, 10, 11, 12):
+        seasons.append(("Осень", year))
+    if month == 1:
+        seasons.append(("Осень", year - 1))
+    # С предзаписи и до конца весеннего семестра
+    if month in (1, 2, 3, 4, 5, 6, 7):
+        seasons.append(("Весна", year))
+    return seasons
@@ -16,3 +16,4 @@ PERIODS = [
 ]
 COURSE_RUN_FROM_YEAR, COURSE_RUN_TO_YEAR = 2020, 2030
 COURSE_RUN_SEASONS = ["Осень", "Весна"]
+COURSE_SORTS = ["name", "rating"]
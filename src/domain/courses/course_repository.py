@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from src.domain.base_value_objects import UUID
     from src.domain.courses.entities import CourseEntity
+    from src.domain.courses.filters import CourseFilter
     from src.domain.courses.value_objects import CourseName
 
 class ICourseRepository(ABC):
@@ -20,6 +21,11 @@ class ICourseRepository(ABC):
     async def update(self, course: CourseEntity) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def save_many(self, courses: list[CourseEntity]) -> None:
+        """Create courses or replace existing courses with the same ids."""
+        raise NotImplementedError
+
     @abstractmethod
     async def update_draft_status(self, course: CourseEntity) -> None:
         raise NotImplementedError
@@ -39,3 +45,15 @@ class ICourseRepository(ABC):
     @abstractmethod
     async def get_all(self) -> list[CourseEntity]:
         raise NotImplementedError
+
+    @abstractmethod
+    async def get_page(
+            self, filters: CourseFilter, actual_run: str, after: list[str] | None, limit: int,
+    ) -> list[CourseEntity]:
+        """Get published courses ordered by name and id, starting after the (name, id) key."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def search(self, query: str, limit: int) -> list[CourseEntity]:
+        """Get published courses matched by full-text query or similar name, the most relevant first."""
+        raise NotImplementedError
@@ -64,3 +64,16 @@ class CourseAlreadyExistsError(DomainError):
     @property
     def message(self) -> str:
         return "Course with this name already exists"
+
+
+@dataclass
+class CourseImportError(DomainError):
+
+    """Line of imported courses is not valid."""
+
+    line: int
+    error_message: str
+
+    @property
+    def message(self) -> str:
+        return f"Line {self.line}: {self.error_message}"
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+
+
+@dataclass
+class CourseFilter:
+
+    """Class for filters on courses."""
+
+    implementers: list[str] | None = field(default=None)
+    formats: list[str] | None = field(default=None)
+    terms: list[str] | None = field(default=None)
+    roles: list[str] | None = field(default=None)
+    query: str | None = field(default=None)
+    only_actual: bool = field(default=False)
+
+    def get_key(self) -> str:
+        """Get canonical key of filters: filters with the same values in any order have the same key."""
+        return json.dumps([
+            sorted(set(self.implementers or [])),
+            sorted(set(self.formats or [])),
+            sorted(set(self.terms or [])),
+            sorted(set(self.roles or [])),
+            self.query.lower() if self.query else None,
+            self.only_actual,
+        ], ensure_ascii=False)
@@ -1,3 +1,4 @@
 VOTE_TYPES = ["like", "dislike"]
 MAX_RATING_VALUE = 5
 MIN_RATING_VALUE = 1
+FEEDBACK_SORTS = ["newest", "reputation", "rating"]
@@ -4,6 +4,7 @@ import datetime
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
+from src.domain.feedback.contants import MAX_RATING_VALUE, MIN_RATING_VALUE
 from src.domain.feedback.exceptions import FeedbackLikeError
 from src.domain.feedback.value_objects import FeedbackText, Rating, Vote
 
@@ -20,14 +21,25 @@ class FeedbackEntity:
     author_id: UUID
     text: FeedbackText
     rating: Rating
-    votes: set[Vote] = field(default_factory=list)
+    votes: set[Vote] = field(default_factory=set)
     date: datetime.date = field(default_factory=datetime.date.today)
+    # counters are stored with feedback, so lists of feedbacks are read without votes
+    like_count: int | None = field(default=None)
+    dislike_count: int | None = field(default=None)
+
+    def __post_init__(self) -> None:
+        """Count votes if counters are not passed."""
+        if self.like_count is None:
+            self.like_count = sum(1 for vote in self.votes if vote.vote_type == "like")
+        if self.dislike_count is None:
+            self.dislike_count = sum(1 for vote in self.votes if vote.vote_type == "dislike")
 
     def unvote(self, user_id: UUID) -> None:
-        vote = Vote(user_id, "like")
-        alternative_vote = Vote(user_id, "dislike")
-        self.votes.discard(vote)
-        self.votes.discard(alternative_vote)
+        for vote_type in ("like", "dislike"):
+            vote = Vote(user_id, vote_type)
+            if vote in self.votes:
+                self.votes.remove(vote)
+                self.__count_vote(vote_type, -1)
 
     def vote(self, user_id: UUID, vote_type: str) -> None:
         alternative_vote_type = "dislike" if vote_type == "like" else "like"
@@ -39,14 +51,47 @@ class FeedbackEntity:
             raise FeedbackLikeError(error_message="Отзыв уже оценен")
         if alternative_vote in self.votes:
             self.votes.remove(alternative_vote)
-            self.votes.add(vote)
+            self.__count_vote(alternative_vote_type, -1)
+        self.votes.add(vote)
+        self.__count_vote(vote_type, 1)
+
+    def __count_vote(self, vote_type: str, delta: int) -> None:
+        if vote_type == "like":
+            self.like_count += delta
         else:
-            self.votes.add(vote)
+            self.dislike_count += delta
 
     @property
     def reputation(self) -> int:
-        reputation = 0
-        for vote in self.votes:
-            signed_vote = 1 if vote.vote_type == "like" else -1
-            reputation += signed_vote
-        return reputation
+        return self.like_count - self.dislike_count
+
+    @property
+    def weight(self) -> int:
+        return get_feedback_weight(self.reputation)
+
+
+def get_feedback_weight(reputation: int) -> int:
+    """Get weight of rating in weighted average rating of course, every feedback counts at least once."""
+    return 1 + max(reputation, 0)
+
+
+@dataclass
+class CourseRatingEntity:
+
+    """Summary of ratings of feedbacks for course, it is changed with every feedback and vote."""
+
+    course_id: UUID
+    count: int = field(default=0)
+    rating_sum: int = field(default=0)
+    # numbers of feedbacks with every rating from the least to the greatest one
+    histogram: list[int] = field(default_factory=lambda: [0] * (MAX_RATING_VALUE - MIN_RATING_VALUE + 1))
+    weighted_rating_sum: int = field(default=0)
+    weight_sum: int = field(default=0)
+
+    @property
+    def average(self) -> float | None:
+        return self.rating_sum / self.count if self.count else None
+
+    @property
+    def weighted_average(self) -> float | None:
+        return self.weighted_rating_sum / self.weight_sum if self.weight_sum else None
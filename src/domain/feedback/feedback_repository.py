@@ -5,7 +5,8 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from src.domain.base_value_objects import UUID
-    from src.domain.feedback.entities import FeedbackEntity
+    from src.domain.feedback.entities import CourseRatingEntity, FeedbackEntity
+    from src.domain.feedback.value_objects import Vote
 
 
 class IFeedbackRepository(ABC):
@@ -21,13 +22,49 @@ class IFeedbackRepository(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def update_votes(self, feedback: FeedbackEntity) -> None:
+    async def set_vote(self, feedback_id: UUID, vote: Vote) -> tuple[int, int]:
+        """Add vote of user or change its type, get changed counters of likes and dislikes."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_vote(self, feedback_id: UUID, user_id: UUID) -> tuple[int, int]:
+        """Delete vote of user if it exists, get changed counters of likes and dislikes."""
         raise NotImplementedError
 
     @abstractmethod
     async def get_one_by_id(self, feedback_id: UUID) -> FeedbackEntity:
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_one_by_id_with_user_vote(self, feedback_id: UUID, user_id: UUID) -> FeedbackEntity:
+        """Get feedback with counters of votes, only vote of user is loaded."""
+        raise NotImplementedError
+
     @abstractmethod
     async def get_all_by_course_id(self, course_id: UUID) -> list[FeedbackEntity]:
         raise NotImplementedError
+
+    @abstractmethod
+    async def get_page_by_course_id(
+            self, course_id: UUID, sort: str, after: list[str] | None, limit: int,
+    ) -> list[FeedbackEntity]:
+        """Get feedbacks of course in order of sort, starting after the key of sort.
+
+        Keys are (date, id) for newest, (rating, date, id) for rating, (reputation, date, id) for reputation.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_user_votes(self, course_id: UUID, user_id: UUID) -> dict[str, str]:
+        """Get types of votes of user for feedbacks of course by ids of feedbacks."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_course_ratings(self, course_ids: list[UUID]) -> list[CourseRatingEntity]:
+        """Get summaries of ratings in order of courses, summaries of courses without feedbacks are empty."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_most_discussed_course_ids(self, limit: int) -> list[UUID]:
+        """Get ids of courses with the largest number of feedbacks."""
+        raise NotImplementedError
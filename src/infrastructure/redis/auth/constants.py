@@ -0,0 +1,2 @@
+LOCAL_TIME_TO_LIVE_SESSIONS = 30
+LOCAL_MAX_SESSIONS = 10000
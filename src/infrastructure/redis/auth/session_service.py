@@ -1,6 +1,3 @@
-import json
-from json.decoder import JSONDecodeError
-
 from redis.asyncio import Redis
 
 from src.domain.auth.constants import TIME_TO_LIVE_AUTH_SESSION
@@ -8,6 +5,7 @@ from src.domain.auth.entities import UserEntity
 from src.domain.auth.exceptions import UserBySessionNotFoundError
 from src.domain.auth.value_objects import Email, PartOfName, UserRole
 from src.domain.base_value_objects import UUID
+from src.infrastructure.redis.serializer import CacheSerializer, default_serializer
 from src.services.auth.session_service import SessionService
 
 
@@ -15,11 +13,11 @@ class RedisSessionService(SessionService):
 
     """Redis implementation of session service."""
 
-    def __init__(self, session: Redis) -> None:
+    def __init__(self, session: Redis, serializer: CacheSerializer = default_serializer) -> None:
         self.session = session
+        self.serializer = serializer
 
-    @staticmethod
-    def from_domain_to_json_string(user: UserEntity) -> str:
+    def from_domain_to_bytes(self, user: UserEntity) -> bytes:
         user_dict = {
             "id": user.id.value,
             "firstname": user.firstname.value,
@@ -28,31 +26,29 @@ class RedisSessionService(SessionService):
             "email": user.email.value,
             "hashed_password": user.hashed_password,
         }
-        return json.dumps(user_dict)
+        return self.serializer.dumps(user_dict)
 
     async def get(self, auth_token: str) -> UserEntity:
-        try:
-            user_data_string = await self.session.get(auth_token)
-            user_dict = json.loads(user_data_string)
-            return UserEntity(
-                id=UUID(user_dict["id"]),
-                firstname=PartOfName(user_dict["firstname"]),
-                lastname=PartOfName(user_dict["lastname"]),
-                role=UserRole(user_dict["role"]),
-                email=Email(user_dict["email"]),
-                hashed_password=user_dict["hashed_password"],
-            )
-        except (TypeError, JSONDecodeError) as ex:  # no such key in Redis
-            raise UserBySessionNotFoundError from ex
+        user_dict = self.serializer.loads(await self.session.get(auth_token))
+        if user_dict is None:  # no such key in Redis
+            raise UserBySessionNotFoundError
+        return UserEntity(
+            id=UUID(user_dict["id"]),
+            firstname=PartOfName(user_dict["firstname"]),
+            lastname=PartOfName(user_dict["lastname"]),
+            role=UserRole(user_dict["role"]),
+            email=Email(user_dict["email"]),
+            hashed_password=user_dict["hashed_password"],
+        )
 
     async def update(self, auth_token: str, user: UserEntity) -> None:
-        user_data_string = self.from_domain_to_json_string(user)
+        user_data = self.from_domain_to_bytes(user)
         remaining_ttl = await self.session.ttl(auth_token)
-        await self.session.set(auth_token, user_data_string, keepttl=remaining_ttl)
+        await self.session.set(auth_token, user_data, keepttl=remaining_ttl)
 
     async def set(self, auth_token: str, user: UserEntity) -> None:
-        user_data_string = self.from_domain_to_json_string(user)
-        await self.session.setex(auth_token, TIME_TO_LIVE_AUTH_SESSION, user_data_string)
+        user_data = self.from_domain_to_bytes(user)
+        await self.session.setex(auth_token, TIME_TO_LIVE_AUTH_SESSION, user_data)
 
     async def delete(self, auth_token: str) -> None:
         await self.session.delete(auth_token)
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+from typing import TYPE_CHECKING
+
+from src.infrastructure.redis.auth.constants import LOCAL_MAX_SESSIONS, LOCAL_TIME_TO_LIVE_SESSIONS
+from src.infrastructure.redis.auth.session_service import RedisSessionService
+from src.infrastructure.redis.local_cache import LocalCache, local_cache_invalidation
+
+if TYPE_CHECKING:
+    from src.domain.auth.entities import UserEntity
+
+LOCAL_CACHE_NAME = "sessions"
+
+local_sessions_cache = LocalCache(max_size=LOCAL_MAX_SESSIONS, time_to_live=LOCAL_TIME_TO_LIVE_SESSIONS)
+local_cache_invalidation.register(LOCAL_CACHE_NAME, local_sessions_cache)
+
+
+class TwoTierSessionService(RedisSessionService):
+
+    """Sessions in memory of worker in front of Redis, logout and changes evict session in every worker.
+
+    Sessions are kept by hash of token, so tokens are neither in memory of workers nor in messages of eviction.
+    """
+
+    @staticmethod
+    def get_token_hash(auth_token: str) -> str:
+        return hashlib.sha256(auth_token.encode()).hexdigest()
+
+    async def get(self, auth_token: str) -> UserEntity:
+        token_hash = self.get_token_hash(auth_token)
+        user = local_sessions_cache.get(token_hash)
+        if user is None:
+            user = await super().get(auth_token)
+            local_sessions_cache.set(token_hash, user)
+        # entity can be changed by request, so the cached one is not shared
+        return dataclasses.replace(user)
+
+    async def update(self, auth_token: str, user: UserEntity) -> None:
+        await super().update(auth_token, user)
+        await local_cache_invalidation.publish(self.session, LOCAL_CACHE_NAME, [self.get_token_hash(auth_token)])
+
+    async def delete(self, auth_token: str) -> None:
+        await super().delete(auth_token)
+        await local_cache_invalidation.publish(self.session, LOCAL_CACHE_NAME, [self.get_token_hash(auth_token)])
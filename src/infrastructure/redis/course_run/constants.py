@@ -0,0 +1 @@
+TIME_TO_LIVE_ACTUAL_COURSE_RUNS = 6 * 60 * 60
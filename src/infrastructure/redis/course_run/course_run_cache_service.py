@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src.infrastructure.redis.course_run.constants import TIME_TO_LIVE_ACTUAL_COURSE_RUNS
+from src.infrastructure.redis.serializer import CacheSerializer, default_serializer
+from src.services.course_run.course_run_cache_service import CourseRunCacheService
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+
+class RedisCourseRunCacheService(CourseRunCacheService):
+
+    """Redis implementation class for cache of course runs as service."""
+
+    ACTUAL_COURSE_RUNS_KEY = "actual_course_runs"
+
+    def __init__(self, session: Redis, serializer: CacheSerializer = default_serializer) -> None:
+        self.session = session
+        self.serializer = serializer
+
+    async def get_actual_ids(self, seasons: list[tuple[str, int]]) -> dict[str, str] | None:
+        actual_data = self.serializer.loads(await self.session.get(self.ACTUAL_COURSE_RUNS_KEY))
+        if actual_data is None:
+            return None
+        if actual_data["seasons"] != [list(season) for season in seasons]:  # map of past seasons
+            return None
+        return actual_data["course_runs"]
+
+    async def set_actual_ids(self, seasons: list[tuple[str, int]], course_run_ids: dict[str, str]) -> None:
+        actual_data = {"seasons": [list(season) for season in seasons], "course_runs": course_run_ids}
+        await self.session.setex(
+            self.ACTUAL_COURSE_RUNS_KEY, TIME_TO_LIVE_ACTUAL_COURSE_RUNS, self.serializer.dumps(actual_data),
+        )
+
+    async def delete_actual_ids(self) -> None:
+        await self.session.delete(self.ACTUAL_COURSE_RUNS_KEY)
@@ -1,2 +1,6 @@
-TIME_TO_LIVE_ALL_COURSES = 60 * 60
+TIME_TO_LIVE_ALL_COURSES = 6 * 60 * 60
+TIME_TO_REFRESH_ALL_COURSES = 60 * 60
 TIME_TO_LIVE_ONE_COURSE = 24 * 60 * 60
+TIME_TO_LIVE_REBUILD_LOCK = 10
+LOCAL_TIME_TO_LIVE_COURSES = 60
+LOCAL_MAX_COURSES = 2000
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
-import json
-from json.decoder import JSONDecodeError
+import bisect
+import contextlib
+import time
+import uuid
 from typing import TYPE_CHECKING, Literal
 
+from redis.exceptions import LockError, WatchError
+
 from src.domain.base_value_objects import UUID
 from src.domain.courses.entities import CourseEntity
 from src.domain.courses.value_objects import (
@@ -17,26 +21,46 @@ from src.domain.courses.value_objects import (
     Role,
     Terms,
 )
-from src.infrastructure.redis.courses.constants import TIME_TO_LIVE_ALL_COURSES, TIME_TO_LIVE_ONE_COURSE
+from src.infrastructure.redis.courses.constants import (
+    TIME_TO_LIVE_ALL_COURSES,
+    TIME_TO_LIVE_ONE_COURSE,
+    TIME_TO_LIVE_REBUILD_LOCK,
+    TIME_TO_REFRESH_ALL_COURSES,
+)
+from src.infrastructure.redis.serializer import CacheSerializer, default_serializer
+from src.services.cache_entry import CacheEntry
 from src.services.courses.course_cache_service import CourseCacheService
 
 if TYPE_CHECKING:
     from redis.asyncio import Redis
+    from redis.asyncio.client import Pipeline
+    from redis.asyncio.lock import Lock
 
 
 class RedisCourseCacheService(CourseCacheService):
 
     """Redis implementation class for cache of course as service."""
 
-    def __init__(self, session: Redis, prefix: Literal["admin", "talent", "test"]) -> None:
+    def __init__(
+            self, session: Redis, prefix: Literal["admin", "talent", "test"],
+            serializer: CacheSerializer = default_serializer,
+    ) -> None:
         self.session = session
         self.prefix = prefix
+        self.serializer = serializer
+        self.__rebuild_lock: Lock | None = None
 
     def __get_course_key(self, course_id: UUID) -> str:
         return self.prefix + "-course-" + course_id.value
 
-    def __get_courses_key(self) -> str:
-        return self.prefix + "-courses"
+    def __get_course_ids_key(self) -> str:
+        return self.prefix + "-courses-ids"
+
+    def __get_courses_version_key(self) -> str:
+        return self.prefix + "-courses-version"
+
+    def __get_courses_lock_key(self) -> str:
+        return self.prefix + "-courses-lock"
 
     @staticmethod
     def __from_domain_to_dict(course: CourseEntity) -> dict:
@@ -85,33 +109,133 @@ class RedisCourseCacheService(CourseCacheService):
         )
 
     async def get_one(self, course_id: UUID) -> CourseEntity | None:
-        try:
-            course_data_string = await self.session.get(self.__get_course_key(course_id))
-            course_dict = json.loads(course_data_string)
-            return self.__from_dict_to_domain(course_dict)
-        except (TypeError, JSONDecodeError):  # no such key in Redis
+        course_dict = self.serializer.loads(await self.session.get(self.__get_course_key(course_id)))
+        if course_dict is None:  # no such key in Redis
             return None
+        return self.__from_dict_to_domain(course_dict)
 
     async def delete_one(self, course_id: UUID) -> None:
         await self.session.delete(self.__get_course_key(course_id))
 
     async def set_one(self, course: CourseEntity) -> None:
-        course_dict = self.__from_domain_to_dict(course)
-        course_data_string = json.dumps(course_dict)
-        await self.session.setex(self.__get_course_key(course.id), TIME_TO_LIVE_ONE_COURSE, course_data_string)
+        course_data = self.serializer.dumps(self.__from_domain_to_dict(course))
+        await self.session.setex(self.__get_course_key(course.id), TIME_TO_LIVE_ONE_COURSE, course_data)
 
     async def get_many(self) -> list[CourseEntity] | None:
-        try:
-            courses_data_string = await self.session.get(self.__get_courses_key())
-            courses_dict = json.loads(courses_data_string)
-            return [self.__from_dict_to_domain(course_dict) for course_dict in courses_dict]
-        except (TypeError, JSONDecodeError):  # no such key in Redis
+        async with self.session.pipeline(transaction=False) as pipe:
+            pipe.get(self.__get_courses_version_key())
+            pipe.lrange(self.__get_course_ids_key(), 0, -1)
+            version, course_ids = await pipe.execute()
+        if version is None:
+            return None
+        courses = await self.get_many_by_ids([UUID(course_id.decode()) for course_id in course_ids])
+        if None in courses:  # some course has been invalidated, catalog is incomplete
             return None
+        return courses
+
+    async def get_many_by_ids(self, course_ids: list[UUID]) -> list[CourseEntity | None]:
+        if not course_ids:
+            return []
+        courses_data = await self.session.mget([self.__get_course_key(course_id) for course_id in course_ids])
+        courses_dicts = [self.serializer.loads(course_data) for course_data in courses_data]
+        return [self.__from_dict_to_domain(course_dict) if course_dict else None for course_dict in courses_dicts]
+
+    async def delete_many_by_ids(self, course_ids: list[UUID]) -> None:
+        if not course_ids:
+            return
+        await self.session.delete(*[self.__get_course_key(course_id) for course_id in course_ids])
 
     async def delete_many(self) -> None:
-        await self.session.delete(self.__get_courses_key())
+        await self.session.delete(self.__get_course_ids_key(), self.__get_courses_version_key())
 
     async def set_many(self, courses: list[CourseEntity]) -> None:
-        courses_dict = [self.__from_domain_to_dict(course) for course in courses]
-        courses_data_string = json.dumps(courses_dict)
-        await self.session.setex(self.__get_courses_key(), TIME_TO_LIVE_ALL_COURSES, courses_data_string)
+        async with self.session.pipeline(transaction=True) as pipe:
+            for course in courses:
+                course_data = self.serializer.dumps(self.__from_domain_to_dict(course))
+                pipe.setex(self.__get_course_key(course.id), TIME_TO_LIVE_ALL_COURSES, course_data)
+            pipe.delete(self.__get_course_ids_key())
+            if courses:
+                pipe.rpush(self.__get_course_ids_key(), *[course.id.value for course in courses])
+                pipe.expire(self.__get_course_ids_key(), TIME_TO_LIVE_ALL_COURSES)
+            # version keeps the moment after which courses are stale and should be refreshed
+            refresh_at = int(time.time()) + TIME_TO_REFRESH_ALL_COURSES
+            pipe.setex(self.__get_courses_version_key(), TIME_TO_LIVE_ALL_COURSES, f"{uuid.uuid4().hex}:{refresh_at}")
+            await pipe.execute()
+
+    async def patch_many(self, course: CourseEntity, *, is_listed: bool) -> tuple[str, str] | None:
+        version_key, course_ids_key = self.__get_courses_version_key(), self.__get_course_ids_key()
+        async with self.session.pipeline(transaction=True) as pipe:
+            try:
+                await pipe.watch(version_key, course_ids_key)
+                version = await pipe.get(version_key)
+                if version is None:
+                    return None
+                version_id, _, refresh_at = version.decode().partition(":")
+                position = await pipe.lpos(course_ids_key, course.id.value)
+                if not is_listed and position is None:
+                    return version_id, version_id
+                next_course_id = None
+                if is_listed:
+                    # course is placed by (name, id) like in keyset pages, so cursor of the first page goes on
+                    sort_keys = await self.__get_sort_keys(pipe, course.id)
+                    if sort_keys is None:  # some course has been invalidated, list is rebuilt by the next reader
+                        await self.delete_many()
+                        return None
+                    next_position = bisect.bisect(sort_keys, (course.name.value, course.id.value))
+                    next_course_id = sort_keys[next_position][1] if next_position < len(sort_keys) else None
+                new_version_id = uuid.uuid4().hex
+                pipe.multi()
+                if is_listed:
+                    course_data = self.serializer.dumps(self.__from_domain_to_dict(course))
+                    pipe.setex(self.__get_course_key(course.id), TIME_TO_LIVE_ALL_COURSES, course_data)
+                    if position is not None:  # course could be renamed, so it is placed again
+                        pipe.lrem(course_ids_key, 0, course.id.value)
+                    if next_course_id is None:
+                        pipe.rpush(course_ids_key, course.id.value)
+                    else:
+                        pipe.linsert(course_ids_key, "BEFORE", next_course_id, course.id.value)
+                else:
+                    pipe.lrem(course_ids_key, 0, course.id.value)
+                # list keeps its moment of refresh, it is patched but not refreshed
+                pipe.set(version_key, f"{new_version_id}:{refresh_at}", keepttl=True)
+                await pipe.execute()
+            except WatchError:  # list has been changed at the same time, it is rebuilt by the next reader
+                await self.delete_many()
+                return None
+        return version_id, new_version_id
+
+    async def __get_sort_keys(self, pipe: Pipeline, excluded_course_id: UUID) -> list[tuple[str, str]] | None:
+        """Get (name, id) of listed courses in order of list without given course, None if some course is missing."""
+        course_ids = [
+            course_id.decode() for course_id in await pipe.lrange(self.__get_course_ids_key(), 0, -1)
+            if course_id.decode() != excluded_course_id.value
+        ]
+        if not course_ids:
+            return []
+        courses_data = await pipe.mget([self.__get_course_key(UUID(course_id)) for course_id in course_ids])
+        courses_dicts = [self.serializer.loads(course_data) for course_data in courses_data]
+        if None in courses_dicts:
+            return None
+        return [(course_dict["name"], course_dict["id"]) for course_dict in courses_dicts]
+
+    async def get_version(self) -> CacheEntry[str] | None:
+        version = await self.session.get(self.__get_courses_version_key())
+        if not version:
+            return None
+        version_id, _, refresh_at = version.decode().partition(":")
+        is_stale = not refresh_at.isdigit() or int(refresh_at) <= time.time()
+        return CacheEntry(value=version_id, is_stale=is_stale)
+
+    async def lock_many(self) -> bool:
+        lock = self.session.lock(self.__get_courses_lock_key(), timeout=TIME_TO_LIVE_REBUILD_LOCK, blocking=False)
+        if not await lock.acquire():
+            return False
+        self.__rebuild_lock = lock
+        return True
+
+    async def unlock_many(self) -> None:
+        if self.__rebuild_lock is None:
+            return
+        with contextlib.suppress(LockError):  # lock has expired during rebuilding
+            await self.__rebuild_lock.release()
+        self.__rebuild_lock = None
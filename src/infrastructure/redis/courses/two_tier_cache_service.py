@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src.infrastructure.redis.courses.constants import LOCAL_MAX_COURSES, LOCAL_TIME_TO_LIVE_COURSES
+from src.infrastructure.redis.courses.course_cache_service import RedisCourseCacheService
+from src.infrastructure.redis.local_cache import LocalCache, local_cache_invalidation
+
+if TYPE_CHECKING:
+    from src.domain.base_value_objects import UUID
+    from src.domain.courses.entities import CourseEntity
+    from src.services.cache_entry import CacheEntry
+
+LOCAL_CACHE_NAME = "courses"
+
+local_courses_cache = LocalCache(max_size=LOCAL_MAX_COURSES, time_to_live=LOCAL_TIME_TO_LIVE_COURSES)
+local_cache_invalidation.register(LOCAL_CACHE_NAME, local_courses_cache)
+
+
+class TwoTierCourseCacheService(RedisCourseCacheService):
+
+    """Cache of course in memory of worker in front of Redis, changes evict courses in every worker."""
+
+    def __get_course_key(self, course_id: UUID) -> str:
+        return self.prefix + ":course:" + course_id.value
+
+    def __get_courses_key(self) -> str:
+        return self.prefix + ":courses"
+
+    def __get_courses_version_key(self) -> str:
+        return self.prefix + ":courses-version"
+
+    async def get_one(self, course_id: UUID) -> CourseEntity | None:
+        course = local_courses_cache.get(self.__get_course_key(course_id))
+        if course is None:
+            course = await super().get_one(course_id)
+            if course is not None:
+                local_courses_cache.set(self.__get_course_key(course_id), course)
+        return course
+
+    async def delete_one(self, course_id: UUID) -> None:
+        await super().delete_one(course_id)
+        await local_cache_invalidation.publish(self.session, LOCAL_CACHE_NAME, [self.__get_course_key(course_id)])
+
+    async def set_one(self, course: CourseEntity) -> None:
+        await super().set_one(course)
+        await local_cache_invalidation.publish(self.session, LOCAL_CACHE_NAME, [self.__get_course_key(course.id)])
+        local_courses_cache.set(self.__get_course_key(course.id), course)
+
+    async def get_many(self) -> list[CourseEntity] | None:
+        courses = local_courses_cache.get(self.__get_courses_key())
+        if courses is None:
+            courses = await super().get_many()
+            if courses is not None:
+                local_courses_cache.set(self.__get_courses_key(), courses)
+        return courses
+
+    async def delete_many_by_ids(self, course_ids: list[UUID]) -> None:
+        if not course_ids:
+            return
+        await super().delete_many_by_ids(course_ids)
+        keys = [self.__get_course_key(course_id) for course_id in course_ids]
+        await local_cache_invalidation.publish(self.session, LOCAL_CACHE_NAME, keys)
+
+    async def delete_many(self) -> None:
+        await super().delete_many()
+        await self.__evict_many()
+
+    async def set_many(self, courses: list[CourseEntity]) -> None:
+        await super().set_many(courses)
+        await self.__evict_many()
+
+    async def patch_many(self, course: CourseEntity, *, is_listed: bool) -> tuple[str, str] | None:
+        versions = await super().patch_many(course, is_listed=is_listed)
+        await self.__evict_many()
+        return versions
+
+    async def get_version(self) -> CacheEntry[str] | None:
+        version = local_courses_cache.get(self.__get_courses_version_key())
+        if version is None:
+            version = await super().get_version()
+            if version is not None:
+                local_courses_cache.set(self.__get_courses_version_key(), version)
+        return version
+
+    async def __evict_many(self) -> None:
+        keys = [self.__get_courses_key(), self.__get_courses_version_key()]
+        await local_cache_invalidation.publish(self.session, LOCAL_CACHE_NAME, keys)
@@ -1 +1,9 @@
-TIME_TO_LIVE_FEEDBACKS = 60 * 60
+TIME_TO_LIVE_FEEDBACKS = 6 * 60 * 60
+TIME_TO_REFRESH_FEEDBACKS = 60 * 60
+TIME_TO_LIVE_REBUILD_LOCK = 10
+LOCAL_TIME_TO_LIVE_FEEDBACKS = 60
+LOCAL_MAX_FEEDBACKS = 500
+TIME_TO_LIVE_FEEDBACK_PAGES = 60 * 60
+FEEDBACKS_SCHEMA_VERSION = 2
+TIME_TO_LIVE_USER_VOTES = 10 * 60
+TIME_TO_LIVE_COURSE_RATINGS = 10 * 60
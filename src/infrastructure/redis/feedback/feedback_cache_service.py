@@ -1,31 +1,72 @@
 from __future__ import annotations
 
+import contextlib
 import datetime
 import json
-from json.decoder import JSONDecodeError
+import time
 from typing import TYPE_CHECKING
 
+from redis.exceptions import LockError, WatchError
+
 from src.domain.base_value_objects import UUID
-from src.domain.feedback.entities import FeedbackEntity
-from src.domain.feedback.value_objects import FeedbackText, Rating, Vote
-from src.infrastructure.redis.feedback.constants import TIME_TO_LIVE_FEEDBACKS
+from src.domain.feedback.entities import CourseRatingEntity, FeedbackEntity
+from src.domain.feedback.value_objects import FeedbackText, Rating
+from src.infrastructure.redis.feedback.constants import (
+    FEEDBACKS_SCHEMA_VERSION,
+    TIME_TO_LIVE_COURSE_RATINGS,
+    TIME_TO_LIVE_FEEDBACK_PAGES,
+    TIME_TO_LIVE_FEEDBACKS,
+    TIME_TO_LIVE_REBUILD_LOCK,
+    TIME_TO_LIVE_USER_VOTES,
+    TIME_TO_REFRESH_FEEDBACKS,
+)
+from src.infrastructure.redis.serializer import CacheSerializer, default_serializer
+from src.services.cache_entry import CacheEntry
 from src.services.feedback.feedback_cache_service import FeedbackCacheService
 
 if TYPE_CHECKING:
     from redis.asyncio import Redis
+    from redis.asyncio.lock import Lock
+
+# feedbacks are cached with counters of votes instead of votes since schema version 2
+feedback_serializer = CacheSerializer(default_serializer.codec, schema_version=FEEDBACKS_SCHEMA_VERSION)
+# field of hash with votes of user, so user without votes is cached too
+USER_VOTES_LOADED_FIELD = "loaded"
 
 
 class RedisFeedbackCacheService(FeedbackCacheService):
 
     """Redis implementation class for cache of course as service."""
 
-    def __init__(self, session: Redis) -> None:
+    def __init__(self, session: Redis, serializer: CacheSerializer = feedback_serializer) -> None:
         self.session = session
+        self.serializer = serializer
+        self.__rebuild_locks: dict[str, Lock] = {}
 
     @staticmethod
     def feedback_key(course_id: UUID) -> str:
         return "course_" + course_id.value + "_feedbacks"
 
+    @staticmethod
+    def feedback_lock_key(course_id: UUID) -> str:
+        return "course_" + course_id.value + "_feedbacks_lock"
+
+    @staticmethod
+    def feedback_pages_key(course_id: UUID) -> str:
+        return "course_" + course_id.value + "_feedback_pages"
+
+    @staticmethod
+    def user_votes_key(course_id: UUID, user_id: UUID) -> str:
+        return "course_" + course_id.value + "_user_" + user_id.value + "_votes"
+
+    @staticmethod
+    def course_rating_key(course_id: UUID) -> str:
+        return "course_" + course_id.value + "_rating"
+
+    @staticmethod
+    def __get_page_field(sort: str, after: list[str] | None, limit: int) -> str:
+        return json.dumps([sort, after, limit])
+
     @staticmethod
     def __from_domain_to_dict(feedback: FeedbackEntity) -> dict:
         return {
@@ -34,8 +75,9 @@ class RedisFeedbackCacheService(FeedbackCacheService):
             "author_id": feedback.author_id.value,
             "text": feedback.text.value,
             "rating": feedback.rating.value,
-            "votes": [{"user_id": vote.user_id.value, "vote_type": vote.vote_type} for vote in feedback.votes],
             "date": feedback.date.strftime("%Y-%m-%d"),
+            "like_count": feedback.like_count,
+            "dislike_count": feedback.dislike_count,
         }
 
     @staticmethod
@@ -46,25 +88,152 @@ class RedisFeedbackCacheService(FeedbackCacheService):
             author_id=UUID(feedback_["author_id"]),
             text=FeedbackText(feedback_["text"]),
             rating=Rating(feedback_["rating"]),
-            votes={Vote(UUID(vote["user_id"]), vote["vote_type"]) for vote in feedback_["votes"]},
             date=datetime.date.fromisoformat(feedback_["date"]),
+            like_count=feedback_["like_count"],
+            dislike_count=feedback_["dislike_count"],
+        )
+
+    @staticmethod
+    def __from_rating_to_dict(rating: CourseRatingEntity) -> dict:
+        return {
+            "course_id": rating.course_id.value,
+            "count": rating.count,
+            "rating_sum": rating.rating_sum,
+            "histogram": rating.histogram,
+            "weighted_rating_sum": rating.weighted_rating_sum,
+            "weight_sum": rating.weight_sum,
+        }
+
+    @staticmethod
+    def __from_dict_to_rating(rating_: dict) -> CourseRatingEntity:
+        return CourseRatingEntity(
+            course_id=UUID(rating_["course_id"]),
+            count=rating_["count"],
+            rating_sum=rating_["rating_sum"],
+            histogram=rating_["histogram"],
+            weighted_rating_sum=rating_["weighted_rating_sum"],
+            weight_sum=rating_["weight_sum"],
         )
 
     async def get_many_by_course_id(self, course_id: UUID) -> list[FeedbackEntity] | None:
-        try:
-            feedbacks_key = self.feedback_key(course_id)
-            feedbacks_data_string = await self.session.get(feedbacks_key)
-            feedbacks_data = json.loads(feedbacks_data_string)
-            return [self.__from_dict_to_domain(feedback) for feedback in feedbacks_data]
-        except (TypeError, JSONDecodeError):  # no such key in Redis
+        entry = await self.get_entry_by_course_id(course_id)
+        return entry.value if entry else None
+
+    async def get_entry_by_course_id(self, course_id: UUID) -> CacheEntry[list[FeedbackEntity]] | None:
+        feedbacks_data = self.serializer.loads(await self.session.get(self.feedback_key(course_id)))
+        if not isinstance(feedbacks_data, dict):  # no such key in Redis or value is written in another schema
             return None
+        return CacheEntry(
+            value=[self.__from_dict_to_domain(feedback) for feedback in feedbacks_data["feedbacks"]],
+            is_stale=feedbacks_data["refresh_at"] <= time.time(),
+        )
 
     async def delete_many(self, course_id: UUID) -> None:
         feedbacks_key = self.feedback_key(course_id)
-        await self.session.delete(feedbacks_key)
+        await self.session.delete(feedbacks_key, self.feedback_pages_key(course_id))
 
     async def set_many(self, course_id: UUID, feedbacks: list[FeedbackEntity]) -> None:
         feedbacks_key = self.feedback_key(course_id)
-        feedbacks_data = [self.__from_domain_to_dict(feedback) for feedback in feedbacks]
-        course_data_string = json.dumps(feedbacks_data)
-        await self.session.setex(feedbacks_key, TIME_TO_LIVE_FEEDBACKS, course_data_string)
+        feedbacks_data = {
+            "refresh_at": int(time.time()) + TIME_TO_REFRESH_FEEDBACKS,
+            "feedbacks": [self.__from_domain_to_dict(feedback) for feedback in feedbacks],
+        }
+        await self.session.setex(feedbacks_key, TIME_TO_LIVE_FEEDBACKS, self.serializer.dumps(feedbacks_data))
+
+    async def patch_one(self, feedback: FeedbackEntity) -> None:
+        feedbacks_key = self.feedback_key(feedback.course_id)
+        async with self.session.pipeline(transaction=True) as pipe:
+            try:
+                await pipe.watch(feedbacks_key)
+                feedbacks_data = self.serializer.loads(await pipe.get(feedbacks_key))
+                pipe.multi()
+                if isinstance(feedbacks_data, dict):  # missing lists are not patched
+                    for feedback_ in feedbacks_data["feedbacks"]:
+                        if feedback_["id"] == feedback.id.value:
+                            feedback_["like_count"] = feedback.like_count
+                            feedback_["dislike_count"] = feedback.dislike_count
+                    # list keeps its moment of refresh, it is patched but not refreshed
+                    pipe.set(feedbacks_key, self.serializer.dumps(feedbacks_data), keepttl=True)
+                # pages are sorted by reputation too, so they are rebuilt
+                pipe.delete(self.feedback_pages_key(feedback.course_id))
+                await pipe.execute()
+            except WatchError:  # feedbacks have been changed at the same time, they are rebuilt by the next reader
+                await self.delete_many(feedback.course_id)
+
+    async def get_user_votes(self, course_id: UUID, user_id: UUID) -> dict[str, str] | None:
+        votes_data = await self.session.hgetall(self.user_votes_key(course_id, user_id))
+        if not votes_data:
+            return None
+        votes = {feedback_id.decode(): vote_type.decode() for feedback_id, vote_type in votes_data.items()}
+        votes.pop(USER_VOTES_LOADED_FIELD, None)
+        return votes
+
+    async def set_user_votes(self, course_id: UUID, user_id: UUID, votes: dict[str, str]) -> None:
+        user_votes_key = self.user_votes_key(course_id, user_id)
+        async with self.session.pipeline(transaction=True) as pipe:
+            pipe.delete(user_votes_key)
+            pipe.hset(user_votes_key, mapping={USER_VOTES_LOADED_FIELD: "", **votes})
+            pipe.expire(user_votes_key, TIME_TO_LIVE_USER_VOTES)
+            await pipe.execute()
+
+    async def delete_user_votes(self, course_id: UUID, user_id: UUID) -> None:
+        await self.session.delete(self.user_votes_key(course_id, user_id))
+
+    async def get_course_ratings(self, course_ids: list[UUID]) -> dict[str, CourseRatingEntity]:
+        if not course_ids:
+            return {}
+        # every summary has its own key and time to live, so a stale summary lives not longer than its time to live
+        ratings_data = await self.session.mget([self.course_rating_key(course_id) for course_id in course_ids])
+        ratings = [self.serializer.loads(rating_data) for rating_data in ratings_data]
+        return {rating["course_id"]: self.__from_dict_to_rating(rating) for rating in ratings if rating is not None}
+
+    async def set_course_ratings(self, ratings: list[CourseRatingEntity]) -> None:
+        if not ratings:
+            return
+        async with self.session.pipeline(transaction=False) as pipe:
+            for rating in ratings:
+                pipe.setex(
+                    self.course_rating_key(rating.course_id),
+                    TIME_TO_LIVE_COURSE_RATINGS,
+                    self.serializer.dumps(self.__from_rating_to_dict(rating)),
+                )
+            await pipe.execute()
+
+    async def delete_course_rating(self, course_id: UUID) -> None:
+        await self.session.delete(self.course_rating_key(course_id))
+
+    async def get_page(
+            self, course_id: UUID, sort: str, after: list[str] | None, limit: int,
+    ) -> list[FeedbackEntity] | None:
+        page_field = self.__get_page_field(sort, after, limit)
+        page_data = self.serializer.loads(await self.session.hget(self.feedback_pages_key(course_id), page_field))
+        if page_data is None:
+            return None
+        return [self.__from_dict_to_domain(feedback) for feedback in page_data]
+
+    async def set_page(
+            self, course_id: UUID, sort: str, after: list[str] | None, limit: int, feedbacks: list[FeedbackEntity],
+    ) -> None:
+        pages_key = self.feedback_pages_key(course_id)
+        page_data = [self.__from_domain_to_dict(feedback) for feedback in feedbacks]
+        # all pages of course are in one hash, so they are deleted by one command
+        async with self.session.pipeline(transaction=True) as pipe:
+            pipe.hset(pages_key, self.__get_page_field(sort, after, limit), self.serializer.dumps(page_data))
+            pipe.expire(pages_key, TIME_TO_LIVE_FEEDBACK_PAGES)
+            await pipe.execute()
+
+    async def lock_many(self, course_id: UUID) -> bool:
+        lock = self.session.lock(
+            self.feedback_lock_key(course_id), timeout=TIME_TO_LIVE_REBUILD_LOCK, blocking=False,
+        )
+        if not await lock.acquire():
+            return False
+        self.__rebuild_locks[course_id.value] = lock
+        return True
+
+    async def unlock_many(self, course_id: UUID) -> None:
+        lock = self.__rebuild_locks.pop(course_id.value, None)
+        if lock is None:
+            return
+        with contextlib.suppress(LockError):  # lock has expired during rebuilding
+            await lock.release()
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src.infrastructure.redis.feedback.constants import LOCAL_MAX_FEEDBACKS, LOCAL_TIME_TO_LIVE_FEEDBACKS
+from src.infrastructure.redis.feedback.feedback_cache_service import RedisFeedbackCacheService
+from src.infrastructure.redis.local_cache import LocalCache, local_cache_invalidation
+
+if TYPE_CHECKING:
+    from src.domain.base_value_objects import UUID
+    from src.domain.feedback.entities import FeedbackEntity
+    from src.services.cache_entry import CacheEntry
+
+LOCAL_CACHE_NAME = "feedbacks"
+
+local_feedbacks_cache = LocalCache(max_size=LOCAL_MAX_FEEDBACKS, time_to_live=LOCAL_TIME_TO_LIVE_FEEDBACKS)
+local_cache_invalidation.register(LOCAL_CACHE_NAME, local_feedbacks_cache)
+
+
+class TwoTierFeedbackCacheService(RedisFeedbackCacheService):
+
+    """Cache of feedback in memory of worker in front of Redis, changes evict feedbacks in every worker."""
+
+    async def get_entry_by_course_id(self, course_id: UUID) -> CacheEntry[list[FeedbackEntity]] | None:
+        entry = local_feedbacks_cache.get(course_id.value)
+        if entry is None:
+            entry = await super().get_entry_by_course_id(course_id)
+            if entry is not None:
+                local_feedbacks_cache.set(course_id.value, entry)
+        return entry
+
+    async def delete_many(self, course_id: UUID) -> None:
+        await super().delete_many(course_id)
+        await local_cache_invalidation.publish(self.session, LOCAL_CACHE_NAME, [course_id.value])
+
+    async def set_many(self, course_id: UUID, feedbacks: list[FeedbackEntity]) -> None:
+        await super().set_many(course_id, feedbacks)
+        await local_cache_invalidation.publish(self.session, LOCAL_CACHE_NAME, [course_id.value])
+
+    async def patch_one(self, feedback: FeedbackEntity) -> None:
+        await super().patch_one(feedback)
+        await local_cache_invalidation.publish(self.session, LOCAL_CACHE_NAME, [feedback.course_id.value])
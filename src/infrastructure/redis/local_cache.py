@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+
+from src.infrastructure.redis.session import pool
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+V = TypeVar("V")
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "local-cache-invalidation"
+RESUBSCRIBE_INTERVAL = 1
+
+
+class LocalCache(Generic[V]):
+
+    """Size-bounded in-process LRU cache, values live not longer than time to live."""
+
+    def __init__(self, max_size: int, time_to_live: float) -> None:
+        self.max_size = max_size
+        self.time_to_live = time_to_live
+        self.__values: OrderedDict[str, tuple[float, V]] = OrderedDict()
+
+    def get(self, key: str) -> V | None:
+        item = self.__values.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self.__values[key]
+            return None
+        self.__values.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: V) -> None:
+        self.__values[key] = (time.monotonic() + self.time_to_live, value)
+        self.__values.move_to_end(key)
+        while len(self.__values) > self.max_size:
+            self.__values.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        self.__values.pop(key, None)
+
+    def clear(self) -> None:
+        self.__values.clear()
+
+
+class LocalCacheInvalidation:
+
+    """Broadcast evictions from local caches to every worker over Redis pub/sub."""
+
+    def __init__(self) -> None:
+        self.worker_id = uuid.uuid4().hex
+        self.__caches: dict[str, LocalCache] = {}
+
+    def register(self, name: str, cache: LocalCache) -> None:
+        self.__caches[name] = cache
+
+    async def publish(self, session: Redis, name: str, keys: list[str]) -> None:
+        self.evict(name, keys)
+        message = json.dumps({"worker_id": self.worker_id, "cache": name, "keys": keys})
+        await session.publish(INVALIDATION_CHANNEL, message)
+
+    def evict(self, name: str, keys: list[str]) -> None:
+        cache = self.__caches.get(name)
+        if cache is None:
+            return
+        for key in keys:
+            cache.delete(key)
+
+    def handle(self, data: bytes | str) -> None:
+        message = json.loads(data)
+        if message["worker_id"] != self.worker_id:
+            self.evict(message["cache"], message["keys"])
+
+    def try_handle(self, data: bytes | str) -> None:
+        """Handle message, broken message is logged and skipped so listening goes on."""
+        try:
+            self.handle(data)
+        except (ValueError, KeyError, TypeError):
+            logger.exception("Broken message of invalidation of local caches is skipped: %r", data)
+
+    def clear(self) -> None:
+        for cache in self.__caches.values():
+            cache.clear()
+
+    async def listen(self) -> None:
+        """Evict keys published by other workers until cancelled, resubscribe when connection is lost or fails."""
+        while True:
+            try:
+                await self.__listen_until_error()
+            except Exception:
+                logger.exception("Listening to invalidation of local caches has failed")
+            # messages could be lost while there was no subscription
+            self.clear()
+            await asyncio.sleep(RESUBSCRIBE_INTERVAL)
+
+    async def __listen_until_error(self) -> None:
+        try:
+            async with aioredis.Redis(connection_pool=pool) as session, session.pubsub() as pubsub:
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        self.try_handle(message["data"])
+        except RedisError:
+            logger.exception("Subscription to invalidation of local caches is lost")
+
+
+local_cache_invalidation = LocalCacheInvalidation()
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import uuid
+from typing import TYPE_CHECKING
+
+from src.services.resource_version_service import ResourceVersionService
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+
+class RedisResourceVersionService(ResourceVersionService):
+
+    """Redis implementation of versions of resources.
+
+    Version is a random token, so it never repeats after Redis has lost keys.
+    """
+
+    def __init__(self, session: Redis) -> None:
+        self.session = session
+
+    @staticmethod
+    def __get_version_key(resource: str) -> str:
+        return "version-" + resource
+
+    async def get_many(self, resources: list[str]) -> list[str]:
+        keys = [self.__get_version_key(resource) for resource in resources]
+        async with self.session.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.set(key, uuid.uuid4().hex, nx=True)  # resource has not been versioned yet
+            pipe.mget(keys)
+            *_, versions = await pipe.execute()
+        return [version.decode() for version in versions]
+
+    async def bump_many(self, resources: list[str]) -> None:
+        async with self.session.pipeline(transaction=False) as pipe:
+            for resource in resources:
+                pipe.set(self.__get_version_key(resource), uuid.uuid4().hex)
+            await pipe.execute()
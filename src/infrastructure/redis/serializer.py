@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import json
+from abc import ABC, abstractmethod
+
+import orjson
+
+SCHEMA_VERSION = 1
+LEGACY_JSON_PREFIXES = b"[{"
+
+
+class Codec(ABC):
+
+    """Base class for codec of cache payloads."""
+
+    @abstractmethod
+    def dumps(self, value: dict | list) -> bytes:
+        raise NotImplementedError
+
+    @abstractmethod
+    def loads(self, payload: bytes) -> dict | list:
+        raise NotImplementedError
+
+
+class JSONCodec(Codec):
+
+    """Codec on standard json module, it writes the same payloads as orjson."""
+
+    def dumps(self, value: dict | list) -> bytes:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+
+    def loads(self, payload: bytes) -> dict | list:
+        return json.loads(payload)
+
+
+class ORJSONCodec(Codec):
+
+    """Codec on orjson, it is several times faster than standard json."""
+
+    def dumps(self, value: dict | list) -> bytes:
+        return orjson.dumps(value)
+
+    def loads(self, payload: bytes) -> dict | list:
+        return orjson.loads(payload)
+
+
+class CacheSerializer:
+
+    """Versioned serializer of cache payloads: one byte of schema version and encoded value.
+
+    Payloads of another schema version are read as missing values, so they are rebuilt.
+    Payloads written as plain JSON before versioning are still read by serializer of the first schema version only,
+    later schema versions have another shape of values.
+    """
+
+    def __init__(self, codec: Codec, schema_version: int = SCHEMA_VERSION) -> None:
+        self.codec = codec
+        self.schema_version = schema_version
+
+    def dumps(self, value: dict | list) -> bytes:
+        return bytes([self.schema_version]) + self.codec.dumps(value)
+
+    def loads(self, payload: bytes | str | None) -> dict | list | None:
+        if not payload:
+            return None
+        if isinstance(payload, str):
+            payload = payload.encode()
+        try:
+            if payload[0] in LEGACY_JSON_PREFIXES:
+                return self.codec.loads(payload) if self.schema_version == SCHEMA_VERSION else None
+            if payload[0] != self.schema_version:
+                return None
+            return self.codec.loads(payload[1:])
+        except ValueError:  # broken payload
+            return None
+
+
+default_serializer = CacheSerializer(ORJSONCodec())
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, TypeVar
+
+from src.config import app_config
+from src.domain.auth.exceptions import PasswordHashingBusyError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+R = TypeVar("R")
+
+
+class PasswordHashPool:
+
+    """Bounded pool of threads for hashing of passwords, so hashing does not block event loop.
+
+    hashlib releases GIL while it hashes, so threads hash in parallel. Hashes which do not fit
+    into the pool are rejected at once, so a burst of logins does not slow down other requests.
+    """
+
+    def __init__(self, workers: int, max_pending: int) -> None:
+        self.max_pending = max_pending
+        self.__executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+        self.__pending = 0
+        self.__lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        return self.__pending
+
+    async def run(self, function: Callable[..., R], *args: str | int) -> R:
+        with self.__lock:
+            if self.__pending >= self.max_pending:
+                raise PasswordHashingBusyError
+            self.__pending += 1
+        future = self.__executor.submit(function, *args)
+        # slot is released when hash is done, even if request has been cancelled while it is hashed
+        future.add_done_callback(self.__release)
+        return await asyncio.wrap_future(future)
+
+    def __release(self, _: Future) -> None:
+        with self.__lock:
+            self.__pending -= 1
+
+
+password_hash_pool = PasswordHashPool(app_config.PASSWORD_HASH_WORKERS, app_config.PASSWORD_HASH_MAX_PENDING)
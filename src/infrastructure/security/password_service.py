@@ -1,8 +1,14 @@
 import hashlib
+import hmac
 import os
 
+from src.config import app_config
 from src.domain.auth.constants import PASSWORD_MIN_LENGTH
 from src.domain.auth.exceptions import PasswordTooShortError, WrongPasswordError
+from src.infrastructure.security.password_hash_pool import password_hash_pool
+
+HASH_NAME = "sha256"
+LEGACY_ITERATIONS = 100000
 
 
 class PasswordService:
@@ -15,17 +21,29 @@ class PasswordService:
             raise PasswordTooShortError
 
     @staticmethod
-    def create_hashed_password(password: str) -> str:
+    async def create_hashed_password(password: str) -> str:
+        return await password_hash_pool.run(
+            PasswordService.hash_password, password, app_config.PASSWORD_HASH_ITERATIONS,
+        )
+
+    @staticmethod
+    async def verify_password(try_password: str, hashed_password: str) -> None:
+        is_correct = await password_hash_pool.run(PasswordService.check_password, try_password, hashed_password)
+        if not is_correct:
+            raise WrongPasswordError
+
+    @staticmethod
+    def hash_password(password: str, iterations: int) -> str:
         salt = os.urandom(32)
         encoded_password = password.encode("UTF-8")
-        key = hashlib.pbkdf2_hmac("sha256", encoded_password, salt, 100000)
-        return key.hex() + "." + salt.hex()
+        key = hashlib.pbkdf2_hmac(HASH_NAME, encoded_password, salt, iterations)
+        return key.hex() + "." + salt.hex() + "." + str(iterations)
 
     @staticmethod
-    def verify_password(try_password: str, hashed_password: str) -> None:
+    def check_password(try_password: str, hashed_password: str) -> bool:
+        # hashes are verified with their own number of iterations, so cost can be changed
+        key, salt, *iterations = hashed_password.split(".")
+        iterations = int(iterations[0]) if iterations else LEGACY_ITERATIONS
         encoded_try_password = try_password.encode("UTF-8")
-        key, salt = hashed_password.split(".")
-        try_key = hashlib.pbkdf2_hmac("sha256", encoded_try_password, bytes.fromhex(salt), 100000)
-        real_key = bytes.fromhex(key)
-        if try_key != real_key:
-            raise WrongPasswordError
+        try_key = hashlib.pbkdf2_hmac(HASH_NAME, encoded_try_password, bytes.fromhex(salt), iterations)
+        return hmac.compare_digest(try_key, bytes.fromhex(key))
@@ -3,7 +3,7 @@ from __future__ import annotations
 import datetime
 import uuid
 
-from sqlalchemy import UniqueConstraint, text
+from sqlalchemy import Index, UniqueConstraint, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.domain.base_value_objects import UUID
@@ -21,6 +21,8 @@ class CourseRun(Base):
     id: Mapped[uuid.UUID] = mapped_column(primary_key=True)
     course_id: Mapped[uuid.UUID] = mapped_column(nullable=False)
     name: Mapped[str] = mapped_column(nullable=False)
+    season: Mapped[str] = mapped_column(nullable=False)
+    year: Mapped[int] = mapped_column(nullable=False)
     is_archive: Mapped[bool] = mapped_column(nullable=False, default=False)
 
     created_at: Mapped[datetime.datetime] = mapped_column(
@@ -31,7 +33,11 @@ class CourseRun(Base):
         onupdate=datetime.datetime.utcnow,
     )
 
-    __table_args__ = (UniqueConstraint("course_id", "name", name="uix_course_id_name"),)
+    __table_args__ = (
+        UniqueConstraint("course_id", "name", name="uix_course_id_name"),
+        # actual runs of all courses are found by season and year
+        Index("ix_course_runs__year_season", "year", "season", postgresql_where=text("NOT is_archive")),
+    )
 
     @staticmethod
     def from_domain(course_run: CourseRunEntity) -> CourseRun:
@@ -39,6 +45,8 @@ class CourseRun(Base):
             id=course_run.id.value,
             course_id=course_run.course_id.value,
             name=course_run.name.value,
+            season=course_run.name.season,
+            year=course_run.name.year,
         )
 
     def to_domain(self) -> CourseRunEntity:
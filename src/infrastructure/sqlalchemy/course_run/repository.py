@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from sqlalchemy import select
+from sqlalchemy import select, tuple_
 from sqlalchemy.exc import NoResultFound
 
 from src.domain.course_run.course_run_repository import ICourseRunRepository
@@ -57,3 +57,13 @@ class SQLAlchemyCourseRunRepository(ICourseRunRepository):
         result = await self.session.execute(query)
         course_runs = result.unique().scalars().all()
         return [course_run.to_domain() for course_run in course_runs]
+
+    async def get_actual_ids(self, seasons: list[tuple[str, int]]) -> dict[str, str]:
+        query = (
+            select(CourseRun.course_id, CourseRun.id)
+            .where(CourseRun.is_archive.is_(False), tuple_(CourseRun.season, CourseRun.year).in_(seasons))
+            .order_by(CourseRun.course_id, CourseRun.created_at.desc())
+            .distinct(CourseRun.course_id)
+        )
+        result = await self.session.execute(query)
+        return {str(course_id): str(course_run_id) for course_id, course_run_id in result.all()}
@@ -4,7 +4,8 @@ import datetime
 import json
 import uuid
 
-from sqlalchemy import ForeignKey, Text, text
+from sqlalchemy import DDL, Computed, ForeignKey, Index, Text, event, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.domain.base_value_objects import UUID
@@ -22,6 +23,12 @@ from src.domain.courses.value_objects import (
 )
 from src.infrastructure.sqlalchemy.session import Base
 
+SEARCH_CONFIG = "russian"
+SEARCH_DOCUMENT = (
+    f"to_tsvector('{SEARCH_CONFIG}', "
+    "coalesce(name, '') || ' ' || coalesce(description, '') || ' ' || coalesce(topics, ''))"
+)
+
 
 class Course(Base):
 
@@ -48,6 +55,10 @@ class Course(Base):
     format: Mapped[str] = mapped_column(nullable=True)
     terms: Mapped[str] = mapped_column(nullable=True)
 
+    search_document: Mapped[str] = mapped_column(
+        TSVECTOR, Computed(SEARCH_DOCUMENT, persisted=True), nullable=True, deferred=True,
+    )
+
     roles: Mapped[list[RoleForCourse]] = relationship(back_populates="course")
     periods: Mapped[list[PeriodForCourse]] = relationship(back_populates="course")
     runs: Mapped[list[RunForCourse]] = relationship(back_populates="course")
@@ -60,6 +71,11 @@ class Course(Base):
         onupdate=datetime.datetime.utcnow,
     )
 
+    __table_args__ = (
+        Index("ix_courses_search_document", "search_document", postgresql_using="gin"),
+        Index("ix_courses_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+    )
+
     @staticmethod
     def from_domain(course: CourseEntity) -> Course:
         resources_json_string = json.dumps(course.resources)
@@ -111,6 +127,9 @@ class Course(Base):
         )
 
 
+event.listen(Course.__table__, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
+
 class RoleForCourse(Base):
 
     """SQLAlchemy model of Role for course."""
@@ -3,19 +3,34 @@ from __future__ import annotations
 import json
 from typing import TYPE_CHECKING
 
-from sqlalchemy import select
+from sqlalchemy import String, Text, and_, cast, delete, func, insert, literal, literal_column, or_, select
+from sqlalchemy.dialects.postgresql import ARRAY, array
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import NoResultFound
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import selectinload
 
 from src.domain.courses.course_repository import ICourseRepository
 from src.domain.courses.exceptions import CourseNotFoundError
-from src.infrastructure.sqlalchemy.courses.models import Course, PeriodForCourse, RoleForCourse, RunForCourse
+from src.infrastructure.sqlalchemy.courses.models import (
+    SEARCH_CONFIG,
+    Course,
+    PeriodForCourse,
+    RoleForCourse,
+    RunForCourse,
+)
+
+SAVE_BATCH_SIZE = 500  # 15 parameters per course, PostgreSQL allows 32767 parameters in statement
 
 if TYPE_CHECKING:
+    import uuid
+
+    from sqlalchemy import Select
     from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.orm import InstrumentedAttribute
 
     from src.domain.base_value_objects import UUID
     from src.domain.courses.entities import CourseEntity
+    from src.domain.courses.filters import CourseFilter
     from src.domain.courses.value_objects import CourseName
 
 
@@ -26,6 +41,16 @@ class SQLAlchemyCourseRepository(ICourseRepository):
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
+    @staticmethod
+    def __select_courses() -> Select:
+        # one row per course, every relation is loaded by one more query instead of joining them all
+        return (
+            select(Course)
+            .options(selectinload(Course.roles))
+            .options(selectinload(Course.periods))
+            .options(selectinload(Course.runs))
+        )
+
     async def create(self, course: CourseEntity) -> None:
         course_ = Course.from_domain(course)
         self.session.add(course_)
@@ -45,19 +70,84 @@ class SQLAlchemyCourseRepository(ICourseRepository):
         course_.implementer = course.implementer.value if course.implementer else None
         course_.format = course.format.value if course.format else None
         course_.terms = course.terms.value if course.terms else None
+        # columns with the same values are not written by flush, rows of unchanged values are kept
+        await self.__update_values(
+            RoleForCourse.role_name, course_.id,
+            [role.role_name for role in course_.roles], [role.value for role in course.roles],
+        )
+        await self.__update_values(
+            PeriodForCourse.period_name, course_.id,
+            [period.period_name for period in course_.periods], [period.value for period in course.periods],
+        )
+        await self.__update_values(
+            RunForCourse.run_name, course_.id,
+            [run.run_name for run in course_.runs], [run.value for run in course.last_runs],
+        )
 
-        for role in course_.roles:
-            await self.session.delete(role)
-
-        for period in course_.periods:
-            await self.session.delete(period)
-
-        for run in course_.runs:
-            await self.session.delete(run)
-
-        course_.roles = [RoleForCourse(course_id=course.id, role_name=role.value) for role in course.roles]
-        course_.periods = [PeriodForCourse(course_id=course.id, period_name=period.value) for period in course.periods]
-        course_.runs = [RunForCourse(course_id=course.id, run_name=run.value) for run in course.last_runs]
+    async def __update_values(
+            self, column: InstrumentedAttribute, course_id: uuid.UUID, old_values: list[str], new_values: list[str],
+    ) -> None:
+        model = column.class_
+        removed_values = set(old_values) - set(new_values)
+        added_values = list(dict.fromkeys(value for value in new_values if value not in old_values))
+        if removed_values:
+            statement = (
+                delete(model)
+                .where(model.course_id == course_id, column.in_(removed_values))
+                .execution_options(synchronize_session=False)  # loaded course is expired by commit
+            )
+            await self.session.execute(statement)
+        if added_values:
+            rows = [{"course_id": course_id, column.key: value} for value in added_values]
+            await self.session.execute(insert(model).values(rows))
+
+    async def save_many(self, courses: list[CourseEntity]) -> None:
+        for start in range(0, len(courses), SAVE_BATCH_SIZE):
+            batch = courses[start:start + SAVE_BATCH_SIZE]
+            rows = [self.__to_row(course) for course in batch]
+            statement = pg_insert(Course).values(rows)
+            replaced_columns = {name: statement.excluded[name] for name in rows[0] if name != "id"}
+            statement = statement.on_conflict_do_update(
+                index_elements=[Course.id],
+                set_={**replaced_columns, "updated_at": func.timezone("utc", func.now())},
+            )
+            await self.session.execute(statement)
+            course_ids = [course.id.value for course in batch]
+            relations = (
+                (RoleForCourse.role_name, "roles"),
+                (PeriodForCourse.period_name, "periods"),
+                (RunForCourse.run_name, "last_runs"),
+            )
+            # one statement per relation for the whole batch, old values of courses are replaced
+            for column, attribute in relations:
+                model = column.class_
+                await self.session.execute(delete(model).where(model.course_id.in_(course_ids)))
+                child_rows = [
+                    {"course_id": course.id.value, column.key: value}
+                    for course in batch for value in dict.fromkeys(item.value for item in getattr(course, attribute))
+                ]
+                if child_rows:
+                    await self.session.execute(insert(model).values(child_rows))
+
+    @staticmethod
+    def __to_row(course: CourseEntity) -> dict:
+        return {
+            "id": course.id.value,
+            "name": course.name.value,
+            "image_url": course.image_url,
+            "limits": course.limits,
+            "is_draft": course.is_draft,
+            "prerequisites": course.prerequisites,
+            "description": course.description,
+            "topics": course.topics,
+            "assessment": course.assessment,
+            "resources": json.dumps([{"link": res.link, "title": res.title} for res in course.resources]),
+            "extra": course.extra,
+            "author": course.author.value if course.author else None,
+            "implementer": course.implementer.value if course.implementer else None,
+            "format": course.format.value if course.format else None,
+            "terms": course.terms.value if course.terms else None,
+        }
 
     async def update_draft_status(self, course: CourseEntity) -> None:
         course_ = await self.__get_by_id(course.id)
@@ -77,41 +167,80 @@ class SQLAlchemyCourseRepository(ICourseRepository):
 
     async def get_by_name(self, course_name: CourseName) -> CourseEntity:
         query = (
-            select(Course)
-            .options(joinedload(Course.roles))
-            .options(joinedload(Course.periods))
-            .options(joinedload(Course.runs))
+            self.__select_courses()
             .filter_by(name=course_name.value, is_archive=False)
         )
         try:
             result = await self.session.execute(query)
-            course_ = result.unique().scalars().one()
+            course_ = result.scalars().one()
             return course_.to_domain()
         except NoResultFound as ex:
             raise CourseNotFoundError from ex
 
     async def __get_by_id(self, course_id: UUID) -> Course:
         query = (
-            select(Course)
-            .options(joinedload(Course.roles))
-            .options(joinedload(Course.periods))
-            .options(joinedload(Course.runs))
+            self.__select_courses()
             .filter_by(id=course_id.value, is_archive=False)
         )
         try:
             result = await self.session.execute(query)
-            return result.unique().scalars().one()
+            return result.scalars().one()
         except NoResultFound as ex:
             raise CourseNotFoundError from ex
 
     async def get_all(self) -> list[CourseEntity]:
         query = (
-            select(Course)
-            .options(joinedload(Course.roles))
-            .options(joinedload(Course.periods))
-            .options(joinedload(Course.runs))
+            self.__select_courses()
             .filter_by(is_archive=False)
+            .order_by(Course.name, Course.id)
         )
         result = await self.session.execute(query)
-        courses = result.unique().scalars().all()
+        courses = result.scalars().all()
+        return [course.to_domain() for course in courses]
+
+    async def get_page(
+            self, filters: CourseFilter, actual_run: str, after: list[str] | None, limit: int,
+    ) -> list[CourseEntity]:
+        query = (
+            self.__select_courses()
+            .filter_by(is_archive=False, is_draft=False)
+        )
+        if filters.roles:
+            roles_query = select(RoleForCourse.course_id).where(RoleForCourse.role_name.in_(filters.roles))
+            query = query.where(Course.id.in_(roles_query))
+        if filters.implementers:
+            query = query.where(Course.implementer.in_(filters.implementers))
+        if filters.formats:
+            query = query.where(Course.format.in_(filters.formats))
+        if filters.terms:
+            terms = func.string_to_array(Course.terms, ", ", type_=ARRAY(Text))
+            query = query.where(terms.overlap(cast(array(filters.terms), ARRAY(Text))))
+        if filters.query:
+            query = query.where(Course.name.icontains(filters.query, autoescape=True))
+        if filters.only_actual:
+            runs_query = select(RunForCourse.course_id).where(RunForCourse.run_name == actual_run)
+            query = query.where(Course.id.in_(runs_query))
+        if after is not None:
+            name, course_id = after
+            query = query.where(or_(Course.name > name, and_(Course.name == name, Course.id > course_id)))
+        query = query.order_by(Course.name, Course.id).limit(limit)
+        result = await self.session.execute(query)
+        courses = result.scalars().all()
+        return [course.to_domain() for course in courses]
+
+    async def search(self, query: str, limit: int) -> list[CourseEntity]:
+        ts_query = func.websearch_to_tsquery(literal_column(f"'{SEARCH_CONFIG}'::regconfig"), query)
+        rank = func.ts_rank(Course.search_document, ts_query) + func.word_similarity(query, Course.name)
+        statement = (
+            self.__select_courses()
+            .filter_by(is_archive=False, is_draft=False)
+            .where(or_(
+                Course.search_document.bool_op("@@")(ts_query),
+                literal(query, String).bool_op("<%")(Course.name),  # typo tolerance by trigrams
+            ))
+            .order_by(rank.desc(), Course.name)
+            .limit(limit)
+        )
+        result = await self.session.execute(statement)
+        courses = result.scalars().all()
         return [course.to_domain() for course in courses]
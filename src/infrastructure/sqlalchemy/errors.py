@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from sqlalchemy.exc import IntegrityError
+
+
+def get_violated_constraint(ex: IntegrityError) -> str | None:
+    """Get name of constraint or unique index violated in the database.
+
+    asyncpg error is the cause of DBAPI error wrapped by SQLAlchemy.
+
+    :param ex:
+    :return: None if name is unknown
+    """
+    return getattr(ex.orig.__cause__, "constraint_name", None)
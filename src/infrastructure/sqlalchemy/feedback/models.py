@@ -3,14 +3,17 @@ from __future__ import annotations
 import datetime
 import uuid
 
-from sqlalchemy import Date, ForeignKey, Integer, Text, text
+from sqlalchemy import Date, ForeignKey, Index, Integer, Text, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.domain.base_value_objects import UUID
-from src.domain.feedback.entities import FeedbackEntity
+from src.domain.feedback.contants import MAX_RATING_VALUE, MIN_RATING_VALUE
+from src.domain.feedback.entities import CourseRatingEntity, FeedbackEntity
 from src.domain.feedback.value_objects import FeedbackText, Rating, Vote
 from src.infrastructure.sqlalchemy.session import Base
 
+AUTHOR_FEEDBACK_INDEX = "ix_feedbacks__author_id_course_id"
+
 
 class Feedback(Base):
 
@@ -25,6 +28,8 @@ class Feedback(Base):
     rating: Mapped[int] = mapped_column(Integer, server_default="5", nullable=False)
     votes: Mapped[list[VoteForFeedback]] = relationship(back_populates="feedback")
     date: Mapped[datetime.date] = mapped_column(Date, nullable=False)
+    like_count: Mapped[int] = mapped_column(Integer, server_default="0", nullable=False)
+    dislike_count: Mapped[int] = mapped_column(Integer, server_default="0", nullable=False)
 
     is_archive: Mapped[bool] = mapped_column(nullable=False, default=False)
 
@@ -36,6 +41,28 @@ class Feedback(Base):
         onupdate=datetime.datetime.utcnow,
     )
 
+    __table_args__ = (
+        # only one feedback of user for course
+        Index(
+            AUTHOR_FEEDBACK_INDEX, "author_id", "course_id",
+            unique=True, postgresql_where=text("NOT is_archive"),
+        ),
+        # keyset pages of feedbacks of course sorted by newest and by rating
+        Index(
+            "ix_feedbacks__course_id_date", "course_id", text("date DESC"), text("id DESC"),
+            postgresql_where=text("NOT is_archive"),
+        ),
+        Index(
+            "ix_feedbacks__course_id_rating", "course_id", text("rating DESC"), text("date DESC"), text("id DESC"),
+            postgresql_where=text("NOT is_archive"),
+        ),
+        Index(
+            "ix_feedbacks__course_id_reputation",
+            "course_id", text("(like_count - dislike_count) DESC"), text("date DESC"), text("id DESC"),
+            postgresql_where=text("NOT is_archive"),
+        ),
+    )
+
     @staticmethod
     def from_domain(feedback: FeedbackEntity) -> Feedback:
         return Feedback(
@@ -45,6 +72,8 @@ class Feedback(Base):
             content=feedback.text.value,
             rating=feedback.rating.value,
             date=feedback.date,
+            like_count=feedback.like_count,
+            dislike_count=feedback.dislike_count,
             votes=[
                 VoteForFeedback(
                     feedback_id=uuid.UUID(feedback.id.value),
@@ -64,6 +93,8 @@ class Feedback(Base):
             rating=Rating(self.rating),
             votes={Vote(user_id=UUID(str(vote.user_id)), vote_type=vote.vote_type) for vote in self.votes},
             date=self.date,
+            like_count=self.like_count,
+            dislike_count=self.dislike_count,
         )
 
 
@@ -88,3 +119,43 @@ class VoteForFeedback(Base):
            user_id=uuid.UUID(vote.user_id.value),
            vote_type=vote.vote_type,
         )
+
+
+class CourseRating(Base):
+
+    """SQLAlchemy model of summary of ratings for course, it is changed by repository of feedbacks."""
+
+    __tablename__ = "course_ratings"
+
+    course_id: Mapped[uuid.UUID] = mapped_column(primary_key=True)
+    feedback_count: Mapped[int] = mapped_column(Integer, server_default="0", nullable=False)
+    rating_sum: Mapped[int] = mapped_column(Integer, server_default="0", nullable=False)
+    rating_1_count: Mapped[int] = mapped_column(Integer, server_default="0", nullable=False)
+    rating_2_count: Mapped[int] = mapped_column(Integer, server_default="0", nullable=False)
+    rating_3_count: Mapped[int] = mapped_column(Integer, server_default="0", nullable=False)
+    rating_4_count: Mapped[int] = mapped_column(Integer, server_default="0", nullable=False)
+    rating_5_count: Mapped[int] = mapped_column(Integer, server_default="0", nullable=False)
+    weighted_rating_sum: Mapped[int] = mapped_column(Integer, server_default="0", nullable=False)
+    weight_sum: Mapped[int] = mapped_column(Integer, server_default="0", nullable=False)
+
+    updated_at: Mapped[datetime.datetime] = mapped_column(
+        server_default=text("TIMEZONE('utc', now())"),
+        onupdate=datetime.datetime.utcnow,
+    )
+
+    @staticmethod
+    def get_rating_count_name(rating: int) -> str:
+        return f"rating_{rating}_count"
+
+    def to_domain(self) -> CourseRatingEntity:
+        return CourseRatingEntity(
+            course_id=UUID(str(self.course_id)),
+            count=self.feedback_count,
+            rating_sum=self.rating_sum,
+            histogram=[
+                getattr(self, self.get_rating_count_name(rating))
+                for rating in range(MIN_RATING_VALUE, MAX_RATING_VALUE + 1)
+            ],
+            weighted_rating_sum=self.weighted_rating_sum,
+            weight_sum=self.weight_sum,
+        )
@@ -1,19 +1,26 @@
 from __future__ import annotations
 
+import datetime
+import uuid
 from typing import TYPE_CHECKING
 
-from sqlalchemy import select
+from sqlalchemy import and_, delete, func, literal_column, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import NoResultFound
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, noload
 
-from src.domain.feedback.exceptions import FeedbackNotFoundError, OnlyOneFeedbackForCourseError
+from src.domain.base_value_objects import UUID
+from src.domain.feedback.entities import CourseRatingEntity, get_feedback_weight
+from src.domain.feedback.exceptions import FeedbackNotFoundError
 from src.domain.feedback.feedback_repository import IFeedbackRepository
-from src.infrastructure.sqlalchemy.feedback.models import Feedback, VoteForFeedback
+from src.domain.feedback.value_objects import Vote
+from src.infrastructure.sqlalchemy.feedback.models import CourseRating, Feedback, VoteForFeedback
 
 if TYPE_CHECKING:
+    from sqlalchemy import CTE, ScalarSelect, Update
     from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.orm import InstrumentedAttribute
 
-    from src.domain.base_value_objects import UUID
     from src.domain.feedback.entities import FeedbackEntity
 
 
@@ -25,57 +32,207 @@ class SQLAlchemyFeedbackRepository(IFeedbackRepository):
         self.session = session
 
     async def create(self, feedback: FeedbackEntity) -> None:
-        await self.__check_one_by_user_id_and_course_id(feedback.author_id, feedback.course_id)
+        # the second feedback of user for course is rejected by unique index on commit
         feedback_ = Feedback.from_domain(feedback)
         self.session.add(feedback_)
+        await self.__change_course_rating(feedback_.course_id, feedback_.rating, 1, feedback.weight)
 
-    async def update_votes(self, feedback: FeedbackEntity) -> None:
-        feedback_ = await self.__get_by_id(feedback.id)
-        for vote in feedback_.votes:
-            await self.session.delete(vote)
-        for vote in feedback.votes:
-            self.session.add(VoteForFeedback.from_domain(vote, feedback.id))
+    async def set_vote(self, feedback_id: UUID, vote: Vote) -> tuple[int, int]:
+        # one statement: vote is inserted or its type is changed, counters follow the affected row
+        upsert = pg_insert(VoteForFeedback).values(
+            feedback_id=feedback_id.value, user_id=vote.user_id.value, vote_type=vote.vote_type,
+        )
+        upserted = (
+            upsert.on_conflict_do_update(
+                index_elements=[VoteForFeedback.feedback_id, VoteForFeedback.user_id],
+                set_={"vote_type": upsert.excluded.vote_type},
+                where=VoteForFeedback.vote_type != upsert.excluded.vote_type,
+            )
+            .returning(literal_column("xmax = 0").label("is_inserted"))
+            .cte("upserted")
+        )
+        added = select(func.count()).select_from(upserted).scalar_subquery()
+        replaced = select(func.count()).select_from(upserted).where(upserted.c.is_inserted.is_(False)).scalar_subquery()
+        added_column, replaced_column = self.__get_counters(vote.vote_type)
+        sign = 1 if vote.vote_type == "like" else -1
+        query = (
+            update(Feedback)
+            .where(Feedback.id == feedback_id.value)
+            .values({added_column: added_column + added, replaced_column: replaced_column - replaced})
+            .returning(
+                Feedback.like_count, Feedback.dislike_count, Feedback.course_id, Feedback.rating,
+                (sign * (added + replaced)).label("reputation_delta"),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return await self.__update_counters(query)
+
+    async def delete_vote(self, feedback_id: UUID, user_id: UUID) -> tuple[int, int]:
+        deleted = (
+            delete(VoteForFeedback)
+            .filter_by(feedback_id=feedback_id.value, user_id=user_id.value)
+            .returning(VoteForFeedback.vote_type)
+            .cte("deleted")
+        )
+        deleted_likes = self.__count_deleted(deleted, "like")
+        deleted_dislikes = self.__count_deleted(deleted, "dislike")
+        query = (
+            update(Feedback)
+            .where(Feedback.id == feedback_id.value)
+            .values(
+                like_count=Feedback.like_count - deleted_likes,
+                dislike_count=Feedback.dislike_count - deleted_dislikes,
+            )
+            .returning(
+                Feedback.like_count, Feedback.dislike_count, Feedback.course_id, Feedback.rating,
+                (deleted_dislikes - deleted_likes).label("reputation_delta"),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return await self.__update_counters(query)
+
+    async def __update_counters(self, query: Update) -> tuple[int, int]:
+        result = await self.session.execute(query)
+        like_count, dislike_count, course_id, rating, reputation_delta = result.one()
+        # counters are returned after the change, so the change of weight is exact under concurrent votes
+        reputation = like_count - dislike_count
+        weight_delta = get_feedback_weight(reputation) - get_feedback_weight(reputation - reputation_delta)
+        if weight_delta:
+            await self.__change_course_rating(course_id, rating, 0, weight_delta)
+        return like_count, dislike_count
+
+    async def __change_course_rating(self, course_id: uuid.UUID, rating: int, count: int, weight: int) -> None:
+        # count and weight are signed, so the same upsert adds feedback to summary and removes it
+        values = {
+            "course_id": course_id,
+            "feedback_count": count,
+            "rating_sum": rating * count,
+            CourseRating.get_rating_count_name(rating): count,
+            "weighted_rating_sum": rating * weight,
+            "weight_sum": weight,
+        }
+        statement = pg_insert(CourseRating).values(values)
+        changed_columns = {name: getattr(CourseRating, name) + statement.excluded[name] for name in values}
+        del changed_columns["course_id"]
+        statement = statement.on_conflict_do_update(
+            index_elements=[CourseRating.course_id],
+            set_={**changed_columns, "updated_at": func.timezone("utc", func.now())},
+        )
+        await self.session.execute(statement)
+
+    async def get_course_ratings(self, course_ids: list[UUID]) -> list[CourseRatingEntity]:
+        query = select(CourseRating).where(CourseRating.course_id.in_([course_id.value for course_id in course_ids]))
+        result = await self.session.execute(query)
+        ratings = {str(rating.course_id): rating.to_domain() for rating in result.scalars().all()}
+        # courses without feedbacks have no summary
+        return [ratings.get(course_id.value, CourseRatingEntity(course_id)) for course_id in course_ids]
+
+    @staticmethod
+    def __get_counters(vote_type: str) -> tuple[InstrumentedAttribute, InstrumentedAttribute]:
+        if vote_type == "like":
+            return Feedback.like_count, Feedback.dislike_count
+        return Feedback.dislike_count, Feedback.like_count
+
+    @staticmethod
+    def __count_deleted(deleted: CTE, vote_type: str) -> ScalarSelect:
+        return select(func.count()).select_from(deleted).where(deleted.c.vote_type == vote_type).scalar_subquery()
 
     async def delete(self, feedback_id: UUID) -> None:
         feedback_ = await self.__get_by_id(feedback_id)
         feedback_.is_archive = True  # to avoid cascade deleting
+        weight = get_feedback_weight(feedback_.like_count - feedback_.dislike_count)
+        await self.__change_course_rating(feedback_.course_id, feedback_.rating, -1, -weight)
 
     async def get_one_by_id(self, feedback_id: UUID) -> FeedbackEntity:
         feedback_ = await self.__get_by_id(feedback_id)
         return feedback_.to_domain()
 
-    async def __get_by_id(self, feedback_id: UUID) -> Feedback:
+    async def get_one_by_id_with_user_vote(self, feedback_id: UUID, user_id: UUID) -> FeedbackEntity:
         query = (
-            select(Feedback)
-            .options(joinedload(Feedback.votes))
+            select(Feedback, VoteForFeedback.vote_type)
+            .options(noload(Feedback.votes))
+            .outerjoin(
+                VoteForFeedback,
+                and_(VoteForFeedback.feedback_id == Feedback.id, VoteForFeedback.user_id == user_id.value),
+            )
             .filter_by(id=feedback_id.value, is_archive=False)
         )
         try:
             result = await self.session.execute(query)
-            return result.unique().scalars().one()
+            feedback_, vote_type = result.one()
         except NoResultFound as ex:
             raise FeedbackNotFoundError from ex
+        feedback = feedback_.to_domain()
+        if vote_type is not None:  # counters are already loaded, so only the set of votes is changed
+            feedback.votes.add(Vote(user_id, vote_type))
+        return feedback
 
-    async def __check_one_by_user_id_and_course_id(self, author_id: UUID, course_id: UUID) -> None:
+    async def __get_by_id(self, feedback_id: UUID) -> Feedback:
         query = (
-            select(Feedback.id)
-            .filter_by(author_id=author_id.value, course_id=course_id.value, is_archive=False)
+            select(Feedback)
+            .options(joinedload(Feedback.votes))
+            .filter_by(id=feedback_id.value, is_archive=False)
         )
         try:
             result = await self.session.execute(query)
-            feedback_id = result.unique().scalar()
-            if feedback_id:
-                raise OnlyOneFeedbackForCourseError
-        except NoResultFound:
-            pass
+            return result.unique().scalars().one()
+        except NoResultFound as ex:
+            raise FeedbackNotFoundError from ex
 
     async def get_all_by_course_id(self, course_id: UUID) -> list[FeedbackEntity]:
         query = (
             select(Feedback)
-            .options(joinedload(Feedback.votes))
+            .options(noload(Feedback.votes))
             .filter_by(course_id=course_id.value, is_archive=False)
             .order_by(Feedback.date.desc())
         )
         result = await self.session.execute(query)
-        feedbacks = result.unique().scalars().all()
+        feedbacks = result.scalars().all()
+        return [feedback.to_domain() for feedback in feedbacks]
+
+    async def get_page_by_course_id(
+            self, course_id: UUID, sort: str, after: list[str] | None, limit: int,
+    ) -> list[FeedbackEntity]:
+        sort_columns = {
+            "newest": [Feedback.date, Feedback.id],
+            "rating": [Feedback.rating, Feedback.date, Feedback.id],
+            "reputation": [Feedback.like_count - Feedback.dislike_count, Feedback.date, Feedback.id],
+        }[sort]
+        query = (
+            select(Feedback)
+            .options(noload(Feedback.votes))
+            .filter_by(course_id=course_id.value, is_archive=False)
+        )
+        if after is not None:
+            *scores, date, feedback_id = after
+            after_values = [*map(int, scores), datetime.date.fromisoformat(date), uuid.UUID(feedback_id)]
+            # every column is in descending order, so the next rows are less than the key
+            query = query.where(tuple_(*sort_columns) < tuple_(*after_values))
+        query = query.order_by(*[column.desc() for column in sort_columns]).limit(limit)
+        result = await self.session.execute(query)
+        feedbacks = result.scalars().all()
         return [feedback.to_domain() for feedback in feedbacks]
+
+    async def get_user_votes(self, course_id: UUID, user_id: UUID) -> dict[str, str]:
+        query = (
+            select(VoteForFeedback.feedback_id, VoteForFeedback.vote_type)
+            .join(Feedback)
+            .where(
+                Feedback.course_id == course_id.value,
+                Feedback.is_archive.is_(False),
+                VoteForFeedback.user_id == user_id.value,
+            )
+        )
+        result = await self.session.execute(query)
+        return {str(feedback_id): vote_type for feedback_id, vote_type in result.all()}
+
+    async def get_most_discussed_course_ids(self, limit: int) -> list[UUID]:
+        query = (
+            select(Feedback.course_id)
+            .filter_by(is_archive=False)
+            .group_by(Feedback.course_id)
+            .order_by(func.count().desc(), Feedback.course_id)
+            .limit(limit)
+        )
+        result = await self.session.execute(query)
+        return [UUID(str(course_id)) for course_id in result.scalars().all()]
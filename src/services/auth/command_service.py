@@ -30,7 +30,7 @@ class AuthCommandService:
         role = UserRole(TALENT_ROLE)
         email = Email(email_)
         PasswordService.validate_password(password_)
-        hashed_password = PasswordService.create_hashed_password(password_)
+        hashed_password = await PasswordService.create_hashed_password(password_)
         user = UserEntity(user_id, firstname, lastname, role, email, hashed_password)
         auth_token = str(uuid.uuid4())
         profile = TalentProfileEntity(user_id)
@@ -51,7 +51,7 @@ class AuthCommandService:
         email = Email(email_)
         auth_token = str(uuid.uuid4())
         user = await self.uow.user_repo.get_by_email(email)
-        PasswordService.verify_password(password_, user.hashed_password)
+        await PasswordService.verify_password(password_, user.hashed_password)
         await self.session_service.set(auth_token, user)
         return auth_token
 
@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class CacheEntry(Generic[T]):
+
+    """Cached value with its freshness: stale values are served while they are refreshed."""
+
+    value: T
+    is_stale: bool
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import datetime
+from typing import TYPE_CHECKING
+
+from src.domain.base_value_objects import UUID
+from src.domain.course_run.entities import get_actual_seasons
+from src.domain.course_run.exceptions import NoActualCourseRunError
+
+if TYPE_CHECKING:
+    from src.domain.course_run.course_run_repository import ICourseRunRepository
+    from src.services.course_run.course_run_cache_service import CourseRunCacheService
+
+
+async def get_actual_course_run_id(
+        course_id: UUID, course_run_repo: ICourseRunRepository, course_run_cache_service: CourseRunCacheService,
+) -> UUID:
+    """Get id of actual run of course.
+
+    Actual runs of all courses are found by one query and cached until runs are created or deleted.
+
+    :param course_id:
+    :param course_run_repo:
+    :param course_run_cache_service:
+    :return:
+    """
+    seasons = get_actual_seasons(datetime.datetime.now().date())
+    course_run_ids = await course_run_cache_service.get_actual_ids(seasons)
+    if course_run_ids is None:
+        course_run_ids = await course_run_repo.get_actual_ids(seasons)
+        await course_run_cache_service.set_actual_ids(seasons, course_run_ids)
+    course_run_id = course_run_ids.get(course_id.value)
+    if course_run_id is None:
+        raise NoActualCourseRunError
+    return UUID(course_run_id)
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import datetime
 import uuid
 from typing import TYPE_CHECKING
 
@@ -8,13 +7,15 @@ from sqlalchemy.exc import IntegrityError
 
 from src.domain.base_value_objects import UUID
 from src.domain.course_run.entities import CourseRunEntity
-from src.domain.course_run.exceptions import CourseRunAlreadyExistsError, NoActualCourseRunError
+from src.domain.course_run.exceptions import CourseRunAlreadyExistsError
 from src.domain.courses.value_objects import CourseRun
 from src.domain.timetable.exceptions import NoActualTimetableError
+from src.services.course_run.actual_course_run import get_actual_course_run_id
 
 if TYPE_CHECKING:
     from src.domain.group_google_calendar.entities import GroupGoogleCalendarEntity
     from src.domain.timetable.entities import TimetableEntity
+    from src.services.course_run.course_run_cache_service import CourseRunCacheService
     from src.services.course_run.unit_of_work import CourseRunUnitOfWork
 
 
@@ -22,8 +23,9 @@ class CourseRunCommandService:
 
     """Class implemented CQRS pattern, command class."""
 
-    def __init__(self, uow: CourseRunUnitOfWork) -> None:
+    def __init__(self, uow: CourseRunUnitOfWork, course_run_cache_service: CourseRunCacheService) -> None:
         self.uow = uow
+        self.course_run_cache_service = course_run_cache_service
 
     async def create_course_run(self, course_id: str, season: str, year: int) -> str:
         course_run_id = UUID(str(uuid.uuid4()))
@@ -39,6 +41,7 @@ class CourseRunCommandService:
         except Exception:
             await self.uow.rollback()
             raise
+        await self.course_run_cache_service.delete_actual_ids()
         return course_run_id.value
 
     async def delete_course_run(self, course_run_id: str) -> None:
@@ -52,6 +55,7 @@ class CourseRunCommandService:
         except Exception:
             await self.uow.rollback()
             raise
+        await self.course_run_cache_service.delete_actual_ids()
 
     async def get_course_run_by_id(self, course_run_id: str) -> CourseRunEntity:
         course_run_id = UUID(course_run_id)
@@ -64,15 +68,12 @@ class CourseRunCommandService:
     async def get_actual_timetable_by_id(
             self, course_id: str,
     ) -> tuple[TimetableEntity, CourseRunEntity, list[GroupGoogleCalendarEntity]]:
-        current_date = datetime.datetime.now().date()
-        course_id = UUID(course_id)
-        course_runs = await self.uow.course_run_repo.get_all_by_course_id(course_id)
-        for course_run in course_runs:
-            if course_run.is_actual_by_date(current_date):
-                error_message = "Для актуального запуска еще не создано расписание"
-                timetable = await self.uow.timetable_repo.get_by_id(course_run.id)
-                google_timetable_groups = await self.uow.ggc_repo.get_all_by_course_run_id(course_run.id)
-                if not timetable.lessons and not google_timetable_groups:
-                    raise NoActualTimetableError(error_message=error_message)
-                return timetable, course_run, google_timetable_groups
-        raise NoActualCourseRunError
+        course_run_id = await get_actual_course_run_id(
+            UUID(course_id), self.uow.course_run_repo, self.course_run_cache_service,
+        )
+        course_run = await self.uow.course_run_repo.get_by_id(course_run_id)
+        timetable = await self.uow.timetable_repo.get_by_id(course_run.id)
+        google_timetable_groups = await self.uow.ggc_repo.get_all_by_course_run_id(course_run.id)
+        if not timetable.lessons and not google_timetable_groups:
+            raise NoActualTimetableError(error_message="Для актуального запуска еще не создано расписание")
+        return timetable, course_run, google_timetable_groups
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+
+class CourseRunCacheService(ABC):
+
+    """Base class for cache of course runs as service."""
+
+    @abstractmethod
+    async def get_actual_ids(self, seasons: list[tuple[str, int]]) -> dict[str, str] | None:
+        """Get ids of actual runs by course ids, None if they are not cached for these seasons."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set_actual_ids(self, seasons: list[tuple[str, int]], course_run_ids: dict[str, str]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_actual_ids(self) -> None:
+        raise NotImplementedError
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import bisect
+import dataclasses
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from src.domain.base_value_objects import UUID
+    from src.domain.courses.entities import CourseEntity
+    from src.domain.courses.filters import CourseFilter
+
+
+class CatalogIndex:
+
+    """In-memory inverted index of published courses for catalog filtering.
+
+    Courses keep order of (name, id) like keyset pages of catalog, changed courses are placed by this order.
+    Ids of courses found by filters and counts of facets are kept until the index is changed.
+    """
+
+    FACETS = ("roles", "implementers", "formats", "terms", "runs")
+    COUNTED_FACETS = ("roles", "implementers", "formats", "terms")
+    MAX_CACHED_RESULTS = 256
+
+    def __init__(self) -> None:
+        self.version: str | None = None
+        self.__courses: dict[str, CourseEntity] = {}
+        self.__order: list[str] = []
+        self.__positions: dict[str, int] = {}
+        self.__names: dict[str, str] = {}
+        self.__postings: dict[str, dict[str, set[str]]] = {facet: {} for facet in self.FACETS}
+        self.__results: OrderedDict[tuple[str, str], list[str]] = OrderedDict()
+        self.__facet_counts: OrderedDict[tuple[str, str], dict[str, dict[str, int]]] = OrderedDict()
+
+    def build(self, courses: list[CourseEntity], version: str | None) -> None:
+        self.__courses.clear()
+        self.__positions.clear()
+        self.__names.clear()
+        for postings in self.__postings.values():
+            postings.clear()
+        self.__clear_results()
+        for course in courses:
+            if not course.is_draft:
+                self.__add(course)
+        self.__order = [course.id.value for course in courses if not course.is_draft]
+        self.__update_positions()
+        self.version = version
+
+    def update(self, course: CourseEntity) -> None:
+        self.remove(course.id)
+        if course.is_draft:
+            return
+        position = bisect.bisect(self.__order, self.__get_sort_key(course), key=self.__get_sort_key_by_id)
+        self.__add(course)
+        self.__order.insert(position, course.id.value)
+        self.__update_positions()
+
+    def remove(self, course_id: UUID) -> None:
+        course = self.__courses.pop(course_id.value, None)
+        if course is None:
+            return
+        self.__clear_results()
+        self.__order.remove(course_id.value)
+        self.__update_positions()
+        del self.__names[course_id.value]
+        for facet, values in self.__get_facet_values(course):
+            for value in values:
+                self.__postings[facet][value].discard(course_id.value)
+
+    def filter(self, filters: CourseFilter, actual_run: str) -> list[CourseEntity]:
+        key = (filters.get_key(), actual_run)
+        course_ids = self.__results.get(key)
+        if course_ids is None:
+            course_ids = self.__filter_ids(filters, actual_run)
+            self.__results[key] = course_ids
+            if len(self.__results) > self.MAX_CACHED_RESULTS:
+                self.__results.popitem(last=False)
+        else:
+            self.__results.move_to_end(key)
+        return [self.__courses[course_id] for course_id in course_ids]
+
+    def count_facets(self, filters: CourseFilter, actual_run: str) -> dict[str, dict[str, int]]:
+        key = (filters.get_key(), actual_run)
+        counts = self.__facet_counts.get(key)
+        if counts is None:
+            counts = {facet: self.__count_facet(facet, filters, actual_run) for facet in self.COUNTED_FACETS}
+            self.__facet_counts[key] = counts
+            if len(self.__facet_counts) > self.MAX_CACHED_RESULTS:
+                self.__facet_counts.popitem(last=False)
+        else:
+            self.__facet_counts.move_to_end(key)
+        return counts
+
+    def __count_facet(self, facet: str, filters: CourseFilter, actual_run: str) -> dict[str, int]:
+        # values of one facet are alternatives, so the facet is counted without its own condition
+        course_ids = set(self.__match_ids(dataclasses.replace(filters, **{facet: None}), actual_run))
+        counts = {value: len(ids & course_ids) for value, ids in sorted(self.__postings[facet].items())}
+        return {value: count for value, count in counts.items() if count}
+
+    def __filter_ids(self, filters: CourseFilter, actual_run: str) -> list[str]:
+        return sorted(self.__match_ids(filters, actual_run), key=self.__positions.__getitem__)
+
+    def __match_ids(self, filters: CourseFilter, actual_run: str) -> Iterable[str]:
+        conditions = (
+            ("roles", filters.roles),
+            ("implementers", filters.implementers),
+            ("formats", filters.formats),
+            ("terms", filters.terms),
+            ("runs", [actual_run] if filters.only_actual else None),
+        )
+        candidates: set[str] | None = None
+        for facet, values in conditions:
+            if not values:
+                continue
+            matched = set().union(*(self.__postings[facet].get(value, ()) for value in values))
+            candidates = matched if candidates is None else candidates & matched
+            if not candidates:
+                return []
+        course_ids = self.__positions.keys() if candidates is None else candidates
+        if filters.query:
+            query = filters.query.lower()
+            course_ids = [course_id for course_id in course_ids if query in self.__names[course_id]]
+        return course_ids
+
+    def __add(self, course: CourseEntity) -> None:
+        self.__clear_results()
+        self.__courses[course.id.value] = course
+        self.__names[course.id.value] = course.name.value.lower()
+        for facet, values in self.__get_facet_values(course):
+            for value in values:
+                self.__postings[facet].setdefault(value, set()).add(course.id.value)
+
+    def __update_positions(self) -> None:
+        self.__positions = {course_id: position for position, course_id in enumerate(self.__order)}
+
+    def __get_sort_key_by_id(self, course_id: str) -> tuple[str, str]:
+        return self.__get_sort_key(self.__courses[course_id])
+
+    @staticmethod
+    def __get_sort_key(course: CourseEntity) -> tuple[str, str]:
+        return course.name.value, course.id.value
+
+    def __clear_results(self) -> None:
+        self.__results.clear()
+        self.__facet_counts.clear()
+
+    @staticmethod
+    def __get_facet_values(course: CourseEntity) -> list[tuple[str, list[str]]]:
+        return [
+            ("roles", [role.value for role in course.roles]),
+            ("implementers", [course.implementer.value] if course.implementer else []),
+            ("formats", [course.format.value] if course.format else []),
+            ("terms", course.terms.value.split(", ") if course.terms else []),
+            ("runs", [run.value for run in course.last_runs]),
+        ]
@@ -5,9 +5,10 @@ from typing import TYPE_CHECKING
 
 from sqlalchemy.exc import IntegrityError
 
+from src.domain.base_exceptions import DomainError
 from src.domain.base_value_objects import UUID
 from src.domain.courses.entities import CourseEntity
-from src.domain.courses.exceptions import CourseAlreadyExistsError, CourseNotFoundError
+from src.domain.courses.exceptions import CourseAlreadyExistsError, CourseImportError, CourseNotFoundError
 from src.domain.courses.value_objects import (
     Author,
     CourseName,
@@ -31,7 +32,7 @@ class CourseCommandService:
     def __init__(self, uow: CoursesUnitOfWork) -> None:
         self.uow = uow
 
-    async def create_course(self, name_: str) -> str:
+    async def create_course(self, name_: str) -> CourseEntity:
         course_id = UUID(str(uuid.uuid4()))
         name = CourseName(name_)
         course = CourseEntity(course_id, name)
@@ -44,7 +45,7 @@ class CourseCommandService:
         except Exception:
             await self.uow.rollback()
             raise
-        return course_id.value
+        return course
 
     async def update_course(
             self, course_id: str, name_: str, image_url: str | None, limits_: int | None,
@@ -52,7 +53,7 @@ class CourseCommandService:
             assessment_: str | None, resources_: list[dict[str, str]], extra_: str | None,
             author_: str | None, implementer_: str | None, format_: str | None,
             terms_: str | None, roles: list[str], periods: list[str], runs: list[str],
-    ) -> None:
+    ) -> CourseEntity:
         course = CourseEntity(
             id=UUID(str(course_id)),
             name=CourseName(name_),
@@ -81,6 +82,85 @@ class CourseCommandService:
         except CourseNotFoundError:
             await self.uow.rollback()
             raise
+        return await self.uow.course_repo.get_by_id(course.id)  # with fields which are not updated
+
+    async def patch_course(self, course_id: str, changes: dict) -> CourseEntity:
+        course = await self.uow.course_repo.get_by_id(UUID(course_id))
+        fields = {
+            "name": course.name.value,
+            "image_url": course.image_url,
+            "limits": course.limits,
+            "prerequisites": course.prerequisites,
+            "description": course.description,
+            "topics": course.topics,
+            "assessment": course.assessment,
+            "resources": [{"title": res.title, "link": res.link} for res in course.resources],
+            "extra": course.extra,
+            "author": course.author.value if course.author else None,
+            "implementer": course.implementer.value if course.implementer else None,
+            "format": course.format.value if course.format else None,
+            "terms": course.terms.value if course.terms else None,
+            "roles": [role.value for role in course.roles],
+            "periods": [period.value for period in course.periods],
+            "last_runs": [run.value for run in course.last_runs],
+        } | changes
+        return await self.update_course(
+            course_id=course_id, name_=fields["name"],
+            image_url=fields["image_url"], limits_=fields["limits"],
+            prerequisites_=fields["prerequisites"],
+            description_=fields["description"], topics_=fields["topics"],
+            assessment_=fields["assessment"], resources_=fields["resources"],
+            extra_=fields["extra"], author_=fields["author"],
+            implementer_=fields["implementer"], format_=fields["format"],
+            terms_=fields["terms"], roles=fields["roles"],
+            periods=fields["periods"], runs=fields["last_runs"],
+        )
+
+    async def import_courses(self, lines: list[dict]) -> list[CourseEntity]:
+        courses: dict[UUID, CourseEntity] = {}
+        for line, fields in enumerate(lines, start=1):
+            course = self.__make_imported_course(line, fields)
+            if course.id in courses:
+                raise CourseImportError(line=line, error_message="Course id is repeated")
+            courses[course.id] = course
+        try:
+            await self.uow.course_repo.save_many(list(courses.values()))
+            await self.uow.commit()
+        except IntegrityError as ex:
+            await self.uow.rollback()
+            raise CourseAlreadyExistsError from ex
+        except Exception:
+            await self.uow.rollback()
+            raise
+        return list(courses.values())
+
+    @staticmethod
+    def __make_imported_course(line: int, fields: dict) -> CourseEntity:
+        try:
+            course = CourseEntity(
+                id=UUID(fields["id"] or str(uuid.uuid4())),
+                name=CourseName(fields["name"]),
+                image_url=fields["image_url"],
+                limits=fields["limits"],
+                prerequisites=fields["prerequisites"],
+                description=fields["description"],
+                topics=fields["topics"],
+                assessment=fields["assessment"],
+                resources=[Resource(title=res["title"], link=res["link"]) for res in fields["resources"]],
+                extra=fields["extra"],
+                author=Author(fields["author"]) if fields["author"] else None,
+                implementer=Implementer(fields["implementer"]) if fields["implementer"] else None,
+                format=Format(fields["format"]) if fields["format"] else None,
+                terms=Terms(fields["terms"]) if fields["terms"] else None,
+                roles=[Role(role) for role in fields["roles"]],
+                periods=[Period(period) for period in fields["periods"]],
+                last_runs=[CourseRun(run) for run in fields["last_runs"]],
+            )
+            if not fields["is_draft"]:
+                course.publish()  # published course should have everything required for publishing
+        except DomainError as ex:
+            raise CourseImportError(line=line, error_message=ex.message) from ex
+        return course
 
     async def delete_course(self, course_id: str) -> None:
         course_id = UUID(course_id)
@@ -91,7 +171,7 @@ class CourseCommandService:
             await self.uow.rollback()
             raise
 
-    async def publish_course(self, course_id: str) -> None:
+    async def publish_course(self, course_id: str) -> CourseEntity:
         course_id = UUID(course_id)
         try:
             course = await self.uow.course_repo.get_by_id(course_id)
@@ -101,8 +181,9 @@ class CourseCommandService:
         except CourseNotFoundError:
             await self.uow.rollback()
             raise
+        return course
 
-    async def hide_course(self, course_id: str) -> None:
+    async def hide_course(self, course_id: str) -> CourseEntity:
         course_id = UUID(course_id)
         try:
             course = await self.uow.course_repo.get_by_id(course_id)
@@ -112,3 +193,4 @@ class CourseCommandService:
         except CourseNotFoundError:
             await self.uow.rollback()
             raise
+        return course
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from src.domain.base_value_objects import UUID
     from src.domain.courses.entities import CourseEntity
+    from src.services.cache_entry import CacheEntry
 
 
 class CourseCacheService(ABC):
@@ -28,6 +29,14 @@ class CourseCacheService(ABC):
     async def get_many(self) -> list[CourseEntity] | None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_many_by_ids(self, course_ids: list[UUID]) -> list[CourseEntity | None]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_many_by_ids(self, course_ids: list[UUID]) -> None:
+        raise NotImplementedError
+
     @abstractmethod
     async def delete_many(self) -> None:
         raise NotImplementedError
@@ -35,3 +44,25 @@ class CourseCacheService(ABC):
     @abstractmethod
     async def set_many(self, courses: list[CourseEntity]) -> None:
         raise NotImplementedError
+
+    @abstractmethod
+    async def patch_many(self, course: CourseEntity, *, is_listed: bool) -> tuple[str, str] | None:
+        """Put course into cached list of all courses or take it out of it.
+
+        Get versions of the list before and after patch, None if there is no list to patch.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_version(self) -> CacheEntry[str] | None:
+        """Get version of all cached courses, stale version means courses should be refreshed."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def lock_many(self) -> bool:
+        """Try to take the short lock for rebuilding all courses, true if it is taken."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def unlock_many(self) -> None:
+        raise NotImplementedError
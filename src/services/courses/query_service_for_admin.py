@@ -3,20 +3,30 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from src.domain.base_value_objects import UUID
+from src.services.single_flight import SingleFlight, wait_for_rebuild
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from src.domain.courses.course_repository import ICourseRepository
     from src.domain.courses.entities import CourseEntity
     from src.services.courses.course_cache_service import CourseCacheService
 
 
+courses_flight = SingleFlight[list["CourseEntity"]]()
+
+
 class AdminCourseQueryService:
 
     """Class implemented CQRS pattern, query class for admin."""
 
-    def __init__(self, course_repo: ICourseRepository, course_cache_service: CourseCacheService) -> None:
+    def __init__(
+            self, course_repo: ICourseRepository, course_cache_service: CourseCacheService,
+            schedule_refresh: Callable[[], None] | None = None,
+    ) -> None:
         self.course_repo = course_repo
         self.course_cache_service = course_cache_service
+        self.schedule_refresh = schedule_refresh
 
     async def get_course(self, course_id: str) -> CourseEntity:
         course_id = UUID(course_id)
@@ -28,13 +38,45 @@ class AdminCourseQueryService:
         return course
 
     async def get_courses(self) -> list[CourseEntity]:
-        courses_from_cache = await self.course_cache_service.get_many()
-        if courses_from_cache:
-            return courses_from_cache
-        courses = await self.course_repo.get_all()
-        await self.course_cache_service.set_many(courses)
+        version = await self.course_cache_service.get_version()
+        courses_from_cache = await self.course_cache_service.get_many() if version else None
+        if courses_from_cache is None:
+            return await courses_flight.do("admin-courses", self.__rebuild_courses)
+        if version.is_stale and self.schedule_refresh is not None:
+            self.schedule_refresh()
+        return courses_from_cache
+
+    async def refresh_courses(self) -> None:
+        is_locked = await self.course_cache_service.lock_many()
+        if not is_locked:  # courses are being rebuilt by another worker
+            return
+        try:
+            courses = await self.course_repo.get_all()
+            await self.course_cache_service.set_many(courses)
+        finally:
+            await self.course_cache_service.unlock_many()
+
+    async def __rebuild_courses(self) -> list[CourseEntity]:
+        is_locked = await self.course_cache_service.lock_many()
+        if not is_locked:
+            courses = await wait_for_rebuild(self.course_cache_service.get_many)
+            if courses is not None:
+                return courses
+        try:
+            courses = await self.course_repo.get_all()
+            await self.course_cache_service.set_many(courses)
+        finally:
+            await self.course_cache_service.unlock_many()
         return courses
 
+    async def update_course_in_cache(self, course: CourseEntity) -> None:
+        await self.course_cache_service.set_one(course)
+        await self.course_cache_service.patch_many(course, is_listed=True)
+
+    async def invalidate_courses(self, courses: list[CourseEntity]) -> None:
+        await self.course_cache_service.delete_many_by_ids([course.id for course in courses])
+        await self.course_cache_service.delete_many()
+
     async def invalidate_course(self, course_id: str) -> None:
         await self.course_cache_service.delete_one(UUID(course_id))
         await self.course_cache_service.delete_many()
@@ -1,38 +1,38 @@
 from __future__ import annotations
 
 import datetime
-from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 from src.domain.base_value_objects import UUID
 from src.domain.courses.exceptions import CourseNotFoundError
+from src.services.single_flight import SingleFlight, wait_for_rebuild
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from src.domain.courses.course_repository import ICourseRepository
     from src.domain.courses.entities import CourseEntity
+    from src.domain.courses.filters import CourseFilter
+    from src.services.cache_entry import CacheEntry
+    from src.services.courses.catalog_index import CatalogIndex
     from src.services.courses.course_cache_service import CourseCacheService
 
 
-@dataclass
-class CourseFilter:
-
-    """Class for filters on courses."""
-
-    implementers: list[str] | None = field(default=None)
-    formats: list[str] | None = field(default=None)
-    terms: list[str] | None = field(default=None)
-    roles: list[str] | None = field(default=None)
-    query: str | None = field(default=None)
-    only_actual: bool = field(default=False)
+catalog_flight = SingleFlight[None]()
 
 
 class TalentCourseQueryService:
 
     """Class implemented CQRS pattern, query class for talent."""
 
-    def __init__(self, course_repo: ICourseRepository, course_cache_service: CourseCacheService) -> None:
+    def __init__(
+            self, course_repo: ICourseRepository, course_cache_service: CourseCacheService,
+            catalog_index: CatalogIndex, schedule_refresh: Callable[[], None] | None = None,
+    ) -> None:
         self.course_repo = course_repo
         self.course_cache_service = course_cache_service
+        self.catalog_index = catalog_index
+        self.schedule_refresh = schedule_refresh
 
     async def get_course(self, course_id: str) -> CourseEntity:
         course_id = UUID(course_id)
@@ -46,35 +46,89 @@ class TalentCourseQueryService:
         return course
 
     async def get_courses(self, filters: CourseFilter) -> list[CourseEntity]:
+        await self.__sync_catalog_index()
+        return self.catalog_index.filter(filters, self.__get_actual_run())
+
+    async def count_facets(self, filters: CourseFilter) -> dict[str, dict[str, int]]:
+        await self.__sync_catalog_index()
+        return self.catalog_index.count_facets(filters, self.__get_actual_run())
+
+    async def get_courses_page(
+            self, filters: CourseFilter, after: list[str] | None, limit: int,
+    ) -> list[CourseEntity]:
+        if after is not None:
+            name, course_id = after
+            after = [name, UUID(course_id).value]
         actual_run = self.__get_actual_run()
-        courses_from_cache = await self.course_cache_service.get_many()
-        if courses_from_cache:
-            return [
-                course for course in courses_from_cache
-                if not course.is_draft and self.__matched(course, filters, actual_run)
-            ]
-        courses = await self.course_repo.get_all()
-        courses = [course for course in courses if not course.is_draft]
-        await self.course_cache_service.set_many(courses)
-        return [course for course in courses if self.__matched(course, filters, actual_run)]
+        return await self.course_repo.get_page(filters, actual_run, after, limit)
 
-    async def invalidate_course(self, course_id: str) -> None:
-        await self.course_cache_service.delete_one(UUID(course_id))
+    async def search_courses(self, query: str, limit: int) -> list[CourseEntity]:
+        query = query.strip()
+        if not query:
+            return []
+        return await self.course_repo.search(query, limit)
+
+    async def update_course_in_cache(self, course: CourseEntity) -> None:
+        if course.is_draft:
+            await self.course_cache_service.delete_one(course.id)
+        else:
+            await self.course_cache_service.set_one(course)
+        versions = await self.course_cache_service.patch_many(course, is_listed=not course.is_draft)
+        index_version = self.catalog_index.version
+        self.catalog_index.update(course)
+        if versions is not None and versions[0] == index_version:  # index has the same patch as cache
+            self.catalog_index.version = versions[1]
+
+    async def invalidate_courses(self, courses: list[CourseEntity]) -> None:
+        await self.course_cache_service.delete_many_by_ids([course.id for course in courses])
         await self.course_cache_service.delete_many()
 
-    @staticmethod
-    def __matched(course: CourseEntity, filters: CourseFilter, actual_run: str) -> bool:
-        if filters.roles and not set(filters.roles).intersection({r.value for r in course.roles}):
-            return False
-        if filters.implementers and course.implementer.value not in filters.implementers:
-            return False
-        if filters.terms and not set(filters.terms).intersection(set(course.terms.value.split(", "))):
-            return False
-        if filters.formats and course.format.value not in filters.formats:
-            return False
-        if filters.query and filters.query.lower() not in course.name.value.lower():
-            return False
-        return not filters.only_actual or actual_run in {run.value for run in course.last_runs}
+    async def invalidate_course(self, course_id: str) -> None:
+        course_id = UUID(course_id)
+        await self.course_cache_service.delete_one(course_id)
+        await self.course_cache_service.delete_many()
+        self.catalog_index.remove(course_id)
+
+    async def refresh_courses(self) -> None:
+        is_locked = await self.course_cache_service.lock_many()
+        if not is_locked:  # courses are being rebuilt by another worker
+            return
+        try:
+            courses = await self.__get_published_courses()
+            await self.course_cache_service.set_many(courses)
+        finally:
+            await self.course_cache_service.unlock_many()
+
+    async def __sync_catalog_index(self) -> None:
+        version = await self.course_cache_service.get_version()
+        if version is None or version.value != self.catalog_index.version:
+            await catalog_flight.do("talent-catalog", lambda: self.__fill_catalog_index(version))
+        if version is not None and version.is_stale and self.schedule_refresh is not None:
+            self.schedule_refresh()
+
+    async def __fill_catalog_index(self, version: CacheEntry[str] | None) -> None:
+        courses = await self.course_cache_service.get_many() if version else None
+        if courses is None:
+            courses = await self.__rebuild_courses()
+            version = await self.course_cache_service.get_version()
+        self.catalog_index.build(courses, version.value if version else None)
+
+    async def __rebuild_courses(self) -> list[CourseEntity]:
+        is_locked = await self.course_cache_service.lock_many()
+        if not is_locked:
+            courses = await wait_for_rebuild(self.course_cache_service.get_many)
+            if courses is not None:
+                return courses
+        try:
+            courses = await self.__get_published_courses()
+            await self.course_cache_service.set_many(courses)
+        finally:
+            await self.course_cache_service.unlock_many()
+        return courses
+
+    async def __get_published_courses(self) -> list[CourseEntity]:
+        courses = await self.course_repo.get_all()
+        return [course for course in courses if not course.is_draft]
 
     @staticmethod
     def __get_actual_run() -> str:
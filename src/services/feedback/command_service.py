@@ -3,10 +3,18 @@ from __future__ import annotations
 import uuid
 from typing import TYPE_CHECKING
 
+from sqlalchemy.exc import IntegrityError
+
 from src.domain.base_value_objects import UUID
 from src.domain.feedback.entities import FeedbackEntity
-from src.domain.feedback.exceptions import FeedbackBelongsToAnotherUserError, FeedbackNotFoundError
-from src.domain.feedback.value_objects import FeedbackText, Rating
+from src.domain.feedback.exceptions import (
+    FeedbackBelongsToAnotherUserError,
+    FeedbackNotFoundError,
+    OnlyOneFeedbackForCourseError,
+)
+from src.domain.feedback.value_objects import FeedbackText, Rating, Vote
+from src.infrastructure.sqlalchemy.errors import get_violated_constraint
+from src.infrastructure.sqlalchemy.feedback.models import AUTHOR_FEEDBACK_INDEX
 
 if TYPE_CHECKING:
     from src.services.feedback.unit_of_work import FeedbackUnitOfWork
@@ -29,30 +37,42 @@ class FeedbackCommandService:
         try:
             await self.uow.feedback_repo.create(feedback)
             await self.uow.commit()
+        except IntegrityError as ex:
+            await self.uow.rollback()
+            if get_violated_constraint(ex) == AUTHOR_FEEDBACK_INDEX:
+                raise OnlyOneFeedbackForCourseError from ex
+            raise
         except Exception:
             await self.uow.rollback()
             raise
         return feedback_id.value
 
-    async def vote(self, feedback_id: str, user_id: str, vote_type: str) -> None:
+    async def vote(self, feedback_id: str, user_id: str, vote_type: str) -> FeedbackEntity:
         try:
-            feedback = await self.uow.feedback_repo.get_one_by_id(UUID(feedback_id))
+            feedback = await self.uow.feedback_repo.get_one_by_id_with_user_vote(UUID(feedback_id), UUID(user_id))
             feedback.vote(UUID(user_id), vote_type)
-            await self.uow.feedback_repo.update_votes(feedback)
+            # counters from the database include concurrent votes of other users
+            feedback.like_count, feedback.dislike_count = await self.uow.feedback_repo.set_vote(
+                feedback.id, Vote(UUID(user_id), vote_type),
+            )
             await self.uow.commit()
         except FeedbackNotFoundError:
             await self.uow.rollback()
             raise
+        return feedback
 
-    async def unvote(self, feedback_id: str, user_id: str) -> None:
+    async def unvote(self, feedback_id: str, user_id: str) -> FeedbackEntity:
         try:
-            feedback = await self.uow.feedback_repo.get_one_by_id(UUID(feedback_id))
+            feedback = await self.uow.feedback_repo.get_one_by_id_with_user_vote(UUID(feedback_id), UUID(user_id))
             feedback.unvote(UUID(user_id))
-            await self.uow.feedback_repo.update_votes(feedback)
+            feedback.like_count, feedback.dislike_count = await self.uow.feedback_repo.delete_vote(
+                feedback.id, UUID(user_id),
+            )
             await self.uow.commit()
         except FeedbackNotFoundError:
             await self.uow.rollback()
             raise
+        return feedback
 
     async def delete_feedback(self, feedback_id: str, user_id: str) -> None:
         feedback_id = UUID(feedback_id)
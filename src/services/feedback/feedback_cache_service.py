@@ -5,7 +5,8 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from src.domain.base_value_objects import UUID
-    from src.domain.feedback.entities import FeedbackEntity
+    from src.domain.feedback.entities import CourseRatingEntity, FeedbackEntity
+    from src.services.cache_entry import CacheEntry
 
 
 class FeedbackCacheService(ABC):
@@ -16,6 +17,11 @@ class FeedbackCacheService(ABC):
     async def get_many_by_course_id(self, course_id: UUID) -> list[FeedbackEntity] | None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_entry_by_course_id(self, course_id: UUID) -> CacheEntry[list[FeedbackEntity]] | None:
+        """Get feedbacks of course with their freshness, stale feedbacks should be refreshed."""
+        raise NotImplementedError
+
     @abstractmethod
     async def delete_many(self, course_id: UUID) -> None:
         raise NotImplementedError
@@ -23,3 +29,56 @@ class FeedbackCacheService(ABC):
     @abstractmethod
     async def set_many(self, course_id: UUID, feedbacks: list[FeedbackEntity]) -> None:
         raise NotImplementedError
+
+    @abstractmethod
+    async def patch_one(self, feedback: FeedbackEntity) -> None:
+        """Replace counters of votes of feedback in cached feedbacks of its course, pages of course are deleted."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_user_votes(self, course_id: UUID, user_id: UUID) -> dict[str, str] | None:
+        """Get types of votes of user for feedbacks of course by ids of feedbacks, None if they are not cached."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set_user_votes(self, course_id: UUID, user_id: UUID, votes: dict[str, str]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_user_votes(self, course_id: UUID, user_id: UUID) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_course_ratings(self, course_ids: list[UUID]) -> dict[str, CourseRatingEntity]:
+        """Get cached summaries of ratings by ids of courses, courses without cached summaries are omitted."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set_course_ratings(self, ratings: list[CourseRatingEntity]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_course_rating(self, course_id: UUID) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_page(
+            self, course_id: UUID, sort: str, after: list[str] | None, limit: int,
+    ) -> list[FeedbackEntity] | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set_page(
+            self, course_id: UUID, sort: str, after: list[str] | None, limit: int, feedbacks: list[FeedbackEntity],
+    ) -> None:
+        """Cache page of feedbacks, pages of course are deleted together with all its feedbacks."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def lock_many(self, course_id: UUID) -> bool:
+        """Try to take the short lock for rebuilding feedbacks of course, true if it is taken."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def unlock_many(self, course_id: UUID) -> None:
+        raise NotImplementedError
@@ -3,29 +3,103 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from src.domain.base_value_objects import UUID
+from src.services.single_flight import SingleFlight, wait_for_rebuild
 
 if TYPE_CHECKING:
-    from src.domain.feedback.entities import FeedbackEntity
+    from collections.abc import Callable
+
+    from src.domain.feedback.entities import CourseRatingEntity, FeedbackEntity
     from src.domain.feedback.feedback_repository import IFeedbackRepository
     from src.services.feedback.feedback_cache_service import FeedbackCacheService
 
 
+feedbacks_flight = SingleFlight[list["FeedbackEntity"]]()
+
+
 class FeedbackQueryService:
 
     """Class implemented CQRS pattern, query class."""
 
-    def __init__(self, feedback_repo: IFeedbackRepository, feedback_cache_service: FeedbackCacheService) -> None:
+    def __init__(
+            self, feedback_repo: IFeedbackRepository, feedback_cache_service: FeedbackCacheService,
+            schedule_refresh: Callable[[str], None] | None = None,
+    ) -> None:
         self.feedback_repo = feedback_repo
         self.feedback_cache_service = feedback_cache_service
+        self.schedule_refresh = schedule_refresh
 
     async def get_feedbacks_by_course_id(self, course_id: str) -> list[FeedbackEntity]:
         course_id = UUID(course_id)
-        feedbacks_from_cache = await self.feedback_cache_service.get_many_by_course_id(course_id)
-        if feedbacks_from_cache is not None:
-            return feedbacks_from_cache
-        feedbacks = await self.feedback_repo.get_all_by_course_id(course_id)
-        await self.feedback_cache_service.set_many(course_id, feedbacks)
+        feedbacks_from_cache = await self.feedback_cache_service.get_entry_by_course_id(course_id)
+        if feedbacks_from_cache is None:
+            return await feedbacks_flight.do(course_id.value, lambda: self.__rebuild_feedbacks(course_id))
+        if feedbacks_from_cache.is_stale and self.schedule_refresh is not None:
+            self.schedule_refresh(course_id.value)
+        return feedbacks_from_cache.value
+
+    async def get_feedbacks_page(
+            self, course_id: str, sort: str, after: list[str] | None, limit: int,
+    ) -> list[FeedbackEntity]:
+        course_id = UUID(course_id)
+        feedbacks = await self.feedback_cache_service.get_page(course_id, sort, after, limit)
+        if feedbacks is None:
+            feedbacks = await self.feedback_repo.get_page_by_course_id(course_id, sort, after, limit)
+            await self.feedback_cache_service.set_page(course_id, sort, after, limit, feedbacks)
         return feedbacks
 
+    async def get_user_votes(self, course_id: str, user_id: str) -> dict[str, str]:
+        course_id, user_id = UUID(course_id), UUID(user_id)
+        votes = await self.feedback_cache_service.get_user_votes(course_id, user_id)
+        if votes is None:
+            votes = await self.feedback_repo.get_user_votes(course_id, user_id)
+            await self.feedback_cache_service.set_user_votes(course_id, user_id, votes)
+        return votes
+
+    async def update_votes_in_cache(self, feedback: FeedbackEntity, user_id: str) -> None:
+        # vote changes only counters of one feedback and votes of one user, other cached feedbacks are kept
+        await self.feedback_cache_service.patch_one(feedback)
+        await self.feedback_cache_service.delete_user_votes(feedback.course_id, UUID(user_id))
+        await self.feedback_cache_service.delete_course_rating(feedback.course_id)  # weighted average is changed
+
+    async def get_course_ratings(self, course_ids: list[str]) -> dict[str, CourseRatingEntity]:
+        course_ids = [UUID(course_id) for course_id in course_ids]
+        ratings = await self.feedback_cache_service.get_course_ratings(course_ids)
+        missing_course_ids = [course_id for course_id in course_ids if course_id.value not in ratings]
+        if missing_course_ids:
+            missing_ratings = await self.feedback_repo.get_course_ratings(missing_course_ids)
+            await self.feedback_cache_service.set_course_ratings(missing_ratings)
+            ratings |= {rating.course_id.value: rating for rating in missing_ratings}
+        return ratings
+
+    async def refresh_feedbacks(self, course_id: str) -> None:
+        course_id = UUID(course_id)
+        is_locked = await self.feedback_cache_service.lock_many(course_id)
+        if not is_locked:  # feedbacks are being rebuilt by another worker
+            return
+        try:
+            feedbacks = await self.feedback_repo.get_all_by_course_id(course_id)
+            await self.feedback_cache_service.set_many(course_id, feedbacks)
+        finally:
+            await self.feedback_cache_service.unlock_many(course_id)
+
+    async def __rebuild_feedbacks(self, course_id: UUID) -> list[FeedbackEntity]:
+        is_locked = await self.feedback_cache_service.lock_many(course_id)
+        if not is_locked:
+            feedbacks = await wait_for_rebuild(lambda: self.feedback_cache_service.get_many_by_course_id(course_id))
+            if feedbacks is not None:
+                return feedbacks
+        try:
+            feedbacks = await self.feedback_repo.get_all_by_course_id(course_id)
+            await self.feedback_cache_service.set_many(course_id, feedbacks)
+        finally:
+            await self.feedback_cache_service.unlock_many(course_id)
+        return feedbacks
+
+    async def warm_up(self, courses_limit: int) -> None:
+        course_ids = await self.feedback_repo.get_most_discussed_course_ids(courses_limit)
+        for course_id in course_ids:
+            await self.get_feedbacks_by_course_id(course_id.value)
+
     async def invalidate_course(self, course_id: str) -> None:
         await self.feedback_cache_service.delete_many(UUID(course_id))
+        await self.feedback_cache_service.delete_course_rating(UUID(course_id))
@@ -1,15 +1,15 @@
 from __future__ import annotations
 
-import datetime
 import uuid
 from typing import TYPE_CHECKING
 
 from src.domain.base_value_objects import UUID, LinkValueObject
-from src.domain.course_run.exceptions import NoActualCourseRunError
 from src.domain.playlists.entities import PlaylistEntity
 from src.domain.playlists.value_objects import VideoResourceType
+from src.services.course_run.actual_course_run import get_actual_course_run_id
 
 if TYPE_CHECKING:
+    from src.services.course_run.course_run_cache_service import CourseRunCacheService
     from src.services.playlists.unit_of_work import PlaylistUnitOfWork
 
 
@@ -17,21 +17,19 @@ class PlaylistCommandService:
 
     """Class implemented CQRS pattern, command class."""
 
-    def __init__(self, uow: PlaylistUnitOfWork) -> None:
+    def __init__(self, uow: PlaylistUnitOfWork, course_run_cache_service: CourseRunCacheService) -> None:
         self.uow = uow
+        self.course_run_cache_service = course_run_cache_service
 
     async def get_playlists_by_course_run_id(self, course_run_id: str) -> list[PlaylistEntity]:
         course_run_id = UUID(course_run_id)
         return await self.uow.playlist_repo.get_all_by_course_run_id(course_run_id)
 
     async def get_actual_playlists(self, course_id: str) -> list[PlaylistEntity]:
-        current_date = datetime.datetime.now().date()
-        course_id = UUID(course_id)
-        course_runs = await self.uow.course_run_repo.get_all_by_course_id(course_id)
-        for course_run in course_runs:
-            if course_run.is_actual_by_date(current_date):
-                return await self.uow.playlist_repo.get_all_by_course_run_id(course_run.id)
-        raise NoActualCourseRunError
+        course_run_id = await get_actual_course_run_id(
+            UUID(course_id), self.uow.course_run_repo, self.course_run_cache_service,
+        )
+        return await self.uow.playlist_repo.get_all_by_course_run_id(course_run_id)
 
     async def create_playlist(self, course_run_id: str, name: str, playlist_type: str, link: str) -> None:
         playlist_id = UUID(str(uuid.uuid4()))
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+
+class ResourceVersionService(ABC):
+
+    """Base class for versions of public resources, version changes with every change of resource."""
+
+    @abstractmethod
+    async def get_many(self, resources: list[str]) -> list[str]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def bump_many(self, resources: list[str]) -> None:
+        raise NotImplementedError
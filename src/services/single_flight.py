@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+REBUILD_WAIT_ATTEMPTS = 20
+REBUILD_WAIT_INTERVAL = 0.1
+
+
+class SingleFlight(Generic[T]):
+
+    """Coalesce concurrent calls with the same key into one call inside the worker."""
+
+    def __init__(self) -> None:
+        self.__calls: dict[str, asyncio.Future[T]] = {}
+
+    async def do(self, key: str, func: Callable[[], Awaitable[T]]) -> T:
+        call = self.__calls.get(key)
+        if call is not None:
+            await asyncio.wait([call])
+            if not call.cancelled():
+                return call.result()
+            # the leading call has been cancelled, do the work by ourselves
+        call = asyncio.get_running_loop().create_future()
+        self.__calls[key] = call
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            call.cancel()
+            raise
+        except Exception as ex:
+            call.set_exception(ex)
+            call.exception()  # mark as retrieved when nobody waits for this call
+            raise
+        else:
+            call.set_result(result)
+            return result
+        finally:
+            if self.__calls.get(key) is call:
+                del self.__calls[key]
+
+
+class BackgroundRefresh:
+
+    """Run cache refreshes as background tasks, at most one task per key inside the worker."""
+
+    def __init__(self) -> None:
+        self.__tasks: dict[str, asyncio.Task[None]] = {}
+
+    def schedule(self, key: str, func: Callable[[], Awaitable[None]]) -> None:
+        if key in self.__tasks:
+            return
+        task = asyncio.get_running_loop().create_task(func())
+        self.__tasks[key] = task
+        task.add_done_callback(lambda done_task: self.__finish(key, done_task))
+
+    def __finish(self, key: str, task: asyncio.Task[None]) -> None:
+        del self.__tasks[key]
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Background refresh of %s has failed", key, exc_info=task.exception())
+
+
+background_refresh = BackgroundRefresh()
+
+
+async def wait_for_rebuild(read: Callable[[], Awaitable[T | None]]) -> T | None:
+    """Poll cache while another worker rebuilds it.
+
+    :param read: cache reader returning None on miss
+    :return: value from cache or None if it has not appeared in time
+    """
+    for _ in range(REBUILD_WAIT_ATTEMPTS):
+        await asyncio.sleep(REBUILD_WAIT_INTERVAL)
+        value = await read()
+        if value is not None:
+            return value
+    return None
@@ -0,0 +1,31 @@
+import pytest
+
+from src.api.base_pagination import CursorPaginator, InvalidCursorError, PageNumberLessOneError, Paginator
+
+
+def test_paginator_empty_data():
+    paginator = Paginator[int](data=[], page_size=9)
+    assert paginator.max_page == 1
+    assert paginator.get_data_by_page(1) == []
+    with pytest.raises(PageNumberLessOneError):
+        paginator.get_data_by_page(0)
+
+
+def test_cursor_paginator_pages():
+    paginator = CursorPaginator[int](page_size=2, key=lambda item: [str(item)], key_size=1)
+    assert paginator.limit == 3
+    page, next_cursor = paginator.get_page([1, 2, 3])
+    assert page == [1, 2]
+    assert paginator.decode(next_cursor) == ["2"]
+    page, next_cursor = paginator.get_page([3])
+    assert page == [3]
+    assert next_cursor is None
+    assert paginator.decode("") is None
+
+
+def test_cursor_paginator_invalid_cursor():
+    paginator = CursorPaginator[int](page_size=2, key=lambda item: [str(item)], key_size=1)
+    with pytest.raises(InvalidCursorError):
+        paginator.decode("not-a-cursor")
+    with pytest.raises(InvalidCursorError):
+        paginator.decode(paginator.encode(["1", "2"]))
@@ -0,0 +1,31 @@
+from src.api.conditional_get import get_changed_resources, get_read_resources, is_not_modified
+
+
+def test_read_resources_of_public_endpoints():
+    assert get_read_resources("/courses") == (["catalog"], False)
+    assert get_read_resources("/courses/search") == (["catalog"], False)
+    assert get_read_resources("/courses/facets") == (["catalog"], False)
+    assert get_read_resources("/courses/1") == (["course-1", "courses"], False)
+    assert get_read_resources("/courses/1/feedbacks") == (["feedbacks-1"], True)
+    assert get_read_resources("/courses/1/timetable") == (["timetable-1", "timetables"], False)
+    assert get_read_resources("/courses/1/favorite_status") is None
+    assert get_read_resources("/admin/courses") is None
+
+
+def test_changed_resources_of_admin_and_feedback_endpoints():
+    assert get_changed_resources("/admin/courses") == ["catalog"]
+    assert get_changed_resources("/admin/courses/import") == ["catalog", "courses"]
+    assert get_changed_resources("/admin/courses/1") == ["catalog", "course-1"]
+    assert get_changed_resources("/admin/courses/1/published") == ["catalog", "course-1"]
+    assert get_changed_resources("/admin/courses/1/runs/2/timetable/rules") == ["timetable-1"]
+    assert get_changed_resources("/courses/1/feedbacks/2/votes") == ["feedbacks-1", "course-1", "catalog"]
+    assert get_changed_resources("/talent/profile/favorites") == []
+
+
+def test_if_none_match_uses_weak_comparison():
+    etag = 'W/"abc"'
+    assert is_not_modified('W/"abc"', etag)
+    assert is_not_modified('"def", "abc"', etag)
+    assert is_not_modified("*", etag)
+    assert not is_not_modified('"def"', etag)
+    assert not is_not_modified(None, etag)
@@ -0,0 +1,45 @@
+import pytest
+from fastapi import Request
+
+from src.api.admin.courses.router import parse_imported_course, read_imported_courses
+from src.domain.courses.exceptions import CourseImportError
+
+
+def test_parse_imported_course():
+    fields = parse_imported_course(1, '{"name": "Java", "roles": ["ML Engineer"], "is_draft": false}'.encode())
+    assert fields["id"] is None
+    assert fields["name"] == "Java"
+    assert fields["roles"] == ["ML Engineer"]
+    assert fields["is_draft"] is False
+    assert fields["resources"] == []
+
+
+def test_parse_invalid_imported_course():
+    with pytest.raises(CourseImportError) as ex:
+        parse_imported_course(3, b'{"roles": []}')
+    assert ex.value.line == 3
+    with pytest.raises(CourseImportError):
+        parse_imported_course(4, b"")
+
+
+def create_request(chunks: list[bytes]) -> Request:
+    messages = [{"type": "http.request", "body": chunk, "more_body": True} for chunk in chunks]
+    messages.append({"type": "http.request", "body": b"", "more_body": False})
+
+    async def receive() -> dict:
+        return messages.pop(0)
+
+    return Request({"type": "http", "method": "POST", "headers": []}, receive)
+
+
+async def test_read_imported_courses_split_between_chunks():
+    request = create_request([b'{"name": "Ja', b'va"}\n{"name": "Py', b'thon"}\n{"name": "Go"}'])
+    courses = await read_imported_courses(request)
+    assert [course["name"] for course in courses] == ["Java", "Python", "Go"]
+
+
+async def test_read_imported_courses_reports_number_of_line():
+    request = create_request([b'{"name": "Java"}\n{"roles": []}\n'])
+    with pytest.raises(CourseImportError) as ex:
+        await read_imported_courses(request)
+    assert ex.value.line == 2
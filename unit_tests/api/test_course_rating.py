@@ -0,0 +1,49 @@
+import uuid
+
+import pytest
+
+from src.api.base_pagination import CursorSortError
+from src.api.courses.router import check_course_sort, sort_courses_by_rating
+from src.api.feedback.schemas import CourseRatingDTO
+from src.domain.base_value_objects import UUID
+from src.domain.courses.entities import CourseEntity
+from src.domain.courses.exceptions import ValueDoesntExistError
+from src.domain.courses.value_objects import CourseName
+from src.domain.feedback.entities import CourseRatingEntity
+
+
+def create_course(name: str) -> CourseEntity:
+    return CourseEntity(id=UUID(str(uuid.uuid4())), name=CourseName(name))
+
+
+def test_sort_courses_by_rating():
+    courses = [create_course(name) for name in ("A", "B", "C", "D")]
+    ratings = {
+        courses[0].id.value: CourseRatingEntity(courses[0].id),
+        courses[1].id.value: CourseRatingEntity(courses[1].id, count=1, weighted_rating_sum=4, weight_sum=1),
+        courses[2].id.value: CourseRatingEntity(courses[2].id, count=1, weighted_rating_sum=5, weight_sum=1),
+        courses[3].id.value: CourseRatingEntity(courses[3].id, count=3, weighted_rating_sum=12, weight_sum=3),
+    }
+    sorted_courses = sort_courses_by_rating(courses, ratings)
+    assert [course.name.value for course in sorted_courses] == ["C", "D", "B", "A"]
+
+
+def test_check_course_sort():
+    check_course_sort("name", "cursor")
+    check_course_sort("rating", None)
+    with pytest.raises(CursorSortError):
+        check_course_sort("rating", "cursor")
+    with pytest.raises(ValueDoesntExistError):
+        check_course_sort("popularity", None)
+
+
+def test_course_rating_dto():
+    rating = CourseRatingEntity(
+        UUID(str(uuid.uuid4())), count=3, rating_sum=10, histogram=[0, 0, 1, 1, 1],
+        weighted_rating_sum=13, weight_sum=3,
+    )
+    dto = CourseRatingDTO.from_domain(rating)
+    assert dto.histogram == {"1": 0, "2": 0, "3": 1, "4": 1, "5": 1}
+    assert dto.average == 3.33
+    assert dto.weighted_average == 4.33
+    assert CourseRatingDTO.from_domain(CourseRatingEntity(rating.course_id)).average is None
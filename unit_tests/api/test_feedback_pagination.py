@@ -0,0 +1,49 @@
+import datetime
+import uuid
+
+import pytest
+
+from src.api.base_pagination import InvalidCursorError
+from src.api.feedback.router import check_feedback_cursor_key, get_feedback_cursor_key, get_feedback_cursor_paginator
+from src.domain.base_value_objects import UUID
+from src.domain.courses.exceptions import ValueDoesntExistError
+from src.domain.feedback.entities import FeedbackEntity
+from src.domain.feedback.value_objects import FeedbackText, Rating, Vote
+
+
+def create_feedback() -> FeedbackEntity:
+    return FeedbackEntity(
+        id=UUID(str(uuid.uuid4())),
+        course_id=UUID(str(uuid.uuid4())),
+        author_id=UUID(str(uuid.uuid4())),
+        text=FeedbackText("Cool"),
+        rating=Rating(4),
+        votes={Vote(UUID(str(uuid.uuid4())), "like"), Vote(UUID(str(uuid.uuid4())), "like")},
+        date=datetime.date(2024, 9, 24),
+    )
+
+
+def test_feedback_cursor_key():
+    feedback = create_feedback()
+    assert get_feedback_cursor_key(feedback, "newest") == ["2024-09-24", feedback.id.value]
+    assert get_feedback_cursor_key(feedback, "rating") == ["4", "2024-09-24", feedback.id.value]
+    assert get_feedback_cursor_key(feedback, "reputation") == ["2", "2024-09-24", feedback.id.value]
+
+
+def test_feedback_cursor_round_trip():
+    feedbacks = [create_feedback() for _ in range(11)]
+    paginator = get_feedback_cursor_paginator("rating")
+    page, next_cursor = paginator.get_page(feedbacks)
+    assert len(page) == 10
+    after = paginator.decode(next_cursor)
+    check_feedback_cursor_key(after)
+    assert after == ["4", "2024-09-24", page[-1].id.value]
+
+
+def test_invalid_feedback_cursor():
+    with pytest.raises(InvalidCursorError):
+        check_feedback_cursor_key(["many", "2024-09-24", str(uuid.uuid4())])
+    with pytest.raises(InvalidCursorError):
+        check_feedback_cursor_key(["2024-13-24", str(uuid.uuid4())])
+    with pytest.raises(ValueDoesntExistError):
+        get_feedback_cursor_paginator("oldest")
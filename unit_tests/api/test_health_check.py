@@ -0,0 +1,17 @@
+from httpx import ASGITransport, AsyncClient
+
+from src.app import create_application
+
+
+async def test_readiness_check_waits_for_warm_up():
+    app = create_application()
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/api/v1/readiness_check")
+        assert response.status_code == 503
+
+        app.state.is_ready = True
+        response = await client.get("/api/v1/readiness_check")
+        assert response.status_code == 200
+
+        response = await client.get("/api/v1/health_check")
+        assert response.status_code == 200
@@ -1,9 +1,10 @@
+import datetime
 import uuid
 
 import pytest
 
 from src.domain.base_value_objects import UUID
-from src.domain.course_run.entities import CourseRunEntity
+from src.domain.course_run.entities import CourseRunEntity, get_actual_seasons
 from src.domain.courses.exceptions import IncorrectCourseRunNameError
 from src.domain.courses.value_objects import CourseRun
 
@@ -30,3 +31,24 @@ def test_incorrect_course_run(name):
             name=CourseRun(name),
             course_id=UUID(str(uuid.uuid4()))
         )
+
+
+@pytest.mark.parametrize(("current_date", "seasons"), [
+    (datetime.date(2024, 9, 1), [("Осень", 2024)]),
+    (datetime.date(2025, 1, 15), [("Осень", 2024), ("Весна", 2025)]),
+    (datetime.date(2025, 7, 31), [("Весна", 2025)]),
+])
+def test_actual_seasons(current_date, seasons):
+    assert get_actual_seasons(current_date) == seasons
+
+
+def test_course_run_is_actual_by_date():
+    course_run = CourseRunEntity(
+        id=UUID(str(uuid.uuid4())),
+        name=CourseRun("Осень 2024"),
+        course_id=UUID(str(uuid.uuid4()))
+    )
+    assert course_run.is_actual_by_date(datetime.date(2024, 8, 1))
+    assert course_run.is_actual_by_date(datetime.date(2025, 1, 31))
+    assert not course_run.is_actual_by_date(datetime.date(2025, 2, 1))
+    assert not course_run.is_actual_by_date(datetime.date(2024, 7, 31))
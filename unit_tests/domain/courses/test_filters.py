@@ -0,0 +1,9 @@
+from src.domain.courses.filters import CourseFilter
+
+
+def test_course_filter_key_is_canonical():
+    filters = CourseFilter(roles=["b", "a"], query="Java")
+    same_filters = CourseFilter(roles=["a", "b", "a"], query="java")
+    assert filters.get_key() == same_filters.get_key()
+    assert CourseFilter(roles=[]).get_key() == CourseFilter().get_key()
+    assert CourseFilter(only_actual=True).get_key() != CourseFilter().get_key()
@@ -4,7 +4,7 @@ import uuid
 import pytest
 
 from src.domain.base_value_objects import UUID
-from src.domain.feedback.entities import FeedbackEntity
+from src.domain.feedback.entities import CourseRatingEntity, FeedbackEntity
 from src.domain.feedback.exceptions import FeedbackLikeError
 from src.domain.feedback.value_objects import FeedbackText, Vote, Rating
 
@@ -67,3 +67,45 @@ def test_unvote(correct_feedback):
     correct_feedback.unvote(user_id)
     correct_feedback.vote(user_id, vote_type)
     correct_feedback.unvote(user_id)
+
+
+def test_counters_of_votes(correct_feedback):
+    user_id = UUID(str(uuid.uuid4()))
+    correct_feedback.vote(user_id, "like")
+    correct_feedback.vote(user_id, "dislike")
+    assert (correct_feedback.like_count, correct_feedback.dislike_count) == (0, 1)
+    correct_feedback.unvote(user_id)
+    assert (correct_feedback.like_count, correct_feedback.dislike_count) == (0, 0)
+
+
+def test_reputation_without_votes():
+    feedback = FeedbackEntity(
+        UUID(str(uuid.uuid4())), UUID(str(uuid.uuid4())), UUID(str(uuid.uuid4())), FeedbackText("Cool!"), Rating(5),
+        like_count=3, dislike_count=1,
+    )
+    assert feedback.reputation == 2
+    assert len(feedback.votes) == 0
+
+
+def test_weight_of_feedback(correct_feedback):
+    assert correct_feedback.weight == 1
+    correct_feedback.vote(UUID(str(uuid.uuid4())), "like")
+    correct_feedback.vote(UUID(str(uuid.uuid4())), "like")
+    assert correct_feedback.weight == 3
+    for _ in range(4):
+        correct_feedback.vote(UUID(str(uuid.uuid4())), "dislike")
+    assert correct_feedback.weight == 1
+
+
+def test_course_rating():
+    rating = CourseRatingEntity(UUID(str(uuid.uuid4())))
+    assert rating.histogram == [0, 0, 0, 0, 0]
+    assert rating.average is None
+    assert rating.weighted_average is None
+
+    rating = CourseRatingEntity(
+        UUID(str(uuid.uuid4())), count=2, rating_sum=8, histogram=[0, 0, 1, 0, 1],
+        weighted_rating_sum=18, weight_sum=4,
+    )
+    assert rating.average == 4
+    assert rating.weighted_average == 4.5
@@ -0,0 +1,24 @@
+from sqlalchemy.exc import IntegrityError
+
+from src.infrastructure.sqlalchemy.errors import get_violated_constraint
+
+
+class UniqueViolationError(Exception):
+    constraint_name = "ix_feedbacks__author_id_course_id"
+
+
+def create_integrity_error(cause: Exception | None) -> IntegrityError:
+    orig = Exception("violation")
+    orig.__cause__ = cause
+    return IntegrityError("INSERT INTO feedbacks", {}, orig)
+
+
+def test_get_violated_constraint():
+    assert get_violated_constraint(create_integrity_error(UniqueViolationError())) == (
+        "ix_feedbacks__author_id_course_id"
+    )
+
+
+def test_get_unknown_violated_constraint():
+    assert get_violated_constraint(create_integrity_error(None)) is None
+    assert get_violated_constraint(create_integrity_error(ValueError())) is None
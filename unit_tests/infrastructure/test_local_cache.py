@@ -0,0 +1,78 @@
+import asyncio
+import json
+import time
+
+import pytest
+
+from src.infrastructure.redis import local_cache
+from src.infrastructure.redis.local_cache import LocalCache, LocalCacheInvalidation
+
+
+def test_local_cache_evicts_least_recently_used():
+    cache = LocalCache[int](max_size=2, time_to_live=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_local_cache_expires_values(monkeypatch):
+    cache = LocalCache[int](max_size=2, time_to_live=60)
+    cache.set("a", 1)
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 61)
+    assert cache.get("a") is None
+
+
+def test_invalidation_evicts_keys_of_other_workers_only():
+    invalidation = LocalCacheInvalidation()
+    cache = LocalCache[int](max_size=10, time_to_live=60)
+    invalidation.register("numbers", cache)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    invalidation.handle(json.dumps({"worker_id": invalidation.worker_id, "cache": "numbers", "keys": ["a"]}))
+    assert cache.get("a") == 1
+
+    invalidation.handle(json.dumps({"worker_id": "another", "cache": "numbers", "keys": ["a"]}))
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+    invalidation.clear()
+    assert cache.get("b") is None
+
+
+def test_invalidation_skips_broken_messages():
+    invalidation = LocalCacheInvalidation()
+    cache = LocalCache[int](max_size=10, time_to_live=60)
+    invalidation.register("numbers", cache)
+    cache.set("a", 1)
+
+    for data in ("{broken", json.dumps({"cache": "numbers"}), json.dumps(["numbers"])):
+        invalidation.try_handle(data)
+    invalidation.try_handle(json.dumps({"worker_id": "another", "cache": "numbers", "keys": ["a"]}))
+    assert cache.get("a") is None
+
+
+async def test_invalidation_listens_again_after_failure(monkeypatch):
+    invalidation = LocalCacheInvalidation()
+    cache = LocalCache[int](max_size=10, time_to_live=60)
+    invalidation.register("numbers", cache)
+    cache.set("a", 1)
+    calls = []
+
+    async def listen_until_error():
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError
+        raise asyncio.CancelledError
+
+    monkeypatch.setattr(local_cache, "RESUBSCRIBE_INTERVAL", 0)
+    monkeypatch.setattr(invalidation, "_LocalCacheInvalidation__listen_until_error", listen_until_error)
+    with pytest.raises(asyncio.CancelledError):
+        await invalidation.listen()
+    assert len(calls) == 2
+    assert cache.get("a") is None
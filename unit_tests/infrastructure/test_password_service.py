@@ -0,0 +1,40 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.domain.auth.exceptions import PasswordHashingBusyError, WrongPasswordError
+from src.infrastructure.security.password_hash_pool import PasswordHashPool
+from src.infrastructure.security.password_service import PasswordService
+
+
+def test_hashed_password_keeps_number_of_iterations():
+    hashed_password = PasswordService.hash_password("password", 1000)
+    assert hashed_password.endswith(".1000")
+    assert PasswordService.check_password("password", hashed_password)
+    assert not PasswordService.check_password("another password", hashed_password)
+
+
+def test_legacy_hashed_password_is_verified():
+    hashed_password = PasswordService.hash_password("password", 100000).removesuffix(".100000")
+    assert PasswordService.check_password("password", hashed_password)
+
+
+async def test_password_service_hashes_in_pool():
+    hashed_password = await PasswordService.create_hashed_password("password")
+    await PasswordService.verify_password("password", hashed_password)
+    with pytest.raises(WrongPasswordError):
+        await PasswordService.verify_password("another password", hashed_password)
+
+
+async def test_pool_rejects_hashes_over_limit():
+    pool = PasswordHashPool(workers=1, max_pending=2)
+    is_released = threading.Event()
+    tasks = [asyncio.create_task(pool.run(is_released.wait, 5)) for _ in range(2)]
+    await asyncio.sleep(0)
+    assert pool.pending == 2
+    with pytest.raises(PasswordHashingBusyError):
+        await pool.run(is_released.wait, 5)
+    is_released.set()
+    assert await asyncio.gather(*tasks) == [True, True]
+    assert pool.pending == 0
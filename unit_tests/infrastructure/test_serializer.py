@@ -0,0 +1,46 @@
+import json
+
+import pytest
+
+from src.infrastructure.redis.serializer import CacheSerializer, JSONCodec, ORJSONCodec, default_serializer
+
+CODECS = [JSONCodec(), ORJSONCodec()]
+
+
+@pytest.mark.parametrize("codec", CODECS)
+def test_serializer_round_trip(codec):
+    serializer = CacheSerializer(codec)
+    value = {"name": "Алгоритмизация", "roles": ["ML Engineer"], "limits": None}
+    payload = serializer.dumps(value)
+    assert payload[0] == serializer.schema_version
+    assert serializer.loads(payload) == value
+
+
+def test_serializer_reads_legacy_json():
+    serializer = CacheSerializer(JSONCodec())
+    assert serializer.loads(json.dumps([{"id": "1"}])) == [{"id": "1"}]
+    assert serializer.loads(json.dumps({"id": "1"}).encode()) == {"id": "1"}
+
+
+def test_serializer_misses_another_schema_and_broken_payloads():
+    old_serializer = CacheSerializer(JSONCodec(), schema_version=1)
+    new_serializer = CacheSerializer(JSONCodec(), schema_version=2)
+    assert new_serializer.loads(old_serializer.dumps({"id": "1"})) is None
+    assert new_serializer.loads(None) is None
+    assert new_serializer.loads(b"{broken") is None
+
+
+def test_default_serializer_uses_orjson():
+    assert isinstance(default_serializer.codec, ORJSONCodec)
+
+
+def test_codecs_read_payloads_of_each_other():
+    value = {"name": "Алгоритмизация", "roles": ["ML Engineer"], "limits": None}
+    assert ORJSONCodec().loads(JSONCodec().dumps(value)) == value
+    assert JSONCodec().loads(ORJSONCodec().dumps(value)) == value
+
+
+def test_serializer_of_later_schema_misses_legacy_json():
+    serializer = CacheSerializer(JSONCodec(), schema_version=2)
+    assert serializer.loads(json.dumps([{"id": "1", "votes": []}])) is None
+    assert serializer.loads(json.dumps({"refresh_at": 0, "feedbacks": []})) is None
@@ -0,0 +1,112 @@
+import uuid
+
+from src.domain.base_value_objects import UUID
+from src.domain.courses.constants import FORMATS, IMPLEMENTERS, ROLES
+from src.domain.courses.entities import CourseEntity
+from src.domain.courses.value_objects import CourseName, CourseRun, Format, Implementer, Role, Terms
+from src.services.courses.catalog_index import CatalogIndex
+from src.domain.courses.filters import CourseFilter
+
+
+def create_course(name: str, role: str, implementer: str, format_: str, terms: str, runs: list[str]) -> CourseEntity:
+    return CourseEntity(
+        id=UUID(str(uuid.uuid4())),
+        name=CourseName(name),
+        is_draft=False,
+        implementer=Implementer(implementer),
+        format=Format(format_),
+        terms=Terms(terms),
+        roles=[Role(role)],
+        last_runs=[CourseRun(run) for run in runs],
+    )
+
+
+def create_index() -> tuple[CatalogIndex, list[CourseEntity]]:
+    courses = [
+        create_course("Java", ROLES[0], IMPLEMENTERS[0], FORMATS[0], "1, 3", ["Осень 2024"]),
+        create_course("Python", ROLES[1], IMPLEMENTERS[1], FORMATS[1], "2", ["Весна 2024"]),
+        create_course("Rust", ROLES[0], IMPLEMENTERS[1], FORMATS[0], "2, 4", ["Весна 2024", "Осень 2024"]),
+    ]
+    index = CatalogIndex()
+    index.build(courses, "v1")
+    return index, courses
+
+
+def test_filter_without_conditions_keeps_order():
+    index, courses = create_index()
+    assert index.version == "v1"
+    assert index.filter(CourseFilter(), "Осень 2024") == courses
+
+
+def test_filter_by_facets():
+    index, courses = create_index()
+    assert index.filter(CourseFilter(roles=[ROLES[0]]), "Осень 2024") == [courses[0], courses[2]]
+    assert index.filter(CourseFilter(roles=[ROLES[0]], implementers=[IMPLEMENTERS[1]]), "") == [courses[2]]
+    assert index.filter(CourseFilter(terms=["2"]), "") == [courses[1], courses[2]]
+    assert index.filter(CourseFilter(formats=[FORMATS[1]], roles=[ROLES[0]]), "") == []
+    assert index.filter(CourseFilter(only_actual=True), "Весна 2024") == [courses[1], courses[2]]
+    assert index.filter(CourseFilter(query="PY"), "") == [courses[1]]
+
+
+def test_incremental_update():
+    index, courses = create_index()
+    updated_course = create_course("Java", ROLES[1], IMPLEMENTERS[0], FORMATS[0], "1", ["Осень 2024"])
+    updated_course.id = courses[0].id
+    index.update(updated_course)
+    assert index.filter(CourseFilter(roles=[ROLES[1]]), "") == [updated_course, courses[1]]
+    assert index.filter(CourseFilter(roles=[ROLES[0]]), "") == [courses[2]]
+
+    index.remove(courses[1].id)
+    assert index.filter(CourseFilter(roles=[ROLES[1]]), "") == [updated_course]
+
+    updated_course.hide()
+    index.update(updated_course)
+    assert index.filter(CourseFilter(), "") == [courses[2]]
+
+
+def test_filter_results_are_reused_until_index_changes():
+    index, courses = create_index()
+    filters = CourseFilter(roles=[ROLES[0]])
+    assert index.filter(filters, "") == [courses[0], courses[2]]
+    assert index.filter(CourseFilter(roles=[ROLES[0], ROLES[0]]), "") == [courses[0], courses[2]]
+
+    index.remove(courses[0].id)
+    assert index.filter(filters, "") == [courses[2]]
+
+    index.build(courses, "v2")
+    assert index.filter(filters, "") == [courses[0], courses[2]]
+
+
+def test_count_facets():
+    index, courses = create_index()
+    counts = index.count_facets(CourseFilter(), "")
+    assert counts["roles"] == {ROLES[0]: 2, ROLES[1]: 1}
+    assert counts["terms"] == {"1": 1, "2": 2, "3": 1, "4": 1}
+
+    counts = index.count_facets(CourseFilter(roles=[ROLES[0]], formats=[FORMATS[0]]), "")
+    assert counts["roles"] == {ROLES[0]: 2}
+    assert counts["formats"] == {FORMATS[0]: 2}
+    assert counts["implementers"] == {IMPLEMENTERS[0]: 1, IMPLEMENTERS[1]: 1}
+
+    counts = index.count_facets(CourseFilter(only_actual=True), "Весна 2024")
+    assert counts["implementers"] == {IMPLEMENTERS[1]: 2}
+
+
+def test_count_facets_after_update():
+    index, courses = create_index()
+    assert index.count_facets(CourseFilter(), "")["roles"] == {ROLES[0]: 2, ROLES[1]: 1}
+    index.remove(courses[0].id)
+    assert index.count_facets(CourseFilter(), "")["roles"] == {ROLES[0]: 1, ROLES[1]: 1}
+
+
+def test_update_places_courses_by_name():
+    index, courses = create_index()
+    new_course = create_course("Kotlin", ROLES[0], IMPLEMENTERS[0], FORMATS[0], "1", ["Осень 2024"])
+    index.update(new_course)
+    assert index.filter(CourseFilter(), "") == [courses[0], new_course, courses[1], courses[2]]
+
+    renamed_course = create_course("Assembler", ROLES[1], IMPLEMENTERS[1], FORMATS[1], "2", ["Весна 2024"])
+    renamed_course.id = courses[2].id
+    index.update(renamed_course)
+    assert index.filter(CourseFilter(), "") == [renamed_course, courses[0], new_course, courses[1]]
+    assert index.filter(CourseFilter(roles=[ROLES[1]]), "") == [renamed_course, courses[1]]
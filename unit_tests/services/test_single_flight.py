@@ -0,0 +1,81 @@
+import asyncio
+
+import pytest
+
+from src.services.single_flight import BackgroundRefresh, SingleFlight
+
+
+async def test_concurrent_calls_are_coalesced():
+    single_flight = SingleFlight[int]()
+    calls = []
+
+    async def rebuild() -> int:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return len(calls)
+
+    results = await asyncio.gather(*[single_flight.do("key", rebuild) for _ in range(10)])
+    assert results == [1] * 10
+    assert len(calls) == 1
+    assert await single_flight.do("key", rebuild) == 2
+
+
+async def test_error_is_shared_with_waiters():
+    single_flight = SingleFlight[int]()
+
+    async def rebuild() -> int:
+        await asyncio.sleep(0.01)
+        raise ValueError
+
+    results = await asyncio.gather(*[single_flight.do("key", rebuild) for _ in range(3)], return_exceptions=True)
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+async def test_waiter_leads_after_cancelled_call():
+    single_flight = SingleFlight[str]()
+
+    async def rebuild() -> str:
+        await asyncio.sleep(0.05)
+        return "ok"
+
+    leader = asyncio.create_task(single_flight.do("key", rebuild))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(single_flight.do("key", rebuild))
+    await asyncio.sleep(0)
+    leader.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    assert await waiter == "ok"
+
+
+async def test_background_refresh_runs_once_per_key():
+    refresh = BackgroundRefresh()
+    calls = []
+
+    async def rebuild() -> None:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+
+    for _ in range(5):
+        refresh.schedule("key", rebuild)
+    await asyncio.sleep(0.05)
+    assert len(calls) == 1
+
+    refresh.schedule("key", rebuild)
+    await asyncio.sleep(0.05)
+    assert len(calls) == 2
+
+
+async def test_background_refresh_error_does_not_block_key():
+    refresh = BackgroundRefresh()
+    calls = []
+
+    async def rebuild() -> None:
+        calls.append(1)
+        raise ValueError
+
+    refresh.schedule("key", rebuild)
+    await asyncio.sleep(0.01)
+    refresh.schedule("key", rebuild)
+    await asyncio.sleep(0.01)
+    assert len(calls) == 2